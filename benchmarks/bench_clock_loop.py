@@ -0,0 +1,131 @@
+"""
+Measure wakeups per second and CPU time of a live clock loop.
+
+Each scenario runs `sage timer`/`sage stopwatch` inside a pseudo-terminal
+for a fixed duration and samples the child's CPU time and voluntary
+context switches (used as the count of wakeups) from /proc at the start
+and end of the window, so interpreter startup is not included. Where
+/proc is unavailable the totals from wait4 are reported instead.
+
+Usage:
+    python benchmarks/bench_clock_loop.py [--duration SECONDS]
+"""
+
+import argparse
+import os
+import pty
+import select
+import sys
+import tempfile
+import time
+from unittest.mock import patch
+
+
+SCENARIOS = {
+    "timer": ["timer", "1h"],
+    "timer_paused": ["timer", "1h", "--paused"],
+    "stopwatch": ["stopwatch"],
+    "stopwatch_paused": ["stopwatch", "--paused"],
+}
+
+
+def _drain(fd, seconds):
+    """
+    Read and discard terminal output from the child for the given time.
+    """
+    deadline = time.monotonic() + seconds
+    while (remaining := deadline - time.monotonic()) > 0:
+        readable, _, _ = select.select([fd], [], [], remaining)
+        if readable:
+            try:
+                os.read(fd, 65536)
+            except OSError:
+                return
+
+
+def _sample(pid):
+    """
+    Return (cpu_seconds, voluntary_context_switches) for a running
+    process, or None if /proc is unavailable.
+    """
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        with open(f"/proc/{pid}/status") as f:
+            switches = next(
+                int(line.split()[1]) for line in f
+                if line.startswith("voluntary_ctxt_switches")
+            )
+    except (OSError, StopIteration):
+        return None
+
+    ticks = os.sysconf("SC_CLK_TCK")
+    return (int(fields[11]) + int(fields[12])) / ticks, switches
+
+
+def measure(args, duration):
+    """
+    Run `sage <args>` in a pty for duration seconds and return its
+    wakeups per second and CPU usage.
+    """
+    env = dict(os.environ, TERM=os.environ.get("TERM", "xterm-256color"))
+    pid, fd = pty.fork()
+
+    if pid == 0:
+        os.execvpe(sys.executable, [sys.executable, "-m", "sage.cli.main", *args], env)
+
+    # let the interpreter start and curses initialize before measuring.
+    _drain(fd, 0.5)
+    before = _sample(pid)
+    start = time.perf_counter()
+    _drain(fd, duration)
+    after = _sample(pid)
+    elapsed = time.perf_counter() - start
+    os.write(fd, b"q")
+    _drain(fd, 0.2)
+
+    _, _, usage = os.wait4(pid, 0)
+    os.close(fd)
+
+    if before and after:
+        cpu, wakeups = after[0] - before[0], after[1] - before[1]
+    else:
+        cpu, wakeups = usage.ru_utime + usage.ru_stime, usage.ru_nvcsw
+
+    return {
+        "wakeups_per_second": wakeups / elapsed,
+        "cpu_seconds": cpu,
+        "cpu_percent": 100 * cpu / elapsed,
+    }
+
+
+def run(duration=3.0):
+    """
+    Run every scenario and return results keyed by scenario name.
+    """
+    # the clocks read presets, publish their status and save their
+    # sessions, none of which may touch the user's own files.
+    with tempfile.TemporaryDirectory() as directory:
+        env = {
+            "SAGE_CONFIG_DIR": os.path.join(directory, "config"),
+            "SAGE_STATUS_FILE": os.path.join(directory, "status"),
+            "SAGE_HISTORY_FILE": os.path.join(directory, "history"),
+        }
+        with patch.dict(os.environ, env):
+            return {name: measure(args, duration) for name, args in SCENARIOS.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--duration", type=float, default=3.0)
+    options = parser.parse_args()
+
+    for name, result in run(options.duration).items():
+        print(
+            f"{name:<18} {result['wakeups_per_second']:8.1f} wakeups/s"
+            f" {result['cpu_seconds']:8.3f}s cpu ({result['cpu_percent']:.2f}%)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Measure the parse rate of time_input_to_seconds.
+
+Compares the original three-regex parser with the single-pass parser,
+both with its LRU cache bypassed and with repeated (cached) inputs.
+
+Usage:
+    python benchmarks/bench_conversions.py [--iterations N]
+"""
+
+import argparse
+import re
+import time
+
+from sage.common.conversions import time_input_to_seconds
+
+
+INPUTS = [
+    "25m",
+    "1h 30m",
+    "3min40s",
+    "8hrs30m",
+    "17 hours 3 minutes 40 sec",
+    "10 minutes 30 seconds",
+]
+
+
+def legacy_time_input_to_seconds(time_input: str) -> int:
+    """
+    The original parser, running three uncompiled searches per call.
+    """
+
+    def extract_time_value(pattern: str) -> int:
+        match = re.search(pattern, time_input)
+        return int(match.group(1)) if match else 0
+
+    hours = extract_time_value(r"(\d+)\s*(h|hour|hours)")
+    minutes = extract_time_value(r"(\d+)\s*(m|min|minute|minutes)")
+    seconds = extract_time_value(r"(\d+)\s*(s|sec|second|seconds)")
+    return hours * 3600 + minutes * 60 + seconds
+
+
+def _parses_per_second(parse, iterations):
+    """
+    Return how many inputs parse per second.
+    """
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for time_input in INPUTS:
+            parse(time_input)
+    return iterations * len(INPUTS) / (time.perf_counter() - start)
+
+
+def run(iterations=20_000):
+    """
+    Return parses per second for each parser.
+    """
+    return {
+        "legacy_parses_per_second": _parses_per_second(legacy_time_input_to_seconds, iterations),
+        "uncached_parses_per_second": _parses_per_second(time_input_to_seconds.__wrapped__, iterations),
+        "cached_parses_per_second": _parses_per_second(time_input_to_seconds, iterations),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=20_000)
+    options = parser.parse_args()
+
+    for name, value in run(options.iterations).items():
+        print(f"{name:<28} {value:12.0f}")
+
+
+if __name__ == "__main__":
+    main()
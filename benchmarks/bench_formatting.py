@@ -0,0 +1,54 @@
+"""
+Measure the throughput of the time formatting helpers.
+
+Formats a spread of durations, from seconds to a full day, with
+time_as_clock (with and without centiseconds) and time_in_english.
+
+Usage:
+    python benchmarks/bench_formatting.py [--iterations N]
+"""
+
+import argparse
+import time
+
+from sage.common.formatting import time_as_clock, time_in_english
+
+
+SECONDS = [0, 7, 59.99, 61, 1500, 3599.5, 5400, 30_661, 86_400]
+
+
+def _calls_per_second(fn, iterations):
+    """
+    Return how many calls of fn complete per second.
+    """
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for total_seconds in SECONDS:
+            fn(total_seconds)
+    return iterations * len(SECONDS) / (time.perf_counter() - start)
+
+
+def run(iterations=20_000):
+    """
+    Return calls per second for each formatter.
+    """
+    return {
+        "time_as_clock_per_second": _calls_per_second(time_as_clock, iterations),
+        "time_as_clock_centiseconds_per_second": _calls_per_second(
+            lambda seconds: time_as_clock(seconds, include_centiseconds=True), iterations
+        ),
+        "time_in_english_per_second": _calls_per_second(time_in_english, iterations),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=20_000)
+    options = parser.parse_args()
+
+    for name, value in run(options.iterations).items():
+        print(f"{name:<40} {value:12.0f}")
+
+
+if __name__ == "__main__":
+    main()
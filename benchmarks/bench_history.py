@@ -0,0 +1,82 @@
+"""
+Measure how fast `sage stats` aggregates a large history log.
+
+A log of synthetic sessions spread over several years is written to a
+temporary file, then summarized by day, week and preset. numpy is used
+if it is installed, as it is by `sage stats`.
+
+Usage:
+    python benchmarks/bench_history.py [--records 1000000]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from sage.common import history
+
+
+PRESETS = ("pomodoro", "rest", "standup", "")
+YEARS = 3
+
+
+def write_log(path, records):
+    """
+    Write a history log of random sessions starting over the last few
+    years.
+    """
+    rng = random.Random(0)
+    now_ns = time.time_ns()
+    span_ns = YEARS * 365 * 86400 * history.NS_PER_SECOND
+
+    for name in PRESETS[:-1]:
+        history.append_session(0, 0, 0, 0, 1, name=name, path=path)
+
+    # appended in bulk rather than a session at a time, which is what's
+    # being measured.
+    with open(path, "wb") as f:
+        f.write(history.HEADER.pack(history.MAGIC, history.VERSION))
+        for _ in range(records):
+            start_ns = now_ns - rng.randrange(span_ns)
+            duration_ns = rng.randrange(60, 3600) * history.NS_PER_SECOND
+            f.write(
+                history.RECORD.pack(
+                    start_ns, start_ns + duration_ns, duration_ns, 0,
+                    rng.randrange(len(PRESETS)), rng.randrange(10), 1,
+                )
+            )
+
+
+def run(records=1_000_000):
+    """
+    Return the records summarized per second for each grouping.
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "history")
+        write_log(path, records)
+
+        for by in history.GROUPINGS:
+            start = time.perf_counter()
+            rows = history.summarize(by, path=path)
+            elapsed = time.perf_counter() - start
+
+            assert sum(sessions for _, sessions, _, _ in rows) == records
+            results[by] = {"summarize_seconds": elapsed, "records_per_second": records / elapsed}
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=1_000_000)
+    options = parser.parse_args()
+
+    for by, result in run(options.records).items():
+        print(f"{by:<8} {result['summarize_seconds']:.3f}s ({result['records_per_second']:.0f} records/s)")
+
+
+if __name__ == "__main__":
+    main()
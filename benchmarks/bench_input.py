@@ -0,0 +1,67 @@
+"""
+Measure how fast bursts of keystrokes are applied by the clock loop.
+
+A stopwatch runs against the in-memory screen, fed bursts of Enter and l
+keys with no pause between the keys of a burst, as when a key is held
+down or text is pasted. Every burst is drained and drawn in a single
+frame, so the keys processed per second measure key handling itself.
+
+Usage:
+    python benchmarks/bench_input.py [--keys 100000] [--burst 1000]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from unittest.mock import patch
+
+from sage.clocks.backend import MemoryBackend
+from sage.clocks.stopwatch import Stopwatch
+
+
+def run(keys=100_000, burst=1_000):
+    """
+    Return the keys processed per second and the frames drawn for them.
+    """
+    script = []
+    for i in range(keys):
+        script.append("l" if i % 10 == 9 else "\n")
+        if i % burst == burst - 1:
+            script.append(-1)
+    backend = MemoryBackend(keys=script)
+    stopwatch = Stopwatch()
+
+    # the stopwatch publishes its state and saves its session, which
+    # mustn't replace the status of a clock the user is running or reach
+    # their history.
+    with tempfile.TemporaryDirectory() as directory:
+        status_file = os.path.join(directory, "status")
+        history_file = os.path.join(directory, "history")
+        with patch.dict(
+            os.environ,
+            {"SAGE_STATUS_FILE": status_file, "SAGE_HISTORY_FILE": history_file},
+        ):
+            start = time.perf_counter()
+            stopwatch.load(backend=backend)
+            elapsed = time.perf_counter() - start
+
+    assert stopwatch.count + len(stopwatch.laps) == keys
+    return {
+        "keys_per_second": keys / elapsed,
+        "frames": backend.updates,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--keys", type=int, default=100_000)
+    parser.add_argument("--burst", type=int, default=1_000)
+    options = parser.parse_args()
+
+    result = run(options.keys, options.burst)
+    print(f"{result['keys_per_second']:.0f} keys/s in {result['frames']} frames")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Measure how fast a full timer lifecycle runs in simulated time.
+
+A timer runs to completion against a VirtualTime and the in-memory
+screen, so every wait jumps straight to the next deadline. The number of
+loop passes and frames is the same on every run, which makes the wall
+time a deterministic measure of the clock loop's own cost.
+
+Usage:
+    python benchmarks/bench_lifecycle.py [--hours 24]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from itertools import repeat
+from unittest.mock import patch
+
+from sage.clocks.backend import MemoryBackend
+from sage.clocks.timer import Timer
+from sage.clocks.timesource import VirtualTime
+
+
+def run(hours=24):
+    """
+    Return the wall time taken to simulate a timer of the given hours,
+    with the number of loop passes and frames drawn.
+    """
+    seconds = int(hours * 3600)
+    time_source = VirtualTime()
+    # a pass per second, plus the final pass that draws "Time's up!".
+    backend = MemoryBackend(keys=repeat(-1, seconds + 1), time_source=time_source)
+    timer = Timer(time_source)
+
+    # the timer looks up presets, publishes its state and saves its
+    # session, none of which may touch the user's own files.
+    with tempfile.TemporaryDirectory() as directory:
+        env = {
+            "SAGE_CONFIG_DIR": os.path.join(directory, "config"),
+            "SAGE_STATUS_FILE": os.path.join(directory, "status"),
+            "SAGE_HISTORY_FILE": os.path.join(directory, "history"),
+        }
+        with patch.dict(os.environ, env):
+            start = time.perf_counter()
+            timer.load(backend=backend, time_input=f"{seconds}s", quiet=True)
+            elapsed = time.perf_counter() - start
+
+    assert timer.times_up
+    return {
+        "simulated_seconds": seconds,
+        "wall_seconds": elapsed,
+        "speedup": seconds / elapsed,
+        "passes_per_second": (seconds + 1) / elapsed,
+        "frames": backend.updates,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--hours", type=float, default=24)
+    options = parser.parse_args()
+
+    result = run(options.hours)
+    print(
+        f"simulated {result['simulated_seconds']}s in {result['wall_seconds']:.3f}s"
+        f" ({result['speedup']:.0f}x, {result['passes_per_second']:.0f} passes/s,"
+        f" {result['frames']} frames)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Measure loading and saving whole presets files.
+
+Times presets.load_all from a cold cache and presets.save_all for
+presets files of increasing size.
+
+Usage:
+    python benchmarks/bench_preset_io.py [--sizes 10,1000,100000]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from sage.config import presets
+
+
+def _make_presets(count):
+    """
+    Return a presets dict with the given number of presets.
+    """
+    return {
+        f"preset{i}": {"hours": i % 24, "minutes": i % 60, "seconds": i % 60}
+        for i in range(count)
+    }
+
+
+def _best_of(fn, repeats):
+    """
+    Return the fastest of several timed calls of fn, in seconds.
+    """
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def measure(count, repeats=5):
+    """
+    Return the seconds to save and cold-load a presets file of count
+    presets.
+    """
+    data = _make_presets(count)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        presets_file = Path(tmp) / "presets.json"
+
+        with patch("sage.config.presets.get_json_file", new=lambda: presets_file):
+            save = _best_of(lambda: presets.save_all(data), repeats)
+
+            def cold_load():
+                presets._cache.clear()
+                presets.load_all()
+
+            load = _best_of(cold_load, repeats)
+            presets._cache.clear()
+
+    return {"save_seconds": save, "load_seconds": load}
+
+
+def run(sizes=(10, 1_000, 100_000)):
+    """
+    Return save and load times keyed by presets file size.
+    """
+    return {str(size): measure(size) for size in sizes}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="10,1000,100000")
+    options = parser.parse_args()
+
+    sizes = [int(size) for size in options.sizes.split(",")]
+    for size, result in run(sizes).items():
+        print(
+            f"{size:>8} presets  save {result['save_seconds'] * 1000:9.2f}ms"
+            f"  load {result['load_seconds'] * 1000:9.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
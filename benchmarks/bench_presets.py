@@ -0,0 +1,103 @@
+"""
+Measure preset lookups against a large presets file.
+
+Compares cached lookups through presets.get with the previous behaviour
+of reparsing the JSON file on every lookup, and lookups and mutations
+against the JSON and SQLite stores.
+
+Usage:
+    python benchmarks/bench_presets.py [--presets N] [--lookups N]
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from sage.config import presets
+
+
+def _write_presets(path, count):
+    """
+    Write a presets file with the given number of presets.
+    """
+    data = {
+        f"preset{i}": {"hours": 0, "minutes": i % 60, "seconds": i % 60}
+        for i in range(count)
+    }
+    path.write_text(json.dumps(data, indent=2))
+
+
+def _per_second(fn, lookups, count):
+    """
+    Return how many calls of fn complete per second.
+    """
+    start = time.perf_counter()
+    for i in range(lookups):
+        fn(f"preset{i % count}")
+    return lookups / (time.perf_counter() - start)
+
+
+def _mutations_per_second(mutations):
+    """
+    Return how many create/delete pairs complete per second.
+    """
+    start = time.perf_counter()
+    for i in range(mutations):
+        presets.create(f"bench{i}", "1m")
+        presets.delete(f"bench{i}")
+    return mutations / (time.perf_counter() - start)
+
+
+def run(count=10_000, lookups=1_000, mutations=20):
+    """
+    Return lookups and mutations per second for each preset store.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        presets_file = Path(tmp) / "presets.json"
+        _write_presets(presets_file, count)
+
+        with patch("sage.config.presets.get_json_file", new=lambda: presets_file):
+            def uncached(name):
+                presets._cache.clear()
+                return presets.get(name)
+
+            result = {
+                "presets": count,
+                "uncached_lookups_per_second": _per_second(uncached, lookups, count),
+                "cached_lookups_per_second": _per_second(presets.get, lookups, count),
+                "json_mutations_per_second": _mutations_per_second(mutations),
+            }
+
+            os.environ["SAGE_PRESET_STORE"] = "sqlite"
+            try:
+                presets.get("preset0")
+                result["sqlite_lookups_per_second"] = _per_second(presets.get, lookups, count)
+                result["sqlite_mutations_per_second"] = _mutations_per_second(mutations)
+            finally:
+                del os.environ["SAGE_PRESET_STORE"]
+
+            return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--presets", type=int, default=10_000)
+    parser.add_argument("--lookups", type=int, default=1_000)
+    parser.add_argument("--mutations", type=int, default=20)
+    options = parser.parse_args()
+
+    result = run(options.presets, options.lookups, options.mutations)
+    print(f"presets:          {result['presets']}")
+    print(f"json uncached:    {result['uncached_lookups_per_second']:12.0f} lookups/s")
+    print(f"json cached:      {result['cached_lookups_per_second']:12.0f} lookups/s")
+    print(f"sqlite:           {result['sqlite_lookups_per_second']:12.0f} lookups/s")
+    print(f"json mutations:   {result['json_mutations_per_second']:12.1f} create+delete/s")
+    print(f"sqlite mutations: {result['sqlite_mutations_per_second']:12.1f} create+delete/s")
+
+
+if __name__ == "__main__":
+    main()
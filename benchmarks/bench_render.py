@@ -0,0 +1,133 @@
+"""
+Measure the per-frame cost of ClockRenderer against an in-memory screen.
+
+The renderer draws to a MemoryBackend instead of the terminal so only
+its own work is measured: diffing regions, emitting changed cells into
+the cell grid and flushing dirty windows. Three frames are measured: a
+stopwatch frame where the centiseconds change, an idle frame where
+nothing changes, and a full redraw after a resize. The whole stopwatch
+loop, including key handling and scheduling, is then run headless with
+waits that return immediately.
+
+Usage:
+    python benchmarks/bench_render.py [--frames N]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from unittest.mock import patch
+
+from sage.clocks.backend import MemoryBackend
+from sage.clocks.renderer import ClockRenderer
+from sage.clocks.stopwatch import Stopwatch
+from sage.common.formatting import time_as_clock
+
+
+def _frames_per_second(renderer, frame, frames):
+    """
+    Return how many frames render and flush per second, with the cells
+    and bytes written per frame.
+    """
+    # draw one frame first so that changes left by the previous kind of
+    # frame aren't counted.
+    frame(0)
+    renderer.flush()
+
+    renderer.reset_write_stats()
+    start = time.perf_counter()
+    for i in range(frames):
+        frame(i)
+        renderer.flush()
+    elapsed = time.perf_counter() - start
+
+    stats = renderer.write_stats()
+    return {
+        "frames_per_second": frames / elapsed,
+        "frame_us": elapsed / frames * 1_000_000,
+        "cells_per_frame": stats["cells"] / frames,
+        "bytes_per_frame": stats["bytes"] / frames,
+    }
+
+
+def _headless_loop(iterations):
+    """
+    Return how many passes of the stopwatch loop run per second against
+    the memory backend, and the share of them that drew a frame.
+    """
+    backend = MemoryBackend(keys=[-1] * iterations)
+
+    # the stopwatch publishes its state and saves its session, which
+    # mustn't replace the status of a clock the user is running or reach
+    # their history.
+    with tempfile.TemporaryDirectory() as directory:
+        status_file = os.path.join(directory, "status")
+        history_file = os.path.join(directory, "history")
+        with patch.dict(
+            os.environ,
+            {"SAGE_STATUS_FILE": status_file, "SAGE_HISTORY_FILE": history_file},
+        ):
+            start = time.perf_counter()
+            Stopwatch().load(backend=backend)
+            elapsed = time.perf_counter() - start
+
+    return {
+        "iterations_per_second": iterations / elapsed,
+        "iteration_us": elapsed / iterations * 1_000_000,
+        "frames_per_iteration": backend.updates / iterations,
+    }
+
+
+def run(frames=20_000):
+    """
+    Return per-frame costs for each kind of frame, and for the headless
+    stopwatch loop.
+    """
+    renderer = ClockRenderer(MemoryBackend())
+    renderer.initialize_curses_window()
+    renderer.render_base_features()
+
+    def stopwatch_frame(i):
+        renderer.render_clock(time_as_clock(i / 100, include_centiseconds=True))
+
+    def idle_frame(i):
+        renderer.render_clock("00:25:00")
+
+    def resize_frame(i):
+        renderer.initialize_curses_window()
+        renderer.render_base_features()
+        renderer.render_clock("00:25:00")
+        renderer.render_counter(i)
+
+    return {
+        "stopwatch": _frames_per_second(renderer, stopwatch_frame, frames),
+        "idle": _frames_per_second(renderer, idle_frame, frames),
+        "resize": _frames_per_second(renderer, resize_frame, max(frames // 10, 1)),
+        "loop": _headless_loop(frames),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--frames", type=int, default=20_000)
+    options = parser.parse_args()
+
+    results = run(options.frames)
+    loop = results.pop("loop")
+    for name, result in results.items():
+        print(
+            f"{name:<10} {result['frames_per_second']:10.0f} frames/s"
+            f" {result['frame_us']:8.2f}us/frame"
+            f" {result['cells_per_frame']:6.1f} cells"
+            f" {result['bytes_per_frame']:6.1f} bytes"
+        )
+    print(
+        f"{'loop':<10} {loop['iterations_per_second']:10.0f} passes/s"
+        f" {loop['iteration_us']:8.2f}us/pass"
+        f" {loop['frames_per_iteration']:6.2f} frames/pass"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Measure cold start time of sage commands.
+
+Each command is run repeatedly in a fresh interpreter and the mean and
+best wall times are reported. For the commands with an import budget,
+the best time spent importing modules from the first sage import
+onwards is also reported, from -X importtime.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs N]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from sage.common.status import KIND_TIMER, StatusWriter
+
+
+COMMANDS = {
+    "version": ["--version"],
+    "list": ["list"],
+    "timer_test": ["timer", "25m", "--test"],
+}
+
+# commands whose imports are measured. Importing every subcommand
+# eagerly took around 130ms for `sage list`, and the lazy group around
+# 90ms. `sage status` runs on every shell prompt, and around 80ms of its
+# imports is click.
+IMPORT_COMMANDS = {
+    "list": ["list"],
+    "status": ["status"],
+}
+
+
+def measure(args, runs, env):
+    """
+    Return the mean and best wall time in seconds of `sage <args>`.
+    """
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "sage.cli.main", *args],
+            stdout=subprocess.DEVNULL,
+            check=True,
+            env=env,
+        )
+        times.append(time.perf_counter() - start)
+    return {"mean_seconds": sum(times) / runs, "best_seconds": min(times)}
+
+
+def measure_imports(args, runs, env):
+    """
+    Return the best time in microseconds `sage <args>` spent in the
+    top-level imports from the first sage import onwards.
+    """
+    env = dict(env, PYTHONPROFILEIMPORTTIME="1")
+    best = None
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-m", "sage.cli.main", *args],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=True,
+            env=env,
+        )
+        import_us = sage_import_us(result.stderr)
+        best = import_us if best is None else min(best, import_us)
+    return best
+
+
+def sage_import_us(importtime_output):
+    """
+    Sum the cumulative times of the top-level imports in -X importtime
+    output, from the first sage import onwards.
+    """
+    total = 0
+    started = False
+    for line in importtime_output.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        started = started or name.strip() == "sage"
+        if started and not name.startswith("  "):
+            total += int(cumulative)
+    return total
+
+
+def run(runs=10):
+    """
+    Return start times keyed by command.
+    """
+    with tempfile.TemporaryDirectory() as home:
+        env = dict(os.environ, SAGE_CONFIG_DIR=home)
+        results = {name: measure(args, runs, env) for name, args in COMMANDS.items()}
+
+        # `sage status` exits with status 1 unless a clock is running.
+        status_file = os.path.join(home, "status")
+        writer = StatusWriter(status_file)
+        writer.publish(KIND_TIMER, False, 0, 0, 0, total_seconds=60)
+        env.update(SAGE_STATUS_FILE=status_file, XDG_RUNTIME_DIR=home)
+
+        try:
+            for name, args in IMPORT_COMMANDS.items():
+                results.setdefault(name, {})["import_us"] = measure_imports(args, runs, env)
+        finally:
+            writer.close()
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10)
+    options = parser.parse_args()
+
+    for name, result in run(options.runs).items():
+        line = f"{name:<12}"
+        if "mean_seconds" in result:
+            line += (
+                f" mean {result['mean_seconds'] * 1000:7.1f}ms"
+                f"  best {result['best_seconds'] * 1000:7.1f}ms"
+            )
+        if "import_us" in result:
+            line += f"  imports {result['import_us'] / 1000:7.1f}ms"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Compare the timing wheel with a binary heap for many concurrent timers.
+
+For each size, schedules that many timers with random durations of up
+to 24 hours, cancels a tenth of them, then steps time forward once per
+second until every timer has expired. The heap cancels lazily, skipping
+cancelled entries as they are popped, which is how heap schedulers like
+the daemon's handle removal.
+
+Usage:
+    python benchmarks/bench_wheel.py [--sizes 10000,100000,1000000]
+"""
+
+import argparse
+import heapq
+import random
+import time
+
+from sage.clocks.scheduler import NS_PER_SECOND
+from sage.clocks.wheel import TimingWheel
+
+HORIZON_SECONDS = 86_400
+
+
+def _durations(count, seed=0):
+    """
+    Return random timer durations in nanoseconds.
+    """
+    rng = random.Random(seed)
+    return [rng.randrange(1, HORIZON_SECONDS * NS_PER_SECOND) for _ in range(count)]
+
+
+def _run_wheel(durations):
+    """
+    Return the seconds spent inserting, cancelling and expiring timers
+    on a timing wheel.
+    """
+    wheel = TimingWheel()
+
+    start = time.perf_counter()
+    timers = [wheel.schedule(0, duration) for duration in durations]
+    inserted = time.perf_counter()
+
+    for timer in timers[::10]:
+        wheel.cancel(timer)
+    cancelled = time.perf_counter()
+
+    expired = 0
+    for second in range(1, HORIZON_SECONDS + 1):
+        expired += len(wheel.advance(second * NS_PER_SECOND))
+    finished = time.perf_counter()
+
+    assert expired == len(durations) - len(timers[::10])
+    return inserted - start, cancelled - inserted, finished - cancelled
+
+
+def _run_heap(durations):
+    """
+    Return the seconds spent inserting, cancelling and expiring timers
+    on a binary heap with lazy cancellation.
+    """
+    heap = []
+    cancelled_ids = set()
+
+    start = time.perf_counter()
+    for timer_id, duration in enumerate(durations):
+        heapq.heappush(heap, (duration, timer_id))
+    inserted = time.perf_counter()
+
+    for timer_id in range(0, len(durations), 10):
+        cancelled_ids.add(timer_id)
+    cancelled = time.perf_counter()
+
+    expired = 0
+    for second in range(1, HORIZON_SECONDS + 1):
+        now = second * NS_PER_SECOND
+        while heap and heap[0][0] <= now:
+            _, timer_id = heapq.heappop(heap)
+            if timer_id not in cancelled_ids:
+                expired += 1
+    finished = time.perf_counter()
+
+    assert expired == len(durations) - len(cancelled_ids)
+    return inserted - start, cancelled - inserted, finished - cancelled
+
+
+def run(sizes=(10_000, 100_000, 1_000_000)):
+    """
+    Return insert, cancel and expiry rates for the wheel and heap at
+    each size.
+    """
+    results = []
+    for size in sizes:
+        durations = _durations(size)
+        for name, runner in (("wheel", _run_wheel), ("heap", _run_heap)):
+            insert, cancel, expire = runner(durations)
+            results.append({
+                "scheduler": name,
+                "timers": size,
+                "inserts_per_second": size / insert,
+                "cancels_per_second": (size // 10) / cancel if cancel else float("inf"),
+                "expire_seconds": expire,
+            })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    options = parser.parse_args()
+
+    sizes = [int(size) for size in options.sizes.split(",")]
+    print(f"{'scheduler':<10}{'timers':>10}{'inserts/s':>14}{'cancels/s':>14}{'expire all':>12}")
+    for result in run(sizes):
+        print(
+            f"{result['scheduler']:<10}{result['timers']:>10}"
+            f"{result['inserts_per_second']:>14.0f}"
+            f"{result['cancels_per_second']:>14.0f}"
+            f"{result['expire_seconds']:>11.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+Run every benchmark and store the results as JSON.
+
+Results are flattened into dotted metric names, e.g.
+"render.idle.frame_us", and written along with the Python version,
+platform and git commit so runs can be compared. Each run is checked
+against the bounds in thresholds.json, and optionally against a
+baseline results file, flagging any metric that regressed by more than
+the tolerance. Exits with status 1 if anything was flagged.
+
+Usage:
+    python benchmarks/run_suite.py [--quick] [--output FILE]
+                                   [--baseline FILE] [--tolerance 0.25]
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import bench_clock_loop
+import bench_conversions
+import bench_formatting
+import bench_history
+import bench_input
+import bench_lifecycle
+import bench_preset_io
+import bench_render
+import bench_startup
+
+
+BENCHMARKS_DIR = Path(__file__).parent
+THRESHOLDS_FILE = BENCHMARKS_DIR / "thresholds.json"
+
+# arguments for each benchmark's run(), full and --quick.
+SUITE = {
+    "formatting": (bench_formatting.run, {"iterations": 20_000}, {"iterations": 2_000}),
+    "conversions": (bench_conversions.run, {"iterations": 20_000}, {"iterations": 2_000}),
+    "preset_io": (bench_preset_io.run, {"sizes": (10, 1_000, 100_000)}, {"sizes": (10, 1_000)}),
+    "render": (bench_render.run, {"frames": 20_000}, {"frames": 2_000}),
+    "lifecycle": (bench_lifecycle.run, {"hours": 24}, {"hours": 1}),
+    "input": (bench_input.run, {"keys": 100_000}, {"keys": 20_000}),
+    "history": (bench_history.run, {"records": 1_000_000}, {"records": 100_000}),
+    "clock_loop": (bench_clock_loop.run, {"duration": 3.0}, {"duration": 1.0}),
+    "startup": (bench_startup.run, {"runs": 10}, {"runs": 3}),
+}
+
+# metrics where a lower value is better, matched on the end of the name.
+LOWER_IS_BETTER = ("_seconds", "_us", "_percent", "wakeups_per_second", "_per_frame")
+
+
+def flatten(results, prefix=""):
+    """
+    Flatten nested results into a dict of dotted metric names.
+    """
+    metrics = {}
+    for key, value in results.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            metrics.update(flatten(value, f"{name}."))
+        else:
+            metrics[name] = value
+    return metrics
+
+
+def lower_is_better(name):
+    """
+    Return whether a smaller value of the metric is an improvement.
+    """
+    return name.endswith(LOWER_IS_BETTER)
+
+
+def check_thresholds(metrics, thresholds):
+    """
+    Return a message for each metric outside its "min"/"max" bounds.
+    """
+    failures = []
+    for name, bounds in thresholds.items():
+        if name not in metrics:
+            continue
+        value = metrics[name]
+        if "min" in bounds and value < bounds["min"]:
+            failures.append(f"{name} = {value:.4g}, below the minimum of {bounds['min']}")
+        if "max" in bounds and value > bounds["max"]:
+            failures.append(f"{name} = {value:.4g}, above the maximum of {bounds['max']}")
+    return failures
+
+
+def check_baseline(metrics, baseline, tolerance):
+    """
+    Return a message for each metric that regressed from the baseline by
+    more than the tolerance, as a fraction of the baseline value.
+    """
+    failures = []
+    for name, value in metrics.items():
+        old = baseline.get(name)
+        if not old:
+            continue
+        change = (value - old) / abs(old)
+        regression = change if lower_is_better(name) else -change
+        if regression > tolerance:
+            failures.append(f"{name} = {value:.4g}, {regression:.0%} worse than {old:.4g}")
+    return failures
+
+
+def git_commit():
+    """
+    Return the current git commit, or None outside a git checkout.
+    """
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True, text=True, cwd=BENCHMARKS_DIR, timeout=5,
+        )
+    except OSError:
+        return None
+    return result.stdout.strip() or None
+
+
+def run(quick=False, only=None):
+    """
+    Run the suite and return its metrics with metadata about the run.
+    """
+    results = {}
+    for name, (runner, full, fast) in SUITE.items():
+        if only and name not in only:
+            continue
+        results[name] = runner(**(fast if quick else full))
+
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "quick": quick,
+        "metrics": flatten(results),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--quick", action="store_true", help="Run smaller workloads.")
+    parser.add_argument("--only", help="Comma separated benchmarks to run.")
+    parser.add_argument("--output", type=Path, help="Write results to this JSON file.")
+    parser.add_argument("--baseline", type=Path, help="Compare against this results file.")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--thresholds", type=Path, default=THRESHOLDS_FILE)
+    options = parser.parse_args()
+
+    only = set(options.only.split(",")) if options.only else None
+    report = run(options.quick, only)
+    metrics = report["metrics"]
+
+    for name, value in metrics.items():
+        print(f"{name:<56} {value:14.4f}")
+
+    if options.output:
+        options.output.write_text(json.dumps(report, indent=2) + "\n")
+
+    failures = check_thresholds(metrics, json.loads(options.thresholds.read_text()))
+    if options.baseline:
+        baseline = json.loads(options.baseline.read_text())["metrics"]
+        failures += check_baseline(metrics, baseline, options.tolerance)
+
+    for failure in failures:
+        print(f"REGRESSION: {failure}", file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
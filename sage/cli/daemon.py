@@ -0,0 +1,150 @@
+"""Sage daemon command."""
+
+import click
+
+from sage.common.formatting import time_as_clock
+from sage.daemon import client
+from sage.daemon.protocol import DaemonError, get_socket_path
+
+
+def format_job(job: dict, width: int = 0) -> str:
+    """
+    Format a job's state as a single line.
+    """
+    return (
+        f"{job['id']:>4}  {job['kind']:<9}  {job['label']:<{width}}  "
+        f"{time_as_clock(job['seconds'])}  {job['state']}"
+    )
+
+
+def send(command: str, **arguments) -> dict:
+    """
+    Send a request to the daemon, reporting failures as click errors.
+    """
+    try:
+        return client.request(command, **arguments)
+    except DaemonError as e:
+        raise click.ClickException(str(e))
+
+
+@click.group(invoke_without_command=True, short_help="Run timers in the background")
+@click.pass_context
+def daemon(ctx):
+    """
+    Run the sage daemon, which keeps timers and stopwatches running in
+    the background after their terminal is closed. With a subcommand,
+    control the timers of an already running daemon.
+
+    \b
+    Examples:
+        sage daemon &
+        sage daemon start pomodoro
+        sage daemon list
+        sage daemon attach 1
+    """
+    if ctx.invoked_subcommand is not None:
+        return
+
+    import signal
+
+    from sage.daemon.server import Daemon
+
+    # exit through the same cleanup as Ctrl-C when asked to terminate.
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    try:
+        Daemon(get_socket_path()).serve()
+    except DaemonError as e:
+        raise click.ClickException(str(e))
+    except KeyboardInterrupt:
+        pass
+
+
+@daemon.command(short_help="Start a background timer")
+@click.argument("time_input", required=True)
+@click.option("--paused", is_flag=True, help="Start timer in a paused state.")
+@click.option("--quiet", is_flag=True, help="Timer will complete silently.")
+def start(time_input, paused, quiet):
+    """
+    Start a timer in the daemon and print its id.
+    """
+    response = send("start", input=time_input, paused=paused, quiet=quiet)
+    click.echo(response["job"]["id"])
+
+
+@daemon.command(short_help="Start a background stopwatch")
+@click.argument("label", required=False)
+@click.option("--paused", is_flag=True, help="Start stopwatch in a paused state.")
+def stopwatch(label, paused):
+    """
+    Start a stopwatch in the daemon and print its id.
+    """
+    response = send("stopwatch", label=label, paused=paused)
+    click.echo(response["job"]["id"])
+
+
+@daemon.command(short_help="Pause a background timer")
+@click.argument("job_id", type=int)
+def pause(job_id):
+    """
+    Pause a timer or stopwatch.
+    """
+    click.echo(format_job(send("pause", id=job_id)["job"]))
+
+
+@daemon.command(short_help="Resume a background timer")
+@click.argument("job_id", type=int)
+def resume(job_id):
+    """
+    Resume a paused timer or stopwatch.
+    """
+    click.echo(format_job(send("resume", id=job_id)["job"]))
+
+
+@daemon.command(short_help="Cancel a background timer")
+@click.argument("job_id", type=int)
+def cancel(job_id):
+    """
+    Cancel a timer or stopwatch and remove it from the daemon.
+    """
+    click.echo(format_job(send("cancel", id=job_id)["job"]))
+
+
+@daemon.command("list", short_help="List background timers")
+def list_jobs():
+    """
+    List every timer and stopwatch in the daemon.
+    """
+    jobs = send("list")["jobs"]
+
+    if not jobs:
+        click.echo("No background timers")
+        return
+
+    width = max(len(job["label"]) for job in jobs)
+    for job in jobs:
+        click.echo(format_job(job, width))
+
+
+@daemon.command(short_help="Follow a background timer")
+@click.argument("job_id", type=int)
+def attach(job_id):
+    """
+    Print a timer or stopwatch's state each time it changes, until it
+    completes or is cancelled.
+    """
+    try:
+        for job in client.attach(job_id):
+            click.echo(format_job(job))
+    except DaemonError as e:
+        raise click.ClickException(str(e))
+    except KeyboardInterrupt:
+        pass
+
+
+@daemon.command(short_help="Stop the daemon")
+def stop():
+    """
+    Stop the daemon, discarding its timers.
+    """
+    send("shutdown")
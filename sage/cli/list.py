@@ -16,14 +16,12 @@ def list():
     Example:
         sage list
     """
-    all_presets = presets.load_all()
+    max_width = presets.max_name_length()
 
-    if not all_presets:
+    if not max_width:
         click.echo("No saved timers")
         return
 
-    max_width = max(len(name) for name in all_presets.keys())
-
-    for timer, duration in sorted(all_presets.items()):
+    for timer, duration in presets.iter_sorted():
         total_seconds = hms_to_seconds(**duration)
         click.echo(f"{timer:<{max_width + 2}} {time_in_english(total_seconds)}")
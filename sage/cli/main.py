@@ -1,29 +1,60 @@
 """Sage base CLI command."""
 
+import importlib
+
 import click
 
-from sage.cli.create import create
-from sage.cli.delete import delete
-from sage.cli.list import list
-from sage.cli.rename import rename
-from sage.cli.stopwatch import stopwatch
-from sage.cli.timer import timer
-from sage.cli.update import update
 
+class LazyGroup(click.Group):
+    """
+    A click group that imports a subcommand's module only when that
+    subcommand is resolved, so running one command doesn't pay for
+    importing every other command (and curses, nava, etc.) at startup.
+
+    Subcommands are given as a mapping of command name to the import
+    path of the command object, e.g. "sage.cli.list.list".
+    """
+
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        """
+        List eager and lazy subcommand names without importing them.
+        """
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
 
-@click.group()
+    def get_command(self, ctx, cmd_name):
+        """
+        Import and return a lazy subcommand, or fall back to the eager
+        subcommands.
+        """
+        if cmd_name in self.lazy_subcommands:
+            module_name, command_name = self.lazy_subcommands[cmd_name].rsplit(".", 1)
+            return getattr(importlib.import_module(module_name), command_name)
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "create": "sage.cli.create.create",
+        "daemon": "sage.cli.daemon.daemon",
+        "delete": "sage.cli.delete.delete",
+        "list": "sage.cli.list.list",
+        "rename": "sage.cli.rename.rename",
+        "stats": "sage.cli.stats.stats",
+        "status": "sage.cli.status.status",
+        "stopwatch": "sage.cli.stopwatch.stopwatch",
+        "timer": "sage.cli.timer.timer",
+        "update": "sage.cli.update.update",
+    },
+)
 @click.version_option(package_name="sage-timer")
 def sage():
     pass
 
-sage.add_command(create)
-sage.add_command(delete)
-sage.add_command(list)
-sage.add_command(rename)
-sage.add_command(stopwatch)
-sage.add_command(timer)
-sage.add_command(update)
-
 
 if __name__ == "__main__":
     sage()
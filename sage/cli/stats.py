@@ -0,0 +1,45 @@
+"""Sage stats command."""
+
+import click
+
+from sage.common import history
+from sage.common.formatting import time_in_english
+
+
+@click.command(short_help="Show time spent in clocks")
+@click.option(
+    "--by",
+    type=click.Choice(history.GROUPINGS),
+    default="day",
+    show_default=True,
+    help="Group sessions by day, week or preset.",
+)
+def stats(by):
+    """
+    Show how many timer and stopwatch sessions were completed and the
+    time spent in them, excluding pauses, from the history saved each
+    time a clock exits.
+
+    \b
+    Examples:
+        sage stats
+        sage stats --by week
+        sage stats --by preset
+    """
+    try:
+        rows = history.summarize(by)
+    except (OSError, ValueError) as e:
+        raise click.ClickException(str(e))
+
+    if not rows:
+        click.echo("No clock history")
+        return
+
+    width = max(len(label) for label, *_ in rows)
+    for label, sessions, duration_ns, count in rows:
+        line = f"{label:<{width + 2}} {sessions} session{'' if sessions == 1 else 's'}"
+        line += f"  {time_in_english(duration_ns // history.NS_PER_SECOND)}"
+        if count:
+            line += f"  counter {count}"
+        click.echo(line)
+
@@ -0,0 +1,28 @@
+"""Sage status command."""
+
+import sys
+
+import click
+
+from sage.common.status import read_status
+
+
+@click.command(short_help="Show the running clock")
+@click.option("--count", is_flag=True, help="Show the counter instead of the time.")
+def status(count):
+    """
+    Print the time of the running timer or stopwatch, for use in shell
+    prompts and status bars. Prints nothing and exits with status 1 if
+    no clock is running.
+
+    \b
+    Examples:
+        sage status
+        sage status --count
+    """
+    running = read_status()
+
+    if running is None:
+        sys.exit(1)
+
+    click.echo(running.count if count else running.display())
@@ -2,18 +2,74 @@
 
 import click
 
+from sage.clocks.laps import get_export_format
 from sage.clocks.stopwatch import Stopwatch
+from sage.clocks.stream import ClockStream
 
 
 @click.command(short_help="Start a stopwatch")
 @click.option("--paused", is_flag=True, help="Start stopwatch in a paused state.")
-def stopwatch(**kwargs):
+@click.option("--stream", is_flag=True, help="Print the time to stdout each second instead of opening the clock.")
+@click.option("--json", "json_lines", is_flag=True, help="With --stream, print each change as a line of JSON.")
+@click.option("--perf", is_flag=True, help="Show frame rate, wakeups, tick lateness and CPU usage.")
+@click.option("--count-log", type=click.Path(dir_okay=False), help="Save the time of each counter increment to a file on exit.")
+@click.option("--laps", "laps_file", type=click.Path(dir_okay=False, writable=True), help="Save laps to a .csv or .ndjson file on exit.")
+@click.option("--tick-stats", is_flag=True, hidden=True)
+def stopwatch(tick_stats, stream, json_lines, perf, laps_file, count_log, **kwargs):
     """
     Start a stopwatch with centisecond precision.
 
     \b
     Example:
         sage stopwatch
+        sage stopwatch --stream
+        sage stopwatch --laps laps.csv
     """
+    if stream or json_lines:
+        unsupported = {"paused": kwargs.get("paused"), "perf": perf, "count_log": count_log, "laps": laps_file}
+        for name, value in unsupported.items():
+            if value:
+                option = "--" + name.replace("_", "-")
+                raise click.BadOptionUsage(name, f"{option} can't be used with --stream.")
+
+        try:
+            ClockStream(Stopwatch(), json_lines=json_lines).run()
+        except KeyboardInterrupt:
+            pass
+        return
+
+    if laps_file:
+        try:
+            get_export_format(laps_file)
+        except ValueError as e:
+            raise click.BadParameter(str(e), param_hint="--laps")
+
     stopwatch = Stopwatch()
-    stopwatch.load(**kwargs)
+    try:
+        stopwatch.load(perf=perf, count_log=count_log, **kwargs)
+    except BaseException:
+        # laps are saved even if the stopwatch is interrupted, and a
+        # failure to save them is shown without hiding the interruption.
+        if laps_file:
+            try:
+                save_laps(stopwatch.laps, laps_file)
+            except click.ClickException as e:
+                e.show()
+        raise
+
+    if laps_file:
+        save_laps(stopwatch.laps, laps_file)
+
+    if tick_stats:
+        click.echo(stopwatch.scheduler.histogram.format(), err=True)
+
+
+def save_laps(laps, laps_file):
+    """
+    Save laps to a file, raising a ClickException if it can't be
+    written.
+    """
+    try:
+        laps.export(laps_file)
+    except OSError as e:
+        raise click.ClickException(f"Couldn't save laps to {laps_file}: {e.strerror}")
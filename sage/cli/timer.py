@@ -2,20 +2,32 @@
 
 import click
 
+from sage.clocks.dashboard import Dashboard
+from sage.clocks.stream import ClockStream
 from sage.clocks.timer import Timer
+from sage.common.conversions import time_input_to_seconds
+from sage.config import presets
 
 
 @click.command(short_help="Start a timer")
-@click.argument("time_input", required=True)
+@click.argument("time_inputs", nargs=-1, required=True)
 @click.option("--paused", is_flag=True, help="Start timer in a paused state.")
 @click.option("--quiet", is_flag=True, help="Timer will complete silently.")
+@click.option("--stream", is_flag=True, help="Print the time to stdout on each change instead of opening the clock.")
+@click.option("--json", "json_lines", is_flag=True, help="With --stream, print each change as a line of JSON.")
+@click.option("--perf", is_flag=True, help="Show frame rate, wakeups, tick lateness and CPU usage.")
+@click.option("--count-log", type=click.Path(dir_okay=False), help="Save the time of each counter increment to a file on exit.")
 @click.option("--test", is_flag=True, hidden=True)
-def timer(test, **kwargs):
+@click.option("--tick-stats", is_flag=True, hidden=True)
+def timer(time_inputs, test, tick_stats, stream, json_lines, perf, count_log, **kwargs):
     """
     Start a timer with flexible time input. Accepts human-readable
     formats like "25m", "1h 30m", or "45 seconds". You can also use
     custom timer names like "pomodoro" or "rest".
 
+    Passing more than one time input runs every timer at once on a
+    single dashboard, unless together they read as one duration.
+
     \b
     Examples:
         sage timer pomodoro
@@ -23,16 +35,80 @@ def timer(test, **kwargs):
         sage timer 3m
         sage timer "1 min 30s"
         sage timer 8hrs30m
+        sage timer pomodoro 10m "1h 30m"
+        sage timer 25m --stream
     """
+    time_inputs = join_time_inputs(time_inputs)
+
+    if stream or json_lines:
+        stream_timer(time_inputs, json_lines, perf=perf, count_log=count_log, test=test, **kwargs)
+        return
+
     try:
-        timer = Timer()
+        if len(time_inputs) > 1:
+            timer = Dashboard()
+
+            if test:
+                timer.print_durations(time_inputs)
+                return
+
+            timer.load(time_inputs=time_inputs, perf=perf, count_log=count_log, **kwargs)
+        else:
+            timer = Timer()
+
+            if test:
+                timer.print_duration(time_inputs[0])
+                return
+
+            timer.load(time_input=time_inputs[0], perf=perf, count_log=count_log, **kwargs)
+
+        if tick_stats:
+            click.echo(timer.scheduler.histogram.format(), err=True)
+            if timer.sound and timer.sound.latency_ns is not None:
+                click.echo(f"sound latency: {timer.sound.latency_ns / 1000:.1f}us", err=True)
+
+    except ValueError as e:
+        raise click.BadArgumentUsage(str(e))
+
+
+def join_time_inputs(time_inputs):
+    """
+    Join the time inputs into a single timer if together they read as
+    one duration, as when `sage timer 1h 30m` or `sage timer 5 minutes`
+    is run unquoted. Otherwise each input is a separate timer and must
+    be a duration or preset on its own.
+    """
+    if len(time_inputs) == 1:
+        return time_inputs
 
-        if test:
-            time_input = kwargs.get("time_input", "")
-            timer.print_duration(time_input)
-            return
+    joined = " ".join(time_inputs)
+    if time_input_to_seconds(joined):
+        return (joined,)
 
-        timer.load(**kwargs)
+    for time_input in time_inputs:
+        if not presets.get(time_input) and not time_input_to_seconds(time_input):
+            raise click.UsageError(
+                f"'{time_input}' is not a duration or preset. Quote durations "
+                f'containing spaces, e.g. sage timer "5 minutes".'
+            )
+    return time_inputs
 
+
+def stream_timer(time_inputs, json_lines, quiet, **unsupported):
+    """
+    Stream a single timer to stdout without opening the clock. Options
+    that only apply to the clock, like --paused, are rejected.
+    """
+    if len(time_inputs) > 1:
+        raise click.BadArgumentUsage("--stream only supports a single timer.")
+    for name, value in unsupported.items():
+        if value:
+            option = "--" + name.replace("_", "-")
+            raise click.BadOptionUsage(name, f"{option} can't be used with --stream.")
+
+    try:
+        ClockStream(Timer(), json_lines=json_lines).run(time_input=time_inputs[0], quiet=quiet)
     except ValueError as e:
         raise click.BadArgumentUsage(str(e))
+    except KeyboardInterrupt:
+        pass
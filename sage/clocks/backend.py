@@ -0,0 +1,212 @@
+"""Sage screen backends."""
+
+import curses
+import select
+import sys
+
+
+class CursesBackend:
+    """
+    Draws to the terminal with curses and reads keys from stdin.
+
+    This is the interface ClockRenderer and Clock use for all screen and
+    input access: screen size, one-row windows to draw in, colors,
+    batching window updates into a single terminal update, reading keys
+    and waiting for input. MemoryBackend implements the same interface
+    without a terminal.
+    """
+
+    KEY_ENTER = curses.KEY_ENTER
+
+    def __init__(self, stdscr):
+        self.stdscr = stdscr
+
+    def setup_colors(self):
+        """
+        Initialize curses color pairs.
+        """
+        curses.start_color()
+        curses.init_pair(1, curses.COLOR_WHITE, curses.COLOR_BLACK)
+        curses.init_pair(2, curses.COLOR_GREEN, curses.COLOR_BLACK)
+        curses.init_pair(3, curses.COLOR_BLUE, curses.COLOR_BLACK)
+        curses.init_pair(4, curses.COLOR_YELLOW, curses.COLOR_BLACK)
+
+    def color(self, pair: int) -> int:
+        """
+        Return the attribute for a color pair.
+        """
+        return curses.color_pair(pair)
+
+    def size(self) -> tuple[int, int]:
+        """
+        Return the screen size as (rows, cols).
+        """
+        return self.stdscr.getmaxyx()
+
+    def window(self, y: int, cols: int):
+        """
+        Create a one-row window at row y, sharing the screen's buffer.
+        """
+        return self.stdscr.derwin(1, cols, y, 0)
+
+    def erase(self):
+        """
+        Blank the screen without forcing a full repaint.
+        """
+        self.stdscr.erase()
+
+    def prepare(self):
+        """
+        Hide the cursor and make getch() return immediately.
+        """
+        curses.curs_set(0)
+        self.stdscr.nodelay(1)
+
+    def stage(self):
+        """
+        Mark the whole screen for the next update.
+        """
+        self.stdscr.noutrefresh()
+
+    def update(self):
+        """
+        Write every staged window to the terminal at once.
+        """
+        curses.doupdate()
+
+    def refresh_size(self):
+        """
+        Pick up a new terminal size after a resize.
+        """
+        curses.endwin()
+        self.stdscr.refresh()
+
+    def getch(self) -> int:
+        """
+        Return the next key pressed, or -1 if there is none.
+        """
+        return self.stdscr.getch()
+
+    def wait(self, timeout, fds=()):
+        """
+        Block on stdin and any extra file descriptors for at most timeout
+        seconds, or indefinitely if timeout is None.
+        """
+        try:
+            select.select([sys.stdin.fileno(), *fds], [], [], timeout)
+        except InterruptedError:
+            pass
+
+
+class MemoryWindow:
+    """
+    A one-row window of a MemoryBackend screen.
+    """
+
+    def __init__(self, backend, y: int):
+        self.backend = backend
+        self.y = y
+        self.refreshes = 0
+
+    def addstr(self, y: int, x: int, text: str, attr=0):
+        self.backend.write(self.y + y, x, text, attr)
+
+    def noutrefresh(self):
+        self.refreshes += 1
+
+
+class MemoryBackend:
+    """
+    A screen of character cells in memory, for running clocks headless
+    in tests and benchmarks.
+
+    Every write is recorded as (y, x, text) and applied to the cells and
+    their attributes, so tests can assert on exactly what was emitted or
+    on the resulting screen. Keys come from a script, one per getch()
+    call; once it runs out the backend presses q so the clock exits.
+    Waits return immediately, so a clock loop runs as fast as it can
+    draw, or advance a VirtualTime by the wait's timeout if one is
+    given, so the loop jumps from one deadline to the next.
+    """
+
+    KEY_ENTER = curses.KEY_ENTER
+
+    def __init__(self, rows: int = 24, cols: int = 80, keys=(), time_source=None):
+        self.keys = iter(keys)
+        self.time_source = time_source
+        self.writes = []
+        self.updates = 0
+        self.waits = 0
+        self.last_timeout = None
+        self.resize(rows, cols)
+
+    def resize(self, rows: int, cols: int):
+        """
+        Change the screen size, blanking the screen.
+        """
+        self.rows = rows
+        self.cols = cols
+        self.erase()
+
+    def setup_colors(self):
+        pass
+
+    def color(self, pair: int) -> int:
+        return pair << 8
+
+    def size(self) -> tuple[int, int]:
+        return (self.rows, self.cols)
+
+    def window(self, y: int, cols: int) -> MemoryWindow:
+        return MemoryWindow(self, y)
+
+    def erase(self):
+        self.cells = [[" "] * self.cols for _ in range(self.rows)]
+        self.attrs = [[0] * self.cols for _ in range(self.rows)]
+
+    def prepare(self):
+        pass
+
+    def stage(self):
+        pass
+
+    def update(self):
+        self.updates += 1
+
+    def refresh_size(self):
+        pass
+
+    def getch(self) -> int:
+        key = next(self.keys, "q")
+        return ord(key) if isinstance(key, str) else key
+
+    def wait(self, timeout, fds=()):
+        self.waits += 1
+        self.last_timeout = timeout
+        if self.time_source and timeout is not None:
+            self.time_source.sleep(timeout)
+
+    def write(self, y: int, x: int, text: str, attr=0):
+        """
+        Record a write and apply it to the cells it covers, dropping any
+        that fall off the screen.
+        """
+        self.writes.append((y, x, text))
+        if not 0 <= y < self.rows:
+            return
+
+        for i, char in enumerate(text[:max(self.cols - x, 0)]):
+            self.cells[y][x + i] = char
+            self.attrs[y][x + i] = attr
+
+    def line(self, y: int) -> str:
+        """
+        Return the text of a row, without trailing spaces.
+        """
+        return "".join(self.cells[y]).rstrip()
+
+    def text(self) -> str:
+        """
+        Return the whole screen as text, one line per row.
+        """
+        return "\n".join(self.line(y) for y in range(self.rows))
@@ -1,11 +1,13 @@
 """Sage base clock."""
 
-import curses
-import time
-
 from .constants import DisplayText
-from .renderer import ClockRenderer
-from .resize import ResizeHandler
+from .counter import EventCounter
+from .perf import PerfMonitor
+from .scheduler import NS_PER_SECOND, TickScheduler
+from .timesource import REAL_TIME
+from .trace import FrameTracer
+from sage.common import history
+from sage.common.status import StatusWriter
 
 
 class Clock:
@@ -18,30 +20,64 @@ class Clock:
     - Counter increment
     - Keyboard input handling
     - Window resize management
+    - Event-driven waiting for input, resizes and display changes
 
     This is an abstract base class - subclasses must implement _load_clock().
     """
 
-    def __init__(self):
+    STATUS_KIND = None
+
+    def __init__(self, time_source=None):
+        """
+        Timekeeping is done in integer nanoseconds from the time source,
+        so display deadlines never drift. The default reads
+        time.perf_counter_ns(); a VirtualTime simulates a clock without
+        waiting on it.
+        """
+        self.time_source = time_source or REAL_TIME
         self.count = 0
+        self.counter = EventCounter()
         self.paused = False
         self.pause_start = 0
         self.pause_time = 0
-        self.refresh_rate = 0.01
+        self.scheduler = TickScheduler(NS_PER_SECOND)
         self.start_time = 0
+        self.started = False
+        self.status = None
+        self.perf = None
+        self.backend = None
 
-    def load(self, **kwargs):
+    def load(self, backend=None, **kwargs):
         """
-        Initialize curses and load the application.
+        Initialize curses and load the application, or draw to the given
+        backend instead of the terminal. Passing count_log saves the
+        counter's increment times to that file on exit, and setting
+        SAGE_TRACE to a file path saves a Chrome trace of each phase of
+        the clock loop there.
         """
-        curses.wrapper(lambda stdscr: self._load_with_curses(stdscr, **kwargs))
+        tracer = FrameTracer.from_environment()
+        if tracer:
+            tracer.instrument(self)
 
-    def setup_components(self, stdscr):
+        try:
+            if backend:
+                self._load_with_backend(backend, **kwargs)
+            else:
+                self._load_with_curses(**kwargs)
+        finally:
+            if tracer:
+                tracer.dump()
+
+    def setup_components(self, backend):
         """
         Set up clock component classes.
         """
-        self.renderer = ClockRenderer(stdscr)
-        self.resize_handler = ResizeHandler(stdscr, self.resize_redraw)
+        from .renderer import ClockRenderer
+        from .resize import ResizeHandler
+
+        self.backend = backend
+        self.renderer = ClockRenderer(backend)
+        self.resize_handler = ResizeHandler(backend, self.resize_redraw)
         self.resize_handler.setup()
 
     def setup_display(self):
@@ -50,7 +86,7 @@ class Clock:
         """
         self.renderer.initialize_curses_window()
         self.renderer.render_base_features()
-        self.renderer.render_counter(self.count)
+        self._render_counter()
 
     def resize_redraw(self):
         """
@@ -58,18 +94,46 @@ class Clock:
         """
         self.setup_display()
         if self.paused:
-            self.renderer.render_status(DisplayText.PAUSED)
+            self._render_paused()
+        if self.perf:
+            self.perf.next_refresh_ns = 0
+
+    def _load_with_curses(self, **kwargs):
+        """
+        Load the application in the terminal with curses initialized.
+        """
+        # curses is imported on demand so that commands which never draw
+        # a clock, like `sage timer --test`, start quickly.
+        import curses
+
+        from .backend import CursesBackend
 
-    def _load_with_curses(self, stdscr, **kwargs):
+        curses.wrapper(
+            lambda stdscr: self._load_with_backend(CursesBackend(stdscr), **kwargs)
+        )
+
+    def _load_with_backend(self, backend, **kwargs):
         """
-        Load the application with curses initialized.
+        Load the application, drawing to the backend.
         """
         try:
-            self.setup_components(stdscr)
+            self.setup_components(backend)
             self.setup_display()
+            if self.STATUS_KIND:
+                self.status = StatusWriter.open()
+            if kwargs.get("perf"):
+                self._toggle_perf()
             self._load_clock(**kwargs)
         finally:
             self.resize_handler.cleanup()
+            self._cleanup()
+            if self.status:
+                self.status.close()
+            self._record_history()
+            # only written if anything was counted, including when the
+            # clock is interrupted.
+            if kwargs.get("count_log") and self.counter:
+                self.counter.dump(kwargs["count_log"], self.start_time)
 
     def _load_clock(self):
         """
@@ -77,6 +141,11 @@ class Clock:
         """
         raise NotImplementedError("Subclasses must implement '_load_clock'.")
 
+    def _cleanup(self):
+        """
+        Release clock resources once the clock exits.
+        """
+
     def _check_for_resize(self):
         """
         Check for window resize and handle resizing.
@@ -96,23 +165,106 @@ class Clock:
         Handle paused state changes.
         """
         if not self.paused:
-            self.pause_start = time.perf_counter()
+            self.pause_start = self.time_source.now_ns()
             self.paused = True
-            self.renderer.render_status(DisplayText.PAUSED)
+            self._render_paused()
         else:
-            self.pause_time += time.perf_counter() - self.pause_start
+            self.pause_time += self.time_source.now_ns() - self.pause_start
             self.paused = False
             self.pause_start = 0
-            self.renderer.clear_status()
+            self._clear_paused()
+        self._publish_status()
+
+    def _publish_status(self):
+        """
+        Publish the clock's state to the status file read by `sage
+        status`, if the subclass sets STATUS_KIND.
+        """
+        if self.status:
+            self.status.publish(
+                self.STATUS_KIND,
+                self.paused,
+                self.start_time,
+                self.pause_start,
+                self.pause_time,
+                count=self.count,
+                **self._get_status_details(),
+            )
+
+    def _record_history(self):
+        """
+        Append the session to the history log read by `sage stats`, if
+        the subclass sets STATUS_KIND and the clock started.
+        """
+        if not self.STATUS_KIND or not self.started:
+            return
+
+        now_ns = self.time_source.now_ns()
+        end_ns = self.time_source.wall_ns()
+        pause_ns = self.pause_time + (now_ns - self.pause_start if self.paused else 0)
+        try:
+            history.append_session(
+                end_ns - (now_ns - self.start_time),
+                end_ns,
+                self._get_session_ns(),
+                pause_ns,
+                self.STATUS_KIND,
+                name=self._get_status_details().get("name", ""),
+                count=self.count,
+            )
+        except OSError:
+            # a clock still exits cleanly if its history can't be saved.
+            pass
+
+    def _get_session_ns(self):
+        """
+        Return the nanoseconds the session counted, excluding pauses.
+        """
+        return self._get_elapsed_ns()
+
+    def _get_status_details(self):
+        """
+        Return subclass specific fields for the status file.
+        """
+        return {}
+
+    def _render_paused(self):
+        """
+        Render the paused status.
+        """
+        self.renderer.render_status(DisplayText.PAUSED)
+
+    def _clear_paused(self):
+        """
+        Clear the paused status.
+        """
+        self.renderer.clear_status()
 
     def _listen_for_keys(self):
         """
-        Listen for keystrokes and handle command logic.
+        Drain every pending keystroke, handling each in order, so a burst
+        of keys is applied in a single frame. The counter is rendered and
+        published once for the whole burst. Returns q as soon as it is
+        pressed, otherwise -1 once no keys are left.
+        """
+        count = self.count
+        key = self.backend.getch()
+        while key != -1 and key != ord("q"):
+            self._handle_key(key)
+            key = self.backend.getch()
+
+        if self.count != count:
+            self._render_counter()
+            self._publish_status()
+        return key
+
+    def _handle_key(self, key):
+        """
+        Handle the command logic of a single keystroke.
         """
-        key = self.renderer.stdscr.getch()
         self._handle_pause(key)
         self._handle_counter(key)
-        return key
+        self._handle_perf(key)
 
     def _handle_pause(self, key):
         """
@@ -123,23 +275,106 @@ class Clock:
 
     def _handle_counter(self, key):
         """
-        Handle counter increment triggered by ENTER key.
+        Handle counter increment triggered by ENTER key. Each increment
+        is timestamped, so the counter can also show the increments made
+        in the last minute.
         """
-        if key == 10 or key == curses.KEY_ENTER:
+        if key == 10 or key == self.backend.KEY_ENTER:
             self.count += 1
+            self.counter.record(self.time_source.now_ns())
+
+    def _render_counter(self):
+        """
+        Render the counter, with the increments in the last minute once
+        it has been used.
+        """
+        if self.counter:
+            per_minute = self.counter.per_minute(self.time_source.now_ns())
+            self.renderer.render_counter(self.count, per_minute)
+        else:
             self.renderer.render_counter(self.count)
 
+    def _handle_perf(self, key):
+        """
+        Handle performance overlay toggling triggered by p key.
+        """
+        if key == ord("p"):
+            self._toggle_perf()
+
+    def _toggle_perf(self):
+        """
+        Show or hide the overlay of frame rate, wakeups, tick lateness,
+        bytes written and CPU usage. Statistics are only collected while
+        it is shown.
+        """
+        if self.perf:
+            self.perf = None
+            self.renderer.clear_perf()
+        else:
+            self.perf = PerfMonitor()
+
     def _sleep_and_refresh(self):
         """
-        Handle timing and screen refresh.
+        Flush any changed regions to the screen, then block until a
+        keystroke, a window resize or the next visible change of the
+        display.
         """
-        time.sleep(self.refresh_rate)
-        self.renderer.stdscr.refresh()
+        # the rate changes as increments leave the window, not only when
+        # one is made.
+        if self.counter:
+            self._render_counter()
 
-    def _get_elapsed_time(self):
+        if not self.perf:
+            self.renderer.flush()
+            self._wait_for_event(self._get_timeout())
+            return
+
+        now_ns = self.time_source.now_ns()
+        if self.perf.due(now_ns):
+            self.renderer.render_perf(self.perf.format(now_ns))
+        if self.renderer.flush():
+            self.perf.record_frame(now_ns, self.renderer.bytes_written)
+
+        self._wait_for_event(self.perf.timeout(self._get_timeout(), now_ns))
+        self.perf.record_wakeup(self.time_source.now_ns())
+
+    def _wait_for_event(self, timeout):
         """
-        Calculate the elapsed time depending on paused status.
+        Block on input and the resize wakeup pipe for at most timeout
+        seconds, or indefinitely if timeout is None.
+        """
+        fds = []
+        if self.resize_handler and self.resize_handler.fileno() is not None:
+            fds.append(self.resize_handler.fileno())
+        self.backend.wait(timeout, fds)
+
+    def _get_timeout(self):
+        """
+        Calculate the seconds until the next scheduled tick, or None when
+        paused since the display is frozen.
+        """
+        if self.paused:
+            return None
+        return self.scheduler.timeout(self._get_elapsed_ns())
+
+    def _tick(self):
+        """
+        Advance the tick scheduler, recording the lateness of any display
+        boundary crossed since the last tick.
+        """
+        if not self.paused and self.scheduler.tick(self._get_elapsed_ns()) and self.perf:
+            self.perf.record_lateness(self.scheduler.lateness_ns)
+
+    def _get_elapsed_ns(self):
+        """
+        Calculate the elapsed nanoseconds depending on paused status.
         """
         if self.paused:
             return self.pause_start - self.start_time - self.pause_time
-        return time.perf_counter() - self.start_time - self.pause_time
+        return self.time_source.now_ns() - self.start_time - self.pause_time
+
+    def _get_elapsed_time(self):
+        """
+        Calculate the elapsed time in seconds depending on paused status.
+        """
+        return self._get_elapsed_ns() / NS_PER_SECOND
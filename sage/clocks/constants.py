@@ -9,6 +9,7 @@ class DisplayText(StrEnum):
     """
     MISSING_SOUND = "Cannot find sound file. Timer will complete silently."
     RUNNING_HELP = "<q> Quit, <Space> Pause/Resume, <Enter> Increment counter"
+    STOPWATCH_HELP = "<q> Quit, <Space> Pause/Resume, <Enter> Increment counter, <l> Lap"
     PAUSED = "Paused"
     TIMES_UP_HELP = "<q> Quit"
     TIMES_UP = "Time's up!"
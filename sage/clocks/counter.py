@@ -0,0 +1,69 @@
+"""Sage timestamped counter."""
+
+from array import array
+
+from .scheduler import NS_PER_SECOND
+from sage.common.formatting import nanoseconds_as_decimal
+
+
+DEFAULT_CAPACITY = 65536
+WINDOW_NS = 60 * NS_PER_SECOND
+
+
+class EventCounter:
+    """
+    Records the time of each counter increment in a fixed-size ring
+    buffer and counts how many fall within the last minute.
+
+    Timestamps are kept in a preallocated array of 64-bit nanoseconds,
+    so only the most recent capacity increments are kept. The sliding
+    window is the index of the oldest increment still inside it, which
+    only ever moves forward, so each increment costs constant time
+    however many the window holds.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.timestamps = array("q", bytes(8 * capacity))
+        self.total = 0
+        self.window_start = 0
+
+    def __len__(self) -> int:
+        return self.total
+
+    def record(self, now_ns: int):
+        """
+        Record an increment at now_ns.
+        """
+        self.timestamps[self.total % self.capacity] = now_ns
+        self.total += 1
+
+    def per_minute(self, now_ns: int) -> int:
+        """
+        Return the number of increments in the minute before now_ns.
+        """
+        # increments overwritten in the ring can't be counted.
+        self.window_start = max(self.window_start, self.total - self.capacity)
+        cutoff = now_ns - WINDOW_NS
+        while (
+            self.window_start < self.total
+            and self.timestamps[self.window_start % self.capacity] <= cutoff
+        ):
+            self.window_start += 1
+        return self.total - self.window_start
+
+    def kept(self) -> list[int]:
+        """
+        Return the timestamps still in the ring buffer, oldest first.
+        """
+        first = max(self.total - self.capacity, 0)
+        return [self.timestamps[n % self.capacity] for n in range(first, self.total)]
+
+    def dump(self, path, start_ns: int = 0):
+        """
+        Write the kept timestamps to a file, one per line, as decimal
+        seconds since start_ns.
+        """
+        with open(path, "w") as f:
+            for timestamp in self.kept():
+                f.write(nanoseconds_as_decimal(timestamp - start_ns) + "\n")
@@ -0,0 +1,255 @@
+"""Sage multi-timer dashboard."""
+
+import heapq
+
+import click
+
+from .clock import Clock
+from .constants import DisplayText, SoundFileName
+from .scheduler import NS_PER_SECOND
+from .timer import get_total_seconds
+from sage.common.formatting import time_as_clock
+from sage.config import sounds
+
+
+class Countdown:
+    """
+    A single countdown shown as one cell of the dashboard.
+    """
+
+    def __init__(self, label: str, total_seconds: int):
+        self.label = label
+        self.total_seconds = total_seconds
+        self.times_up = False
+
+    def remaining_ns(self, elapsed_ns: int) -> int:
+        """
+        Calculate the nanoseconds remaining after elapsed_ns.
+        """
+        return self.total_seconds * NS_PER_SECOND - elapsed_ns
+
+    def display_time(self, elapsed_ns: int) -> str:
+        """
+        Return the clock text shown after elapsed_ns.
+        """
+        if self.times_up:
+            return DisplayText.TIMES_UP_TIME
+        return time_as_clock(-(-self.remaining_ns(elapsed_ns) // NS_PER_SECOND))
+
+    def next_deadline_ns(self, elapsed_ns: int) -> int:
+        """
+        Return the elapsed time of the next visible change, which is
+        either the next whole second or expiry, whichever comes first.
+        """
+        next_second = (elapsed_ns // NS_PER_SECOND + 1) * NS_PER_SECOND
+        return min(next_second, self.total_seconds * NS_PER_SECOND)
+
+
+class Dashboard(Clock):
+    """
+    Runs several countdowns in one process, each drawn as a cell of a
+    grid that reflows to the terminal width.
+
+    Rather than polling every countdown on each pass, the dashboard
+    keeps a min-heap of (deadline, index) pairs holding the next
+    visible change of each running countdown. Each wakeup pops only
+    the entries that are due, so the work done is proportional to what
+    actually changes on screen, and the loop sleeps until the earliest
+    remaining deadline.
+    """
+
+    def __init__(self, time_source=None):
+        super().__init__(time_source)
+        self.countdowns = []
+        self.deadlines = []
+        self.quiet = False
+        self.sound = None
+
+    def print_durations(self, time_inputs) -> None:
+        """
+        Print each timer duration without loading the dashboard.
+        """
+        for time_input in time_inputs:
+            click.echo(time_as_clock(get_total_seconds(time_input)))
+
+    def resize_redraw(self):
+        """
+        Reflow the grid of countdowns to the new window size.
+        """
+        super().resize_redraw()
+        self._setup_grid()
+        self._handle_all_done()
+
+    def _load_clock(self, **kwargs):
+        """
+        Initialize and start the dashboard.
+        """
+        self._initialize_dashboard(**kwargs)
+        self._setup_grid()
+        self._check_for_sound_warning()
+        self._handle_pause_on_start(**kwargs)
+        self._start()
+
+    def _initialize_dashboard(self, **kwargs):
+        """
+        Resolve each time input into a countdown and schedule its first
+        visible change.
+        """
+        self.countdowns = [
+            Countdown(time_input, get_total_seconds(time_input))
+            for time_input in kwargs.get("time_inputs", ())
+        ]
+        self.quiet = kwargs.get("quiet", False)
+        self.start_time = self.time_source.now_ns()
+        self.deadlines = [
+            (countdown.next_deadline_ns(0), index)
+            for index, countdown in enumerate(self.countdowns)
+        ]
+        heapq.heapify(self.deadlines)
+
+    def _setup_grid(self):
+        """
+        Lay out and draw every countdown cell.
+        """
+        self.renderer.layout_grid(len(self.countdowns))
+        elapsed_ns = self._get_elapsed_ns()
+        for index in range(len(self.countdowns)):
+            self._render_countdown(index, elapsed_ns)
+
+    def _check_for_sound_warning(self):
+        """
+        Resolve the times up sound, rendering a warning if it is missing
+        and otherwise arming the player ahead of the first expiry.
+        """
+        self.sound = sounds.SoundPlayer(SoundFileName.TIMES_UP)
+
+        if not self.sound.available:
+            self.renderer.render_warning(DisplayText.MISSING_SOUND)
+        elif not self.quiet:
+            self.sound.arm()
+
+    def _cleanup(self):
+        """
+        Stop the armed sound player if the dashboard quits early.
+        """
+        if self.sound:
+            self.sound.cancel()
+
+    def _start(self):
+        """
+        Start the dashboard.
+        """
+        while self._listen_for_keys() != ord("q"):
+            self._check_for_resize()
+            self._update_due()
+            self._sleep_and_refresh()
+
+    def _handle_key(self, key):
+        """
+        Turn off pause and counter handling once every countdown has
+        completed.
+        """
+        if not self.deadlines:
+            self._handle_perf(key)
+        else:
+            super()._handle_key(key)
+
+    def _get_timeout(self):
+        """
+        Calculate the seconds until the earliest countdown deadline, or
+        None when paused or once every countdown has completed.
+        """
+        if self.paused or not self.deadlines:
+            return None
+        deadline_ns = self.deadlines[0][0]
+        return max(0, deadline_ns - self._get_elapsed_ns()) / NS_PER_SECOND
+
+    def _update_due(self):
+        """
+        Redraw every countdown whose deadline has passed, recording how
+        late each was drawn, and schedule its next change.
+        """
+        if self.paused:
+            return
+
+        elapsed_ns = self._get_elapsed_ns()
+        expired = None
+        while self.deadlines and self.deadlines[0][0] <= elapsed_ns:
+            deadline_ns, index = heapq.heappop(self.deadlines)
+            self.scheduler.histogram.record(elapsed_ns - deadline_ns)
+            if self.perf:
+                self.perf.record_lateness(elapsed_ns - deadline_ns)
+            countdown = self.countdowns[index]
+
+            if countdown.remaining_ns(elapsed_ns) <= 0:
+                countdown.times_up = True
+                expired = countdown
+            else:
+                heapq.heappush(
+                    self.deadlines, (countdown.next_deadline_ns(elapsed_ns), index)
+                )
+            self._render_countdown(index, elapsed_ns)
+
+        if expired:
+            self._handle_times_up_sound(expired, elapsed_ns)
+        self._handle_all_done()
+
+    def _handle_times_up_sound(self, countdown, elapsed_ns):
+        """
+        Play the times up sound once for any countdowns expiring together
+        and arm a fresh player for those still running, unless --quiet
+        was passed.
+        """
+        if self.quiet or not self.sound.available:
+            return
+
+        self.sound.fire(lateness_ns=-countdown.remaining_ns(elapsed_ns))
+        if self.deadlines:
+            self.sound = sounds.SoundPlayer(SoundFileName.TIMES_UP)
+            self.sound.arm()
+
+    def _handle_all_done(self):
+        """
+        Show the times up help text once every countdown has completed.
+        """
+        if not self.deadlines:
+            self.renderer.render_help_text(DisplayText.TIMES_UP_HELP)
+
+    def _render_countdown(self, index, elapsed_ns):
+        """
+        Render a single countdown cell.
+        """
+        countdown = self.countdowns[index]
+        if countdown.times_up:
+            status = DisplayText.TIMES_UP
+        elif self.paused:
+            status = DisplayText.PAUSED
+        else:
+            status = ""
+
+        self.renderer.render_cell(
+            index, countdown.label, countdown.display_time(elapsed_ns), status
+        )
+
+    def _render_paused(self):
+        """
+        Render the paused status in each running countdown cell.
+        """
+        self._render_all()
+
+    def _clear_paused(self):
+        """
+        Clear the paused status from each running countdown cell.
+        """
+        self._render_all()
+
+    def _render_all(self):
+        """
+        Render every countdown cell at the current elapsed time.
+        """
+        if not self.renderer.cells:
+            return
+
+        elapsed_ns = self._get_elapsed_ns()
+        for index in range(len(self.countdowns)):
+            self._render_countdown(index, elapsed_ns)
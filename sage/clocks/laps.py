@@ -0,0 +1,108 @@
+"""Sage stopwatch laps."""
+
+from array import array
+from pathlib import Path
+
+from sage.common.formatting import nanoseconds_as_decimal
+
+
+EXPORT_FORMATS = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+EXPORT_BATCH = 8192
+
+
+def get_export_format(path) -> str:
+    """
+    Get the export format for a lap file from its extension.
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix not in EXPORT_FORMATS:
+        raise ValueError("Lap files must end in .csv, .ndjson or .jsonl.")
+    return EXPORT_FORMATS[suffix]
+
+
+class LapRecorder:
+    """
+    Records stopwatch laps as the elapsed nanoseconds at each split.
+
+    Splits are kept in a flat array of 64-bit integers, eight bytes a
+    lap, so a session can hold millions of laps. Lap durations are the
+    differences between consecutive splits. Their minimum, maximum and
+    total are updated as each lap is recorded, so the statistics never
+    need a pass over the laps.
+    """
+
+    def __init__(self):
+        self.splits = array("q")
+        self.min_ns = 0
+        self.max_ns = 0
+        self.total_ns = 0
+
+    def __len__(self) -> int:
+        return len(self.splits)
+
+    def record(self, elapsed_ns: int) -> int:
+        """
+        Record a split at elapsed_ns and return the lap's duration.
+        """
+        lap_ns = elapsed_ns - (self.splits[-1] if self.splits else 0)
+        if self.splits:
+            self.min_ns = min(self.min_ns, lap_ns)
+            self.max_ns = max(self.max_ns, lap_ns)
+        else:
+            self.min_ns = self.max_ns = lap_ns
+
+        self.splits.append(elapsed_ns)
+        self.total_ns += lap_ns
+        return lap_ns
+
+    def mean_ns(self) -> int:
+        """
+        Return the mean lap duration in nanoseconds.
+        """
+        return self.total_ns // len(self.splits) if self.splits else 0
+
+    def recent(self, count: int) -> list[tuple[int, int, int]]:
+        """
+        Return the last count laps, newest first, as tuples of lap
+        number, lap duration and split.
+        """
+        laps = []
+        for index in range(len(self.splits) - 1, max(len(self.splits) - count, 0) - 1, -1):
+            previous = self.splits[index - 1] if index else 0
+            laps.append((index + 1, self.splits[index] - previous, self.splits[index]))
+        return laps
+
+    def export(self, path):
+        """
+        Write every lap to a CSV or NDJSON file, chosen by the file's
+        extension. Lines are written in batches rather than built up in
+        memory all at once.
+        """
+        export_format = get_export_format(path)
+
+        with open(path, "w", newline="") as f:
+            if export_format == "csv":
+                f.write("lap,lap_seconds,split_seconds\n")
+
+            batch = []
+            previous = 0
+            for number, split in enumerate(self.splits, 1):
+                lap = nanoseconds_as_decimal(split - previous)
+                split_seconds = nanoseconds_as_decimal(split)
+                previous = split
+
+                if export_format == "csv":
+                    batch.append(f"{number},{lap},{split_seconds}\n")
+                else:
+                    # seconds are exact decimals, written as JSON numbers
+                    # rather than rounded through floats.
+                    batch.append(
+                        f'{{"lap": {number}, "lap_seconds": {lap}, '
+                        f'"split_seconds": {split_seconds}}}\n'
+                    )
+
+                if len(batch) == EXPORT_BATCH:
+                    f.write("".join(batch))
+                    batch.clear()
+
+            f.write("".join(batch))
@@ -0,0 +1,192 @@
+"""Sage live performance statistics."""
+
+import time
+
+from .scheduler import NS_PER_SECOND, LatenessHistogram
+
+
+class RollingCounter:
+    """
+    Counts events over a rolling window of whole seconds.
+
+    Events are added to a ring of one-second buckets with a running
+    total, so adding an event or reading the rate never walks more than
+    the window's buckets, however many events it holds.
+    """
+
+    def __init__(self, seconds: int = 5):
+        self.buckets = [0] * seconds
+        self.total = 0
+        self.start_ns = None
+        self.second = 0
+
+    def add(self, now_ns: int, count: int = 1):
+        """
+        Add count events at now_ns.
+        """
+        self._advance(now_ns)
+        self.buckets[self.second % len(self.buckets)] += count
+        self.total += count
+
+    def rate(self, now_ns: int) -> float:
+        """
+        Return the events per second over the window ending at now_ns.
+        """
+        if self.start_ns is None:
+            return 0.0
+        self._advance(now_ns)
+
+        # the window is the current partial second plus the full seconds
+        # before it, or less while the counter is younger than that.
+        span_ns = (len(self.buckets) - 1) * NS_PER_SECOND + now_ns % NS_PER_SECOND
+        span_ns = min(span_ns, now_ns - self.start_ns)
+        return self.total * NS_PER_SECOND / span_ns if span_ns > 0 else 0.0
+
+    def _advance(self, now_ns: int):
+        """
+        Empty the buckets of any seconds that have left the window.
+        """
+        second = now_ns // NS_PER_SECOND
+        if self.start_ns is None:
+            self.start_ns = now_ns
+            self.second = second
+            return
+
+        for step in range(1, min(second - self.second, len(self.buckets)) + 1):
+            index = (self.second + step) % len(self.buckets)
+            self.total -= self.buckets[index]
+            self.buckets[index] = 0
+        self.second = max(self.second, second)
+
+
+class RollingLateness:
+    """
+    Tracks the mean and percentiles of the most recent tick lateness
+    samples.
+
+    Samples are kept in a fixed ring and also counted in the same power
+    of two buckets as LatenessHistogram. Recording a sample removes the
+    one it replaces from the running sum and bucket counts, so updates
+    take constant time and percentiles only walk the buckets.
+    """
+
+    def __init__(self, size: int = 256):
+        self.samples = [0] * size
+        self.count = 0
+        self.sum_ns = 0
+        self.counts = [0] * LatenessHistogram.BUCKETS
+
+    def record(self, lateness_ns: int):
+        """
+        Record the lateness of a tick, dropping the oldest sample once
+        the ring is full.
+        """
+        index = self.count % len(self.samples)
+        if self.count >= len(self.samples):
+            oldest = self.samples[index]
+            self.sum_ns -= oldest
+            self.counts[LatenessHistogram.bucket(oldest)] -= 1
+
+        self.samples[index] = lateness_ns
+        self.sum_ns += lateness_ns
+        self.counts[LatenessHistogram.bucket(lateness_ns)] += 1
+        self.count += 1
+
+    def mean_ns(self) -> float:
+        """
+        Return the mean lateness of the samples in the window.
+        """
+        size = min(self.count, len(self.samples))
+        return self.sum_ns / size if size else 0.0
+
+    def percentile_ns(self, percent: float) -> int:
+        """
+        Return the upper bound of the bucket containing the given
+        percentile of the samples in the window.
+        """
+        size = min(self.count, len(self.samples))
+        if not size:
+            return 0
+
+        threshold = size * percent / 100
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if seen >= threshold:
+                return LatenessHistogram.upper_bound_ns(bucket)
+        return LatenessHistogram.upper_bound_ns(len(self.counts) - 1)
+
+
+class PerfMonitor:
+    """
+    Collects the statistics shown in the performance overlay: frames
+    drawn, wakeups, bytes written and tick lateness over a rolling
+    window, and the process CPU usage since the overlay last refreshed.
+
+    The overlay refreshes once a second. Its own refresh wakes the clock,
+    so a paused clock shows about one wakeup and frame per second.
+    """
+
+    def __init__(self, window_seconds: int = 5):
+        self.frames = RollingCounter(window_seconds)
+        self.wakeups = RollingCounter(window_seconds)
+        self.bytes = RollingCounter(window_seconds)
+        self.lateness = RollingLateness()
+        self.bytes_seen = None
+        self.next_refresh_ns = 0
+        self.cpu_sample = (time.perf_counter_ns(), time.process_time_ns())
+
+    def record_frame(self, now_ns: int, bytes_written: int):
+        """
+        Record a frame flushed to the terminal, given the renderer's
+        running total of bytes written.
+        """
+        if self.bytes_seen is None:
+            self.bytes_seen = bytes_written
+        self.bytes.add(now_ns, bytes_written - self.bytes_seen)
+        self.bytes_seen = bytes_written
+        self.frames.add(now_ns)
+
+    def record_wakeup(self, now_ns: int):
+        """
+        Record the clock waking up from a wait.
+        """
+        self.wakeups.add(now_ns)
+
+    def record_lateness(self, lateness_ns: int):
+        """
+        Record how late a display tick was drawn.
+        """
+        self.lateness.record(lateness_ns)
+
+    def due(self, now_ns: int) -> bool:
+        """
+        Return whether the overlay should be refreshed.
+        """
+        return now_ns >= self.next_refresh_ns
+
+    def timeout(self, timeout: float | None, now_ns: int) -> float:
+        """
+        Shorten a wait so that it ends in time for the next refresh.
+        """
+        refresh = max(self.next_refresh_ns - now_ns, 0) / NS_PER_SECOND
+        return refresh if timeout is None else min(timeout, refresh)
+
+    def format(self, now_ns: int) -> str:
+        """
+        Format the overlay text and schedule the next refresh.
+        """
+        wall_ns, cpu_ns = time.perf_counter_ns(), time.process_time_ns()
+        last_wall_ns, last_cpu_ns = self.cpu_sample
+        cpu_percent = 100 * (cpu_ns - last_cpu_ns) / max(wall_ns - last_wall_ns, 1)
+        self.cpu_sample = (wall_ns, cpu_ns)
+        self.next_refresh_ns = (now_ns // NS_PER_SECOND + 1) * NS_PER_SECOND
+
+        return (
+            f"{self.frames.rate(now_ns):.1f} fps  "
+            f"{self.wakeups.rate(now_ns):.1f} wakeups/s  "
+            f"late {self.lateness.mean_ns() / 1000:.0f}us "
+            f"p99 {self.lateness.percentile_ns(99) / 1000:.0f}us  "
+            f"{self.bytes.rate(now_ns):.0f} B/s  "
+            f"cpu {cpu_percent:.1f}%"
+        )
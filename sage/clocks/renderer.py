@@ -1,42 +1,115 @@
-"""Sage renderer class for curses interface."""
+"""Sage renderer class for the clock interface."""
 
-import curses
+import time
 
 from .constants import DisplayText
 
 
 class ClockRenderer:
     """
-    Handles all curses-based rendering for timer and stopwatch displays.
+    Handles all rendering for timer and stopwatch displays.
 
     The ClockRenderer manages the terminal UI including clock display, status
     messages, help text, and color schemes. It calculates positioning and
     handles text centering automatically.
+
+    The screen is split into one-row sub-windows (title, heading, clock,
+    status, footer) whose geometry is computed once per terminal size.
+    Each piece of text is drawn into a named region inside one of those
+    windows. The renderer remembers what was last drawn in every region
+    and only emits the cells that changed, counting the cells and bytes
+    written for benchmarking. Changed windows are batched with
+    noutrefresh() and flushed to the terminal in a single doupdate().
+
+    All screen access goes through a backend, CursesBackend for the
+    terminal or MemoryBackend to draw into memory.
     """
 
-    def __init__(self, stdscr):
-        self.stdscr = stdscr
-        self._setup_colors()
+    # maps each text region to the sub-window it is drawn in.
+    REGION_WINDOWS = {
+        "title": "title",
+        "warning": "title",
+        "perf": "perf",
+        "heading": "heading",
+        "clock": "clock",
+        "status": "status",
+        "help": "footer",
+        "counter": "footer",
+    }
+
+    # a dashboard cell holds a label, time and status line plus a gap.
+    CELL_WIDTH = 24
+    CELL_HEIGHT = 4
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.rows = 0
+        self.cols = 0
+        self.windows = {}
+        self.region_windows = dict(self.REGION_WINDOWS)
+        self.cells = []
+        self.regions = {}
+        self.dirty = set()
+        self._relayout = False
+        self.reset_write_stats()
+        self.backend.setup_colors()
+
+    def layout(self):
+        """
+        Compute the window geometry for the current terminal size and
+        create a sub-window for each row of the display.
+        """
+        self.rows, self.cols = self.backend.size()
+        center = self.rows // 2
+        rows = {
+            "title": 1,
+            "perf": 2,
+            "heading": center - 1,
+            "clock": center,
+            "status": center + 1,
+            "footer": self.rows - 1,
+        }
+        self.windows = {
+            name: self.backend.window(y, self.cols)
+            for name, y in rows.items()
+        }
+        self.region_windows = dict(self.REGION_WINDOWS)
+        self.cells = []
+        self.regions.clear()
+        self.dirty.clear()
+        self._relayout = True
 
-    @staticmethod
-    def _setup_colors():
+    def layout_grid(self, count: int):
         """
-        Initialize curses color pairs.
+        Lay out a grid of count dashboard cells that fits the current
+        terminal, reflowing the number of columns to its width. Rows of
+        cells that don't fit above the footer are left undrawn.
         """
-        curses.start_color()
-        curses.init_pair(1, curses.COLOR_WHITE, curses.COLOR_BLACK)
-        curses.init_pair(2, curses.COLOR_GREEN, curses.COLOR_BLACK)
-        curses.init_pair(3, curses.COLOR_BLUE, curses.COLOR_BLACK)
-        curses.init_pair(4, curses.COLOR_YELLOW, curses.COLOR_BLACK)
+        columns = max(1, min(count, self.cols // self.CELL_WIDTH))
+        grid_rows = -(-count // columns)
+        cell_width = self.cols // columns
+        top = max(3, (self.rows - grid_rows * self.CELL_HEIGHT) // 2)
+
+        self.cells = []
+        for index in range(count):
+            row, column = divmod(index, columns)
+            y = top + row * self.CELL_HEIGHT
+            self.cells.append((y, column * cell_width, cell_width))
+
+            for line, part in enumerate(("label", "time", "status")):
+                if y + line >= self.rows - 1:
+                    break
+                name = f"row{y + line}"
+                if name not in self.windows:
+                    self.windows[name] = self.backend.window(y + line, self.cols)
+                self.region_windows[f"cell{index}.{part}"] = name
 
     def get_center_coordinates(self, text: str) -> tuple[int, int]:
         """
         Calculate center coordinates of the curses window.
         """
-        max_y, max_x = self.stdscr.getmaxyx()
-
-        y = max_y // 2
-        x = (max_x // 2) - (len(text) // 2)
+        y = self.rows // 2
+        x = (self.cols // 2) - (len(text) // 2)
 
         # an even numbered text length can't be centered perfectly, so
         # offset y to the left by one character if the text length
@@ -45,13 +118,108 @@ class ClockRenderer:
 
         return (y, x)
 
+    def reset_write_stats(self):
+        """
+        Reset the counters of cells and bytes written to the screen.
+        """
+        self.cells_written = 0
+        self.bytes_written = 0
+        self._stats_start = time.perf_counter()
+
+    def write_stats(self) -> dict[str, float]:
+        """
+        Return cells and bytes written since the last reset, in total and
+        per second.
+        """
+        elapsed = max(time.perf_counter() - self._stats_start, 1e-9)
+        return {
+            "cells": self.cells_written,
+            "bytes": self.bytes_written,
+            "cells_per_second": self.cells_written / elapsed,
+            "bytes_per_second": self.bytes_written / elapsed,
+        }
+
+    def flush(self) -> bool:
+        """
+        Copy every dirty window to the virtual screen and update the
+        terminal once. Returns whether anything was flushed.
+        """
+        if not self.dirty and not self._relayout:
+            return False
+
+        if self._relayout:
+            # stdscr shares its buffer with the sub-windows, so this
+            # also stops getch() from refreshing it a second time.
+            self.backend.stage()
+            self._relayout = False
+
+        for name in self.dirty:
+            self.windows[name].noutrefresh()
+
+        self.dirty.clear()
+        self.backend.update()
+        return True
+
+    def _emit(self, region: str, x: int, text: str, attr=0):
+        """
+        Write text into the window of a region and count what was
+        written.
+        """
+        name = self.region_windows[region]
+        self.windows[name].addstr(0, x, text, attr)
+        self.dirty.add(name)
+        self.cells_written += len(text)
+        self.bytes_written += len(text.encode())
+
+    def _draw(self, region: str, x: int, text: str, attr=0):
+        """
+        Draw text into a region, emitting only the cells that differ
+        from what was last drawn there.
+        """
+        previous = self.regions.get(region)
+
+        if previous is None or previous[0] != x:
+            self._clear(region)
+            self._emit(region, x, text, attr)
+            self.regions[region] = (x, text)
+            return
+
+        old_text = previous[1]
+        start = None
+        for i, char in enumerate(text):
+            changed = i >= len(old_text) or old_text[i] != char
+            if changed and start is None:
+                start = i
+            elif not changed and start is not None:
+                self._emit(region, x + start, text[start:i], attr)
+                start = None
+
+        if start is not None:
+            self._emit(region, x + start, text[start:], attr)
+
+        if len(old_text) > len(text):
+            self._emit(region, x + len(text), " " * (len(old_text) - len(text)))
+
+        self.regions[region] = (x, text)
+
+    def _clear(self, region: str):
+        """
+        Blank out whatever was last drawn in a region.
+        """
+        previous = self.regions.pop(region, None)
+        if previous:
+            x, text = previous
+            self._emit(region, x, " " * len(text))
+
     def initialize_curses_window(self):
         """
         Initial curses window configuration.
         """
-        self.stdscr.clear()
-        curses.curs_set(0)
-        self.stdscr.nodelay(1)
+        # erase rather than clear, curses already repaints the whole
+        # terminal after a resize and clear would force it every time.
+        self.backend.erase()
+        self.layout()
+        self.backend.prepare()
 
     def render_base_features(self):
         """
@@ -65,75 +233,125 @@ class ClockRenderer:
         Render the application title at the top left of the curses
         window.
         """
-        self.stdscr.addstr(1, 1, DisplayText.TITLE, curses.color_pair(2))
+        self._draw("title", 1, DisplayText.TITLE, self.backend.color(2))
 
     def render_clock(self, time_text: str):
         """
         Render the clock at the center of the curses window.
         """
-        y, x = self.get_center_coordinates(time_text)
-        self.stdscr.addstr(y, x, time_text, curses.color_pair(1))
+        _, x = self.get_center_coordinates(time_text)
+        self._draw("clock", x, time_text, self.backend.color(1))
 
     def render_status(self, status_text: str):
         """
         Render the clock status directly below the clock in the curses
         window.
         """
-        y, x = self.get_center_coordinates(status_text)
-        self.stdscr.addstr(y + 1, x, status_text, curses.color_pair(4))
+        _, x = self.get_center_coordinates(status_text)
+        self._draw("status", x, status_text, self.backend.color(4))
 
     def clear_status(self):
         """
         Clear the status text.
         """
-        y, _ = self.get_center_coordinates("")
-        self.stdscr.move(y + 1, 0)
-        self.stdscr.clrtoeol()
+        self._clear("status")
 
     def render_help_text(self, help_text = DisplayText.RUNNING_HELP):
         """
         Render the help text at the bottom left of the curses window.
         """
-        y, _ = self.stdscr.getmaxyx()
-        self.stdscr.addstr(y - 1, 1, help_text, curses.color_pair(3))
+        self._draw("help", 1, help_text, self.backend.color(3))
 
-    def clear_help_text(self, help_text = DisplayText.RUNNING_HELP):
+    def clear_help_text(self):
         """
         Clear the help text at the bottom left of the curses window.
         """
-        y, _ = self.stdscr.getmaxyx()
-        empty_string = " " * len(help_text)
-        self.stdscr.addstr(y - 1, 1, empty_string)
+        self._clear("help")
 
     def render_heading(self, heading_text: str):
         """
         Render the timer heading above the clock in the curses window.
         """
-        y, x = self.get_center_coordinates(heading_text)
-        self.stdscr.addstr(y - 1, x, heading_text, curses.color_pair(2))
+        _, x = self.get_center_coordinates(heading_text)
+        self._draw("heading", x, heading_text, self.backend.color(2))
 
-    def render_counter(self, count = 0):
+    def render_counter(self, count = 0, per_minute=None):
         """
-        Render the counter at the bottom right of the curses window.
+        Render the counter at the bottom right of the curses window,
+        followed by the increments per minute if given.
         """
         counter_text = f"Counter: {count}"
-        y, x = self.stdscr.getmaxyx()
-        x -= len(counter_text)
-        self.stdscr.addstr(y - 1, x - 1, counter_text, curses.color_pair(3))
+        if per_minute is not None:
+            counter_text += f" ({per_minute}/min)"
+        x = self.cols - len(counter_text) - 1
+        self._draw("counter", x, counter_text, self.backend.color(3))
 
     def render_warning(self, warning_text: str):
         """
         Render warning text in upper right corner of screen.
         """
-        _, x = self.stdscr.getmaxyx()
-        x -= len(warning_text)
-        self.stdscr.addstr(1, x - 1, warning_text, curses.color_pair(4))
+        x = self.cols - len(warning_text) - 1
+        self._draw("warning", x, warning_text, self.backend.color(4))
+
+    def render_perf(self, perf_text: str):
+        """
+        Render the performance overlay below the application title,
+        cut to the width of the window.
+        """
+        self._draw("perf", 1, perf_text[:self.cols - 2], self.backend.color(3))
+
+    def clear_perf(self):
+        """
+        Clear the performance overlay.
+        """
+        self._clear("perf")
+
+    def render_laps(self, lines: list[str]):
+        """
+        Render lap lines centered below the clock status, the first in
+        the status color. Lines that would reach the footer are skipped.
+        """
+        top = self.rows // 2 + 3
+        for index, text in enumerate(lines):
+            y = top + index
+            if y >= self.rows - 1:
+                break
+
+            region = f"lap{index}"
+            if region not in self.region_windows:
+                name = f"row{y}"
+                if name not in self.windows:
+                    self.windows[name] = self.backend.window(y, self.cols)
+                self.region_windows[region] = name
+
+            _, x = self.get_center_coordinates(text)
+            self._draw(region, x, text, self.backend.color(1 if index else 4))
+
+    def render_cell(self, index: int, label: str, time_text: str, status_text: str = ""):
+        """
+        Render a dashboard cell, centering each line within the cell.
+        """
+        _, x, width = self.cells[index]
+        lines = (
+            ("label", label, self.backend.color(2)),
+            ("time", time_text, self.backend.color(1)),
+            ("status", status_text, self.backend.color(4)),
+        )
+
+        for part, text, attr in lines:
+            region = f"cell{index}.{part}"
+            if region not in self.region_windows:
+                continue
+
+            text = text[:width - 1]
+            if text:
+                self._draw(region, x + (width - len(text)) // 2, text, attr)
+            else:
+                self._clear(region)
 
     def render_times_up_display(self):
         """
         Render display for timer completion state.
         """
         self.render_status(DisplayText.TIMES_UP)
-        self.stdscr.nodelay(0)
-        self.clear_help_text()
         self.render_help_text(DisplayText.TIMES_UP_HELP)
@@ -1,6 +1,6 @@
 """Sage clock resize handler"""
 
-import curses
+import os
 import signal
 import threading
 
@@ -11,32 +11,66 @@ class ResizeHandler:
 
     Uses signal handling to detect SIGWINCH events and coordinate with the
     main application to redraw the interface when the terminal is resized.
+    The signal handler also writes to a wakeup pipe so that an event loop
+    blocked on input can select on fileno() and wake up immediately.
     """
 
-    def __init__(self, stdscr, redraw_callback):
-        self.stdscr = stdscr
+    def __init__(self, backend, redraw_callback):
+        self.backend = backend
         self.redraw_callback = redraw_callback
         self.resize_flag = threading.Event()
         self.old_handler = None
+        self._wakeup_read = None
+        self._wakeup_write = None
 
     def setup(self):
         """
-        Setup window resize signal handler.
+        Setup window resize signal handler and wakeup pipe.
         """
+        self._wakeup_read, self._wakeup_write = os.pipe()
+        os.set_blocking(self._wakeup_read, False)
+        os.set_blocking(self._wakeup_write, False)
         self.old_handler = signal.signal(signal.SIGWINCH, self._handle_resize)
 
     def cleanup(self):
         """
-        Restore the original signal handler.
+        Restore the original signal handler and close the wakeup pipe.
         """
         if self.old_handler:
             signal.signal(signal.SIGWINCH, self.old_handler)
 
+        for fd in (self._wakeup_read, self._wakeup_write):
+            if fd is not None:
+                os.close(fd)
+
+        self._wakeup_read = self._wakeup_write = None
+
+    def fileno(self):
+        """
+        Return the read end of the wakeup pipe for use with select.
+        """
+        return self._wakeup_read
+
     def _handle_resize(self, signum, frame):
         """
-        Set a flag that resize occurred.
+        Set a flag that resize occurred and wake the event loop.
         """
         self.resize_flag.set()
+        try:
+            os.write(self._wakeup_write, b"\0")
+        except (BlockingIOError, OSError, TypeError):
+            # pipe is full (a wakeup is already pending) or closed.
+            pass
+
+    def _drain_wakeups(self):
+        """
+        Discard pending wakeup bytes so the pipe stops polling readable.
+        """
+        try:
+            while os.read(self._wakeup_read, 64):
+                pass
+        except (BlockingIOError, OSError, TypeError):
+            pass
 
     def check_and_handle(self):
         """
@@ -44,6 +78,6 @@ class ResizeHandler:
         """
         if self.resize_flag.is_set():
             self.resize_flag.clear()
-            curses.endwin()
-            self.stdscr.refresh()
+            self._drain_wakeups()
+            self.backend.refresh_size()
             self.redraw_callback()
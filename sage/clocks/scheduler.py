@@ -0,0 +1,132 @@
+"""Sage tick scheduling."""
+
+from sage.common.formatting import NS_PER_SECOND
+
+
+NS_PER_CENTISECOND = 10_000_000
+NS_PER_MILLISECOND = 1_000_000
+NS_PER_MICROSECOND = 1_000
+
+
+class LatenessHistogram:
+    """
+    Records how late each display tick was drawn.
+
+    Lateness is bucketed by powers of two in microseconds: bucket 0
+    holds ticks under 1us late and bucket i holds ticks between
+    2**(i - 1) and 2**i microseconds late. The final bucket also
+    collects everything larger.
+    """
+
+    BUCKETS = 24
+
+    def __init__(self):
+        self.counts = [0] * self.BUCKETS
+        self.total = 0
+        self.sum_ns = 0
+        self.max_ns = 0
+
+    def record(self, lateness_ns: int):
+        """
+        Record the lateness of a single tick.
+        """
+        self.counts[self.bucket(lateness_ns)] += 1
+        self.total += 1
+        self.sum_ns += lateness_ns
+        self.max_ns = max(self.max_ns, lateness_ns)
+
+    def mean_ns(self) -> float:
+        """
+        Return the mean tick lateness in nanoseconds.
+        """
+        return self.sum_ns / self.total if self.total else 0.0
+
+    def percentile_ns(self, percent: float) -> int:
+        """
+        Return the upper bound of the bucket containing the given
+        percentile, in nanoseconds.
+        """
+        if not self.total:
+            return 0
+
+        threshold = self.total * percent / 100
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if seen >= threshold:
+                return min(self.upper_bound_ns(bucket), self.max_ns)
+        return self.max_ns
+
+    def format(self) -> str:
+        """
+        Format a summary line followed by the non-empty buckets.
+        """
+        lines = [
+            f"ticks: {self.total}  mean: {self.mean_ns() / 1000:.1f}us  "
+            f"p50: {self.percentile_ns(50) / 1000:.1f}us  "
+            f"p99: {self.percentile_ns(99) / 1000:.1f}us  "
+            f"max: {self.max_ns / 1000:.1f}us"
+        ]
+        for bucket, count in enumerate(self.counts):
+            if count:
+                lines.append(f"{self._label(bucket):>16}  {count}")
+        return "\n".join(lines)
+
+    @classmethod
+    def bucket(cls, lateness_ns: int) -> int:
+        """
+        Return the bucket a lateness in nanoseconds is counted in.
+        """
+        return min((lateness_ns // NS_PER_MICROSECOND).bit_length(), cls.BUCKETS - 1)
+
+    @staticmethod
+    def upper_bound_ns(bucket: int) -> int:
+        """
+        Return the exclusive upper bound of a bucket in nanoseconds.
+        """
+        return (1 << bucket) * NS_PER_MICROSECOND
+
+    def _label(self, bucket: int) -> str:
+        """
+        Return a human-readable range label for a bucket.
+        """
+        if bucket == 0:
+            return "<1us"
+        if bucket == self.BUCKETS - 1:
+            return f">={1 << (bucket - 1)}us"
+        return f"{1 << (bucket - 1)}-{1 << bucket}us"
+
+
+class TickScheduler:
+    """
+    Schedules display ticks on absolute, drift-free deadlines.
+
+    Deadlines are whole multiples of unit_ns measured in clock elapsed
+    time (excluding pauses), computed with integer arithmetic so they
+    never accumulate rounding error no matter how long the clock runs.
+    """
+
+    def __init__(self, unit_ns: int):
+        self.unit_ns = unit_ns
+        self.deadline_ns = unit_ns
+        self.lateness_ns = 0
+        self.histogram = LatenessHistogram()
+
+    def tick(self, elapsed_ns: int) -> bool:
+        """
+        Record lateness if the pending deadline has passed and schedule
+        the next one. Returns whether a display boundary was crossed.
+        """
+        if elapsed_ns < self.deadline_ns:
+            return False
+
+        self.lateness_ns = elapsed_ns - self.deadline_ns
+        self.histogram.record(self.lateness_ns)
+        self.deadline_ns = (elapsed_ns // self.unit_ns + 1) * self.unit_ns
+        return True
+
+    def timeout(self, elapsed_ns: int) -> float:
+        """
+        Return the seconds remaining until the next deadline.
+        """
+        return max(self.deadline_ns - elapsed_ns, 0) / NS_PER_SECOND
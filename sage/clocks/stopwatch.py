@@ -1,9 +1,11 @@
 """Sage stopwatch implementation."""
 
-import time
-
 from .clock import Clock
+from .constants import DisplayText
+from .laps import LapRecorder
+from .scheduler import NS_PER_CENTISECOND, TickScheduler
 from sage.common.formatting import time_as_clock
+from sage.common.status import KIND_STOPWATCH
 
 
 class Stopwatch(Clock):
@@ -13,13 +15,39 @@ class Stopwatch(Clock):
     The Stopwatch class provides elapsed time tracking functionality
     with a curses-based-display. It inherits from Clock for shared
     functionality like pause/resume and counter increment.
+
+    Pressing l records a lap, showing the latest laps below the clock
+    with the minimum, mean and maximum lap time.
     """
 
+    STATUS_KIND = KIND_STOPWATCH
+    LAPS_SHOWN = 3
+
+    def __init__(self, time_source=None):
+        super().__init__(time_source)
+        self.scheduler = TickScheduler(NS_PER_CENTISECOND)
+        self.laps = LapRecorder()
+
+    def setup_display(self):
+        """
+        Show the lap key in the help text.
+        """
+        super().setup_display()
+        self.renderer.render_help_text(DisplayText.STOPWATCH_HELP)
+
+    def resize_redraw(self):
+        """
+        Append laps render to display redraw.
+        """
+        super().resize_redraw()
+        self._render_laps()
+
     def _load_clock(self, **kwargs):
         """
         Initialize and start the stopwatch.
         """
         self._initialize_stopwatch()
+        self._publish_status()
         self._handle_pause_on_start(**kwargs)
         self._start()
 
@@ -27,7 +55,8 @@ class Stopwatch(Clock):
         """
         Initialize stopwatch settings.
         """
-        self.start_time = time.perf_counter()
+        self.start_time = self.time_source.now_ns()
+        self.started = True
 
     def _start(self):
         """
@@ -35,9 +64,57 @@ class Stopwatch(Clock):
         """
         while self._listen_for_keys() != ord("q"):
             self._check_for_resize()
+            self._tick()
             self._update_display()
             self._sleep_and_refresh()
 
+    def _listen_for_keys(self):
+        """
+        Render the laps once for every lap recorded in a burst of keys.
+        """
+        laps = len(self.laps)
+        key = super()._listen_for_keys()
+        if len(self.laps) != laps:
+            self._render_laps()
+        return key
+
+    def _handle_key(self, key):
+        """
+        Add lap handling to keystroke handling.
+        """
+        super()._handle_key(key)
+        self._handle_lap(key)
+
+    def _handle_lap(self, key):
+        """
+        Handle lap recording triggered by l key, while running.
+        """
+        if key == ord("l") and not self.paused:
+            self.laps.record(self._get_elapsed_ns())
+
+    def _render_laps(self):
+        """
+        Render the lap statistics and the latest laps.
+        """
+        if not self.laps:
+            return
+
+        lines = [
+            f"min {self._format_lap(self.laps.min_ns)}  "
+            f"mean {self._format_lap(self.laps.mean_ns())}  "
+            f"max {self._format_lap(self.laps.max_ns)}"
+        ]
+        for number, lap_ns, _ in self.laps.recent(self.LAPS_SHOWN):
+            lines.append(f"Lap {number}  {self._format_lap(lap_ns)}")
+        self.renderer.render_laps(lines)
+
+    @staticmethod
+    def _format_lap(lap_ns):
+        """
+        Format a lap time truncated to centiseconds, like the display.
+        """
+        return time_as_clock(lap_ns // NS_PER_CENTISECOND / 100, include_centiseconds=True)
+
     def _update_display(self):
         """
         Update the stopwatch display.
@@ -49,5 +126,7 @@ class Stopwatch(Clock):
         """
         Calculate the display time.
         """
-        time_elapsed = self._get_elapsed_time()
-        return time_as_clock(time_elapsed, include_centiseconds=True)
+        # truncate to whole centiseconds so the display only changes on
+        # the boundaries that the scheduler wakes up for.
+        centiseconds = self._get_elapsed_ns() // NS_PER_CENTISECOND
+        return time_as_clock(centiseconds / 100, include_centiseconds=True)
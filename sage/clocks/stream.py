@@ -0,0 +1,156 @@
+"""Sage headless clock streaming."""
+
+import json
+import os
+import select
+
+import click
+
+from .constants import DisplayText, SoundFileName
+from .scheduler import NS_PER_SECOND, TickScheduler
+from .timer import Timer
+from sage.common.formatting import time_as_clock
+from sage.config import sounds
+
+
+class ClockStream:
+    """
+    Writes a timer or stopwatch to a file descriptor without curses, one
+    line per visible change, for status bars and pipelines.
+
+    Lines are plain clock text, or NDJSON records when json_lines is set.
+    The stream shows whole seconds, so it replaces the clock's scheduler
+    with a one second one and sleeps until the next second boundary.
+
+    Output is never buffered beyond a single line. Before each write the
+    descriptor is polled for writability; if a slow reader hasn't caught
+    up, the pending line is replaced by the newest one rather than
+    queued, so a stalled reader sees the current time once it resumes.
+    A closed reader ends the stream quietly.
+    """
+
+    def __init__(self, clock, fd: int = 1, json_lines=False):
+        self.clock = clock
+        self.clock.scheduler = TickScheduler(NS_PER_SECOND)
+        self.fd = fd
+        self.json_lines = json_lines
+        self.pending = None
+        self.last_line = None
+        self.lines_written = 0
+
+    def run(self, **kwargs):
+        """
+        Start the clock and stream it until a timer completes or the
+        reader goes away.
+        """
+        try:
+            self._initialize_clock(**kwargs)
+            self._stream()
+        except BrokenPipeError:
+            pass
+        finally:
+            self.clock._cleanup()
+
+    def _initialize_clock(self, **kwargs):
+        """
+        Initialize the clock, resolving and arming the timer sound.
+        """
+        if not isinstance(self.clock, Timer):
+            self.clock._initialize_stopwatch()
+            return
+
+        self.clock._initialize_timer(**kwargs)
+        self.clock.sound = sounds.SoundPlayer(SoundFileName.TIMES_UP)
+
+        if not self.clock.sound.available:
+            click.echo(DisplayText.MISSING_SOUND, err=True)
+        elif not self.clock.quiet:
+            self.clock.sound.arm()
+
+    def _stream(self):
+        """
+        Write a line for each visible change, sleeping until the next
+        change, or until a slow reader catches up.
+        """
+        while not self._step():
+            if self.pending:
+                self._writable(self.clock._get_timeout())
+            else:
+                self.clock.time_source.sleep(self.clock._get_timeout())
+
+    def _step(self) -> bool:
+        """
+        Queue the current line if it changed and write it if the reader
+        is ready. Returns whether the stream has finished.
+        """
+        self.clock._tick()
+        done = self._check_times_up()
+
+        line = self._format_line()
+        if line != self.last_line:
+            self.pending = self.last_line = line
+
+        if self.pending and self._writable(0):
+            self._write_pending()
+
+        if done and self.pending:
+            # the final line is always delivered, however long it takes.
+            self._writable(None)
+            self._write_pending()
+
+        return done
+
+    def _check_times_up(self) -> bool:
+        """
+        Mark a timer as complete once it reaches zero, playing its sound.
+        """
+        if not isinstance(self.clock, Timer):
+            return False
+
+        if self.clock._get_remaining_ns() <= 0 and not self.clock.times_up:
+            self.clock.times_up = True
+            self.clock._handle_times_up_sound()
+        return self.clock.times_up
+
+    def _format_line(self) -> bytes:
+        """
+        Format the clock's current state as a line of output.
+        """
+        elapsed_seconds = self.clock._get_elapsed_ns() // NS_PER_SECOND
+
+        if isinstance(self.clock, Timer):
+            remaining_seconds = max(0, -(-self.clock._get_remaining_ns() // NS_PER_SECOND))
+            display = time_as_clock(remaining_seconds)
+            record = {
+                "display": display,
+                "elapsed": min(elapsed_seconds, self.clock.total_seconds),
+                "remaining": remaining_seconds,
+                "state": "done" if self.clock.times_up else "running",
+            }
+        else:
+            display = time_as_clock(elapsed_seconds)
+            record = {"display": display, "elapsed": elapsed_seconds, "state": "running"}
+
+        if self.json_lines:
+            return (json.dumps(record, separators=(",", ":")) + "\n").encode()
+        return (display + "\n").encode()
+
+    def _writable(self, timeout) -> bool:
+        """
+        Wait up to timeout seconds, or indefinitely if None, for the
+        output to accept a line.
+        """
+        try:
+            _, writable, _ = select.select([], [self.fd], [], timeout)
+        except InterruptedError:
+            return False
+        return bool(writable)
+
+    def _write_pending(self):
+        """
+        Write the pending line. Lines are shorter than PIPE_BUF, so a
+        write to a writable pipe is never split or blocked.
+        """
+        os.write(self.fd, self.pending)
+        self.pending = None
+        self.lines_written += 1
@@ -1,17 +1,40 @@
 """Sage timer implementation."""
 
-import math
-import time
-
 import click
 
 from .clock import Clock
 from .constants import DisplayText, SoundFileName
+from .scheduler import NS_PER_SECOND
 from sage.common.conversions import time_input_to_seconds, hms_to_seconds
 from sage.common.formatting import time_as_clock
+from sage.common.status import KIND_TIMER
 from sage.config import sounds, presets
 
 
+def get_total_seconds(time_input: str) -> int:
+    """
+    Determine a timer duration in seconds based on whether the string
+    represents a preset or not.
+    """
+    if preset := presets.get(time_input):
+        seconds = hms_to_seconds(**preset)
+    else:
+        seconds = time_input_to_seconds(time_input)
+    return validate_total_seconds(seconds)
+
+
+def validate_total_seconds(total_seconds: int) -> int:
+    """
+    Validation check that total seconds is within the required range
+    from 1 second to 24 hours.
+    """
+    if total_seconds <= 0:
+        raise ValueError("Duration must be greater than 0 seconds.")
+    if total_seconds > 86400:
+        raise ValueError("Duration cannot exceed 24 hours.")
+    return total_seconds
+
+
 class Timer(Clock):
     """
     A countdown timer that displays remaining time and plays a sound
@@ -23,13 +46,16 @@ class Timer(Clock):
     counter increment.
     """
 
-    def __init__(self):
-        super().__init__()
+    STATUS_KIND = KIND_TIMER
+
+    def __init__(self, time_source=None):
+        super().__init__(time_source)
         self.time_input = ""
         self.times_up = False
         self.timer_heading = None
         self.total_seconds = 0
         self.quiet = False
+        self.sound = None
 
     def print_duration(self, time_input) -> None:
         """
@@ -53,6 +79,7 @@ class Timer(Clock):
         """
         self._initialize_timer(**kwargs)
         self._setup_timer_display()
+        self._publish_status()
         self._handle_pause_on_start(**kwargs)
         self._start()
 
@@ -61,32 +88,31 @@ class Timer(Clock):
         Initialize timer settings.
         """
         time_input = kwargs.get("time_input", "")
-        self.start_time = time.perf_counter()
+        self.start_time = self.time_source.now_ns()
         self.time_input = time_input
         self.total_seconds = self._get_total_seconds(time_input)
         self.quiet = kwargs.get("quiet", False)
+        self.started = True
 
     def _get_total_seconds(self, time_input):
         """
         Determine the timer duration in seconds based on whether the
         string represents a preset or not.
         """
-        if preset := presets.get(time_input):
-            seconds = hms_to_seconds(**preset)
-        else:
-            seconds = time_input_to_seconds(time_input)
-        return self._validate_total_seconds(seconds)
+        return get_total_seconds(time_input)
+
+    def _get_session_ns(self):
+        """
+        Count no more than the timer's duration, however long it was
+        left open once time was up.
+        """
+        return min(self._get_elapsed_ns(), self.total_seconds * NS_PER_SECOND)
 
-    def _validate_total_seconds(self, total_seconds):
+    def _get_status_details(self):
         """
-        Validation check that total seconds is within the required
-        range from 1 second to 24 hours.
+        Add the duration and preset name to the status file.
         """
-        if total_seconds <= 0:
-            raise ValueError("Duration must be greater than 0 seconds.")
-        if total_seconds > 86400:
-            raise ValueError("Duration cannot exceed 24 hours.")
-        return total_seconds
+        return {"total_seconds": self.total_seconds, "name": self.timer_heading or ""}
 
     def _setup_timer_display(self):
         """
@@ -106,10 +132,22 @@ class Timer(Clock):
 
     def _check_for_sound_warning(self):
         """
-        Check for missing sound file and render warning if so.
+        Resolve the times up sound, rendering a warning if it is missing
+        and otherwise arming the player ahead of expiry.
         """
-        if not sounds.file_exists(SoundFileName.TIMES_UP):
+        self.sound = sounds.SoundPlayer(SoundFileName.TIMES_UP)
+
+        if not self.sound.available:
             self.renderer.render_warning(DisplayText.MISSING_SOUND)
+        elif not self.quiet:
+            self.sound.arm()
+
+    def _cleanup(self):
+        """
+        Stop the armed sound player if the timer quits before expiry.
+        """
+        if self.sound:
+            self.sound.cancel()
 
     def _start(self):
         """
@@ -117,18 +155,28 @@ class Timer(Clock):
         """
         while self._listen_for_keys() != ord("q"):
             self._check_for_resize()
+            self._tick()
             self._update_display()
             self._handle_times_up()
             self._sleep_and_refresh()
 
-    def _listen_for_keys(self):
+    def _handle_key(self, key):
         """
         Turn off pause and counter handling once timer has completed.
         """
         if self.times_up:
-            key = self.renderer.stdscr.getch()
-            return key if key == ord("q") else -1
-        return super()._listen_for_keys()
+            self._handle_perf(key)
+        else:
+            super()._handle_key(key)
+
+    def _get_timeout(self):
+        """
+        Block until a keystroke once the timer has completed, since the
+        display no longer changes.
+        """
+        if self.times_up:
+            return None
+        return super()._get_timeout()
 
     def _update_display(self):
         """
@@ -144,32 +192,37 @@ class Timer(Clock):
         """
         Calculate and return the display time.
         """
-        time_remaining = self._get_time_remaining()
-        display_seconds = math.ceil(time_remaining)
+        remaining_ns = self._get_remaining_ns()
+        display_seconds = -(-remaining_ns // NS_PER_SECOND)
         return time_as_clock(display_seconds)
 
+    def _get_remaining_ns(self):
+        """
+        Calculate and return nanoseconds remaining.
+        """
+        return self.total_seconds * NS_PER_SECOND - self._get_elapsed_ns()
+
     def _get_time_remaining(self):
         """
-        Calculate and return time remaining.
+        Calculate and return seconds remaining.
         """
-        elapsed = self._get_elapsed_time()
-        return self.total_seconds - elapsed
+        return self._get_remaining_ns() / NS_PER_SECOND
 
     def _handle_times_up(self):
         """
         Handle logic for timer completion.
         """
-        if self._get_time_remaining() <= 0 and not self.times_up:
+        if self._get_remaining_ns() <= 0 and not self.times_up:
             self.times_up = True
             self._handle_times_up_sound()
 
         if self.times_up:
             self.renderer.render_times_up_display()
 
-    def _handle_times_up_sound(self, sound_filename = SoundFileName.TIMES_UP):
+    def _handle_times_up_sound(self):
         """
         Handle logic for sound play on timer_completion, no sound
         played if --quiet flag is passed to timer.
         """
         if not self.quiet:
-            sounds.play_file(sound_filename)
+            self.sound.fire(lateness_ns=-self._get_remaining_ns())
@@ -0,0 +1,74 @@
+"""Sage clock time sources."""
+
+import math
+import time
+
+from .scheduler import NS_PER_SECOND
+
+
+class RealTime:
+    """
+    Reads the system's monotonic clock and sleeps in real time.
+    """
+
+    def now_ns(self) -> int:
+        """
+        Return the current time in nanoseconds.
+        """
+        return time.perf_counter_ns()
+
+    def wall_ns(self) -> int:
+        """
+        Return the current wall clock time in nanoseconds since the
+        epoch.
+        """
+        return time.time_ns()
+
+    def sleep(self, seconds: float):
+        """
+        Sleep for the given number of seconds.
+        """
+        time.sleep(seconds)
+
+
+class VirtualTime:
+    """
+    A clock that only moves when told to, for simulating clocks without
+    waiting on them.
+
+    Sleeping advances the time by the full duration instantly, so a
+    clock that sleeps until its next deadline jumps straight to it and
+    a 24 hour timer runs to completion in a fraction of a second. Pass
+    it to MemoryBackend so that the clock loop's waits advance it too.
+    """
+
+    def __init__(self, start_ns: int = 0):
+        self.current_ns = start_ns
+
+    def now_ns(self) -> int:
+        """
+        Return the current virtual time in nanoseconds.
+        """
+        return self.current_ns
+
+    def wall_ns(self) -> int:
+        """
+        Return the current virtual time as nanoseconds since the epoch.
+        """
+        return self.current_ns
+
+    def sleep(self, seconds: float):
+        """
+        Advance the time by the given number of seconds, rounded up to
+        the next nanosecond so a deadline is never fallen short of.
+        """
+        self.advance_ns(math.ceil(seconds * NS_PER_SECOND))
+
+    def advance_ns(self, nanoseconds: int):
+        """
+        Advance the time by the given number of nanoseconds.
+        """
+        self.current_ns += nanoseconds
+
+
+REAL_TIME = RealTime()
@@ -0,0 +1,164 @@
+"""Sage frame tracing."""
+
+import json
+import os
+import time
+from array import array
+
+
+# the clock methods timed on each pass of the clock loop, where defined.
+PHASES = (
+    "_listen_for_keys",
+    "_check_for_resize",
+    "_tick",
+    "_update_display",
+    "_update_due",
+    "_handle_times_up",
+    "_sleep_and_refresh",
+    "_wait_for_event",
+)
+
+FRAME = "frame"
+DEFAULT_CAPACITY = 65536
+
+
+class FrameTracer:
+    """
+    Records how long each phase of the clock loop takes and writes the
+    spans out in Chrome trace event format, for chrome://tracing or
+    Perfetto.
+
+    Tracing is enabled by setting SAGE_TRACE to the path the trace is
+    written to when the clock exits. When it is unset no tracer exists
+    and the clock's methods are untouched, so tracing costs nothing.
+
+    When enabled, instrument() replaces the clock's phase methods on the
+    instance with wrappers that time each call. Spans are stored in a
+    ring buffer preallocated as a flat array of (phase, start, duration)
+    integers, so recording never allocates, and only the most recent
+    capacity spans are kept.
+    """
+
+    def __init__(self, path: str, capacity: int = DEFAULT_CAPACITY):
+        self.path = path
+        self.capacity = capacity
+        self.spans = array("q", bytes(8 * 3 * capacity))
+        self.count = 0
+        self.names = [FRAME]
+        self.origin_ns = time.perf_counter_ns()
+        self.frame_start = None
+
+    @classmethod
+    def from_environment(cls):
+        """
+        Create a tracer if SAGE_TRACE is set, sized by SAGE_TRACE_SPANS.
+        """
+        path = os.environ.get("SAGE_TRACE")
+        if not path:
+            return None
+
+        capacity = int(os.environ.get("SAGE_TRACE_SPANS", DEFAULT_CAPACITY))
+        return cls(path, max(capacity, 1))
+
+    def record(self, name_id: int, start_ns: int, end_ns: int):
+        """
+        Record a span, overwriting the oldest once the buffer is full.
+        """
+        i = self.count % self.capacity * 3
+        self.spans[i] = name_id
+        self.spans[i + 1] = start_ns
+        self.spans[i + 2] = end_ns - start_ns
+        self.count += 1
+
+    def instrument(self, clock):
+        """
+        Time each phase method the clock defines.
+        """
+        for name in PHASES:
+            method = getattr(clock, name, None)
+            if method is None:
+                continue
+
+            self.names.append(name.lstrip("_"))
+            wrapper = self._frame_wrapper if name == "_listen_for_keys" else self._wrapper
+            setattr(clock, name, wrapper(method, len(self.names) - 1))
+
+    def _wrapper(self, method, name_id):
+        """
+        Wrap a method to record a span for each call.
+        """
+        record = self.record
+        perf_counter_ns = time.perf_counter_ns
+
+        def traced(*args, **kwargs):
+            start = perf_counter_ns()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                record(name_id, start, perf_counter_ns())
+
+        return traced
+
+    def _frame_wrapper(self, method, name_id):
+        """
+        Wrap the first method of the loop, which also marks the end of
+        the previous frame and the start of the next.
+        """
+        traced = self._wrapper(method, name_id)
+
+        def traced_frame(*args, **kwargs):
+            start = time.perf_counter_ns()
+            if self.frame_start is not None:
+                self.record(0, self.frame_start, start)
+            self.frame_start = start
+            return traced(*args, **kwargs)
+
+        return traced_frame
+
+    @property
+    def dropped(self) -> int:
+        """
+        The number of spans overwritten because the buffer was full.
+        """
+        return max(self.count - self.capacity, 0)
+
+    def events(self) -> list[dict]:
+        """
+        Return the recorded spans as trace events, oldest first.
+        """
+        pid = os.getpid()
+        events = [{
+            "name": "process_name",
+            "ph": "M",
+            "pid": pid,
+            "tid": 0,
+            "args": {"name": "sage"},
+        }]
+
+        first = self.count - min(self.count, self.capacity)
+        for n in range(first, self.count):
+            i = n % self.capacity * 3
+            name_id, start_ns, duration_ns = self.spans[i:i + 3]
+            events.append({
+                "name": self.names[name_id],
+                "cat": "frame" if name_id == 0 else "phase",
+                "ph": "X",
+                "pid": pid,
+                "tid": 0,
+                "ts": (start_ns - self.origin_ns) / 1000,
+                "dur": duration_ns / 1000,
+            })
+
+        return events
+
+    def dump(self):
+        """
+        Write the trace to the SAGE_TRACE path.
+        """
+        trace = {
+            "traceEvents": self.events(),
+            "displayTimeUnit": "ms",
+            "otherData": {"spans": self.count, "dropped": self.dropped},
+        }
+        with open(self.path, "w") as f:
+            json.dump(trace, f)
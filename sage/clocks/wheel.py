@@ -0,0 +1,315 @@
+"""Sage hierarchical timing wheel."""
+
+from .scheduler import NS_PER_MILLISECOND, NS_PER_SECOND
+
+
+class WheelTimer:
+    """
+    A countdown scheduled on a TimingWheel.
+
+    Like Clock, a timer tracks pause_start and pause_time so that its
+    deadline is start_ns + pause_time + duration_ns, and time spent
+    paused is never counted against it.
+    """
+
+    __slots__ = (
+        "start_ns",
+        "duration_ns",
+        "pause_start",
+        "pause_time",
+        "paused",
+        "data",
+        "expires",
+        "slot",
+    )
+
+    def __init__(self, start_ns: int, duration_ns: int, data=None):
+        self.start_ns = start_ns
+        self.duration_ns = duration_ns
+        self.pause_start = 0
+        self.pause_time = 0
+        self.paused = False
+        self.data = data
+        self.expires = 0
+        self.slot = None
+
+    @property
+    def deadline_ns(self) -> int:
+        """
+        The time the timer expires, assuming it isn't paused again.
+        """
+        return self.start_ns + self.pause_time + self.duration_ns
+
+    def remaining_ns(self, now_ns: int) -> int:
+        """
+        Calculate the nanoseconds remaining at now_ns.
+        """
+        if self.paused:
+            now_ns = self.pause_start
+        return self.deadline_ns - now_ns
+
+    @property
+    def scheduled(self) -> bool:
+        """
+        Whether the timer is waiting on the wheel.
+        """
+        return self.slot is not None
+
+
+class TimingWheel:
+    """
+    Schedules very many timers with O(1) insert and cancel and amortized
+    O(1) expiry.
+
+    Time is divided into ticks of tick_ns. The wheel has LEVELS levels of
+    SLOTS slots each: level 0 holds timers expiring within SLOTS ticks,
+    one tick per slot, and each level above covers SLOTS times the span
+    of the one below. A timer is placed on the lowest level whose span
+    covers its delay, and when time enters a higher-level slot its
+    timers cascade down to finer levels until they reach level 0 and
+    expire.
+
+    Slots are insertion-ordered dicts so a timer can be removed from its
+    slot in constant time, and each level keeps a bitmap of its occupied
+    slots. advance() uses the bitmaps to jump straight to the next tick
+    where a slot is entered, so an idle wheel costs nothing no matter how
+    far time moves.
+    """
+
+    SLOT_BITS = 6
+    SLOTS = 1 << SLOT_BITS
+    LEVELS = 6
+
+    def __init__(self, now_ns: int = 0, tick_ns: int = NS_PER_MILLISECOND):
+        self.tick_ns = tick_ns
+        self.current = now_ns // tick_ns
+        self.levels = [[{} for _ in range(self.SLOTS)] for _ in range(self.LEVELS)]
+        self.bitmaps = [0] * self.LEVELS
+        self.ready = {}
+        self.count = 0
+        # the next tick at which a slot is entered, or None if unknown.
+        # Cancelling leaves it alone, since entering an empty slot early
+        # is harmless.
+        self.next_tick = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def max_delay_ns(self) -> int:
+        """
+        The longest delay the wheel can schedule.
+        """
+        return ((1 << (self.SLOT_BITS * self.LEVELS)) - 1) * self.tick_ns
+
+    def schedule(self, now_ns: int, duration_ns: int, data=None) -> WheelTimer:
+        """
+        Schedule a timer expiring duration_ns after now_ns.
+        """
+        timer = WheelTimer(now_ns, duration_ns, data)
+        self._insert(timer)
+        return timer
+
+    def cancel(self, timer: WheelTimer):
+        """
+        Remove a timer from the wheel before it expires.
+        """
+        if timer.slot is not None:
+            self._remove(timer)
+
+    def pause(self, timer: WheelTimer, now_ns: int):
+        """
+        Pause a timer, taking it off the wheel until it is resumed.
+        """
+        if timer.paused:
+            return
+        self.cancel(timer)
+        timer.pause_start = now_ns
+        timer.paused = True
+
+    def resume(self, timer: WheelTimer, now_ns: int):
+        """
+        Resume a paused timer, pushing its deadline back by the time it
+        spent paused.
+        """
+        if not timer.paused:
+            return
+        timer.pause_time += now_ns - timer.pause_start
+        timer.pause_start = 0
+        timer.paused = False
+        self._insert(timer)
+
+    def advance(self, now_ns: int) -> list[WheelTimer]:
+        """
+        Move the wheel forward to now_ns and return the timers that have
+        expired, in deadline order.
+        """
+        target = now_ns // self.tick_ns
+        expired = []
+
+        while self.count:
+            if self.ready:
+                expired += self._pop_slot(self.ready)
+                continue
+
+            if self.next_tick is None:
+                self.next_tick = self._next_event_tick()
+            tick = self.next_tick
+            if tick > target:
+                break
+
+            self.current = tick
+            self.next_tick = None
+            for level in range(self.LEVELS - 1, 0, -1):
+                if tick & ((1 << (self.SLOT_BITS * level)) - 1) == 0:
+                    self._cascade(level, (tick >> (self.SLOT_BITS * level)) & (self.SLOTS - 1))
+            expired += self._pop_level_slot(0, tick & (self.SLOTS - 1))
+
+        self.current = max(self.current, target)
+        if self.next_tick is not None and self.next_tick <= self.current:
+            # left behind by a cancelled timer once the wheel emptied.
+            self.next_tick = None
+        return expired
+
+    def next_deadline_ns(self) -> int | None:
+        """
+        Return when advance() next has work to do, or None if the wheel
+        is empty. This may be a cascade rather than an expiry, so it is a
+        lower bound on the next expiry.
+        """
+        if not self.count:
+            return None
+        if self.ready:
+            return self.current * self.tick_ns
+        if self.next_tick is None:
+            self.next_tick = self._next_event_tick()
+        return self.next_tick * self.tick_ns
+
+    def timeout(self, now_ns: int) -> float | None:
+        """
+        Return the seconds until advance() next has work to do, or None
+        if the wheel is empty.
+        """
+        deadline_ns = self.next_deadline_ns()
+        if deadline_ns is None:
+            return None
+        return max(deadline_ns - now_ns, 0) / NS_PER_SECOND
+
+    def _insert(self, timer: WheelTimer):
+        """
+        Place a timer in the slot covering its expiry tick.
+        """
+        # round up so that timers never expire early.
+        timer.expires = -(-timer.deadline_ns // self.tick_ns)
+        self.count += 1
+        self._place(timer)
+
+    def _place(self, timer: WheelTimer):
+        """
+        Place a counted timer on the lowest level whose span covers its
+        delay, or in the ready set if it is already due.
+        """
+        delay = timer.expires - self.current
+        if delay <= 0:
+            timer.slot = self.ready
+            self.ready[timer] = None
+            return
+
+        level = (delay.bit_length() - 1) // self.SLOT_BITS
+        if level >= self.LEVELS:
+            self.count -= 1
+            raise ValueError("Timer delay exceeds the timing wheel's range.")
+
+        shift = self.SLOT_BITS * level
+        index = (timer.expires >> shift) & (self.SLOTS - 1)
+        timer.slot = self.levels[level][index]
+        timer.slot[timer] = None
+        self.bitmaps[level] |= 1 << index
+
+        # the slot is entered once time reaches the expiry tick with the
+        # bits below this level cleared.
+        entered = timer.expires >> shift << shift
+        if self.next_tick is not None and entered < self.next_tick:
+            self.next_tick = entered
+
+    def _remove(self, timer: WheelTimer):
+        """
+        Take a timer out of its slot.
+        """
+        slot = timer.slot
+        del slot[timer]
+        timer.slot = None
+        self.count -= 1
+
+        if not slot and slot is not self.ready:
+            for level, slots in enumerate(self.levels):
+                index = (timer.expires >> (self.SLOT_BITS * level)) & (self.SLOTS - 1)
+                if slots[index] is slot:
+                    self.bitmaps[level] &= ~(1 << index)
+                    break
+
+    def _pop_slot(self, slot: dict) -> list[WheelTimer]:
+        """
+        Empty a slot, returning its timers.
+        """
+        timers = list(slot)
+        slot.clear()
+        for timer in timers:
+            timer.slot = None
+        self.count -= len(timers)
+        return timers
+
+    def _pop_level_slot(self, level: int, index: int) -> list[WheelTimer]:
+        """
+        Empty a slot of a level, clearing its bit in the level's bitmap.
+        """
+        self.bitmaps[level] &= ~(1 << index)
+        return self._pop_slot(self.levels[level][index])
+
+    def _cascade(self, level: int, index: int):
+        """
+        Redistribute the timers of a higher-level slot that time has
+        just entered onto finer levels.
+        """
+        if not self.bitmaps[level] >> index & 1:
+            return
+        for timer in self._pop_level_slot(level, index):
+            self.count += 1
+            self._place(timer)
+
+    def _next_event_tick(self) -> int:
+        """
+        Return the next tick at which an occupied slot is entered. A
+        slot index at or behind the current one on its level belongs to
+        the level's next rotation.
+        """
+        if self.ready:
+            return self.current
+
+        # slots ahead on level 0 are entered before any higher level
+        # slot, since those are only entered on a level 0 rotation.
+        ahead = self.bitmaps[0] >> ((self.current & (self.SLOTS - 1)) + 1)
+        if ahead:
+            return self.current + (ahead & -ahead).bit_length()
+
+        next_tick = None
+        for level, bits in enumerate(self.bitmaps):
+            if not bits:
+                continue
+
+            shift = self.SLOT_BITS * level
+            position = self.current >> shift
+            index = position & (self.SLOTS - 1)
+
+            ahead = bits >> (index + 1)
+            if ahead:
+                offset = (ahead & -ahead).bit_length()
+            else:
+                behind = bits & ((1 << (index + 1)) - 1)
+                offset = self.SLOTS - index + (behind & -behind).bit_length() - 1
+
+            tick = (position + offset) << shift
+            if next_tick is None or tick < next_tick:
+                next_tick = tick
+
+        return next_tick
@@ -1,11 +1,31 @@
 """Sage time conversions."""
 
+import functools
 import re
 from typing import TypeAlias
 
 
 HoursMinutesSeconds: TypeAlias = tuple[int, int, int]
 
+UNIT_SECONDS = {
+    "h": 3600, "hr": 3600, "hrs": 3600, "hour": 3600, "hours": 3600,
+    "m": 60, "min": 60, "mins": 60, "minute": 60, "minutes": 60,
+    "s": 1, "sec": 1, "secs": 1, "second": 1, "seconds": 1,
+}
+
+# one duration token, optionally preceded by separators: either clock
+# notation (1:30:00, 5:30) or a number with an optional unit (1.5h, 90).
+_DURATION_TOKEN = re.compile(
+    r"""
+    (?:[\s,]+|[\s,]*\band\s+)?
+    (?:
+        (?P<clock>\d+(?::\d+){1,2})
+      | (?P<value>\d+(?:\.\d+)?|\.\d+) \s* (?P<unit>[a-z]+)?
+    )
+    """,
+    re.VERBOSE | re.IGNORECASE,
+)
+
 
 def hms_to_seconds(hours=0, minutes=0, seconds=0) -> int:
     """
@@ -24,21 +44,56 @@ def seconds_to_hms(total_seconds: float) -> HoursMinutesSeconds:
     return (hours, minutes, seconds)
 
 
+@functools.lru_cache(maxsize=1024)
 def time_input_to_seconds(time_input: str) -> int:
     """
     Convert a human-readable time string to total seconds.
+
+    Accepts units ("1h 30m", "3min40s"), decimals ("1.5h"), clock
+    notation ("1:30:00", "5:30") and bare numbers of seconds ("90").
+    Repeated units are summed. A whole number after the last unit is
+    in the next smaller unit ("1h30", "5m30"). Any other bare number
+    must be the whole input. Input that doesn't fully parse as a
+    duration converts to 0 seconds.
     """
+    text = time_input.strip()
+    position = 0
+    total = 0.0
+    previous_factor = None
+
+    while position < len(text):
+        match = _DURATION_TOKEN.match(text, position)
+        if not match:
+            return 0
+
+        if clock := match.group("clock"):
+            parts = [int(part) for part in clock.split(":")]
+            factors = (3600, 60, 1) if len(parts) == 3 else (60, 1)
+            total += sum(part * factor for part, factor in zip(parts, factors))
+            previous_factor = None
+        else:
+            value = match.group("value")
+            last = match.end() == len(text)
+
+            if unit := match.group("unit"):
+                factor = UNIT_SECONDS.get(unit.lower())
+                if factor is None:
+                    return 0
+            elif last and position == 0:
+                factor = 1
+            elif last and previous_factor in (3600, 60) and value.isdigit():
+                factor = previous_factor // 60
+            else:
+                # bare numbers next to each other, or malformed ones like
+                # "1.5.5", aren't durations.
+                return 0
 
-    def extract_time_value(pattern: str) -> int:
-        match = re.search(pattern, time_input)
-        return int(match.group(1)) if match else 0
+            total += float(value) * factor
+            previous_factor = factor
 
-    hours = extract_time_value(r"(\d+)\s*(h|hour|hours)")
-    minutes = extract_time_value(r"(\d+)\s*(m|min|minute|minutes)")
-    seconds = extract_time_value(r"(\d+)\s*(s|sec|second|seconds)")
-    total = hours * 3600 + minutes * 60 + seconds
+        position = match.end()
 
-    return total
+    return round(total)
 
 
 def time_input_to_hms(time_input: str) -> HoursMinutesSeconds:
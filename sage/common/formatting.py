@@ -2,6 +2,8 @@
 
 from .conversions import seconds_to_hms
 
+NS_PER_SECOND = 1_000_000_000
+
 
 def time_as_clock(total_seconds: float, include_centiseconds=False) -> str:
     """
@@ -17,6 +19,16 @@ def time_as_clock(total_seconds: float, include_centiseconds=False) -> str:
     return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
 
+def nanoseconds_as_decimal(nanoseconds: int) -> str:
+    """
+    Format integer nanoseconds as exact decimal seconds, e.g.
+    1500000000 as 1.500000000.
+    """
+    sign = "-" if nanoseconds < 0 else ""
+    seconds, remainder = divmod(abs(nanoseconds), NS_PER_SECOND)
+    return f"{sign}{seconds}.{remainder:09d}"
+
+
 def time_in_english(total_seconds: float) -> str:
     """
     Take a time in total seconds, convert it to the correct time units
@@ -0,0 +1,246 @@
+"""Sage clock history."""
+
+import datetime
+import mmap
+import os
+import struct
+import time
+
+from .formatting import NS_PER_SECOND
+
+
+# the history log is a header of magic and version followed by fixed
+# width little-endian records, one per clock session, appended on exit.
+MAGIC = b"SAGH"
+VERSION = 1
+HEADER = struct.Struct("<4sH2x")
+RECORD = struct.Struct("<qqqqIIB7x")
+RECORD_FIELDS = ("start_ns", "end_ns", "duration_ns", "pause_ns", "name_id", "count", "kind")
+
+GROUPINGS = ("day", "week", "preset")
+NO_PRESET = "(no preset)"
+
+# every UTC offset is a whole number of quarter hours, so all starts in
+# the same quarter hour fall on the same local day.
+NS_PER_QUARTER_HOUR = 900 * NS_PER_SECOND
+
+
+def get_history_file() -> str:
+    """
+    Get the path of the history log, from SAGE_HISTORY_FILE if set,
+    otherwise in the user's data directory.
+    """
+    if path := os.environ.get("SAGE_HISTORY_FILE"):
+        return path
+
+    from platformdirs import user_data_dir
+    return os.path.join(user_data_dir("sage"), "history")
+
+
+def get_names_file(path: str) -> str:
+    """
+    Get the path of the preset names stored alongside a history log.
+    Names are kept one per line and a record's name_id is the line
+    number, so each record stays fixed width.
+    """
+    return path + ".names"
+
+
+def append_session(
+    start_ns: int,
+    end_ns: int,
+    duration_ns: int,
+    pause_ns: int,
+    kind: int,
+    name: str = "",
+    count: int = 0,
+    path: str | None = None,
+):
+    """
+    Append a clock session to the history log, creating it if needed.
+    Times are nanoseconds since the epoch. Each record is appended with
+    a single write, so concurrent clocks never interleave records.
+    """
+    path = path or get_history_file()
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    name_id = _get_name_id(get_names_file(path), name) if name else 0
+    record = RECORD.pack(start_ns, end_ns, duration_ns, pause_ns, name_id, count, kind)
+
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_EXCL, 0o600)
+        record = HEADER.pack(MAGIC, VERSION) + record
+    except FileExistsError:
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND)
+
+    try:
+        os.write(fd, record)
+    finally:
+        os.close(fd)
+
+
+def _get_name_id(names_path: str, name: str) -> int:
+    """
+    Return the id of a preset name, appending it to the names file if it
+    isn't there yet.
+    """
+    name = name.replace("\n", " ")
+    try:
+        with open(names_path, encoding="utf-8") as f:
+            names = f.read().splitlines()
+    except FileNotFoundError:
+        names = []
+
+    if name in names:
+        return names.index(name) + 1
+
+    # a name appended by two clocks at once gets two ids, which read_names
+    # maps back to the same name.
+    with open(names_path, "a", encoding="utf-8") as f:
+        f.write(name + "\n")
+    return len(names) + 1
+
+
+def read_names(path: str) -> dict[int, str]:
+    """
+    Read the preset names of a history log, keyed on name_id.
+    """
+    try:
+        with open(get_names_file(path), encoding="utf-8") as f:
+            return {name_id: name for name_id, name in enumerate(f.read().splitlines(), 1)}
+    except FileNotFoundError:
+        return {}
+
+
+def summarize(by: str = "day", path: str | None = None) -> list[tuple[str, int, int, int]]:
+    """
+    Aggregate the history log by local day of the session start, ISO
+    week or preset name, returning (label, sessions, duration_ns,
+    count) rows sorted by label.
+
+    The log is memory-mapped and read in a single pass. If numpy is
+    installed, records are read as a structured array and aggregated
+    with vectorized operations, otherwise they are unpacked with
+    struct.iter_unpack.
+    """
+    if by not in GROUPINGS:
+        raise ValueError(f"History can only be grouped by {', '.join(GROUPINGS)}.")
+
+    path = path or get_history_file()
+    names = read_names(path)
+
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except FileNotFoundError:
+        return []
+
+    try:
+        size = os.fstat(fd).st_size
+        # a record still being appended is left out.
+        records = (size - HEADER.size) // RECORD.size
+        if records <= 0:
+            return []
+
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as history_map:
+            if HEADER.unpack_from(history_map, 0) != (MAGIC, VERSION):
+                raise ValueError("The history file is not a Sage history log.")
+
+            try:
+                import numpy
+            except ImportError:
+                totals = _summarize_records(history_map, records, by, names)
+            else:
+                totals = _summarize_array(numpy, history_map, records, by, names)
+    finally:
+        os.close(fd)
+
+    return [(label, *totals[label]) for label in sorted(totals)]
+
+
+def _summarize_records(history_map, records: int, by: str, names: dict[int, str]) -> dict:
+    """
+    Aggregate records unpacked one at a time. Records are totalled by
+    preset id or start quarter hour first, and the totals merged by
+    label afterwards, so the pass itself does no date arithmetic.
+    """
+    key_totals = {}
+    end = HEADER.size + records * RECORD.size
+
+    with memoryview(history_map)[HEADER.size:end] as view:
+        if by == "preset":
+            for _, _, duration_ns, _, name_id, count, _ in RECORD.iter_unpack(view):
+                if (total := key_totals.get(name_id)) is None:
+                    key_totals[name_id] = [1, duration_ns, count]
+                else:
+                    total[0] += 1
+                    total[1] += duration_ns
+                    total[2] += count
+        else:
+            for start_ns, _, duration_ns, _, _, count, _ in RECORD.iter_unpack(view):
+                quarter = start_ns // NS_PER_QUARTER_HOUR
+                if (total := key_totals.get(quarter)) is None:
+                    key_totals[quarter] = [1, duration_ns, count]
+                else:
+                    total[0] += 1
+                    total[1] += duration_ns
+                    total[2] += count
+
+    totals = {}
+    for key, key_total in key_totals.items():
+        label = names.get(key, NO_PRESET) if by == "preset" else _get_label(key, by)
+        if (total := totals.get(label)) is None:
+            totals[label] = key_total
+        else:
+            for i, value in enumerate(key_total):
+                total[i] += value
+    return totals
+
+
+def _summarize_array(numpy, history_map, records: int, by: str, names: dict[int, str]) -> dict:
+    """
+    Aggregate records as a numpy structured array. Keys are reduced to
+    their unique values first, so labels are only computed once each.
+    """
+    dtype = numpy.dtype(
+        {
+            "names": RECORD_FIELDS,
+            "formats": ["<i8", "<i8", "<i8", "<i8", "<u4", "<u4", "u1"],
+            "offsets": [0, 8, 16, 24, 32, 36, 40],
+            "itemsize": RECORD.size,
+        }
+    )
+    array = numpy.frombuffer(history_map, dtype=dtype, count=records, offset=HEADER.size)
+
+    if by == "preset":
+        keys, key_index = numpy.unique(array["name_id"], return_inverse=True)
+        key_labels = [names.get(int(key), NO_PRESET) for key in keys]
+    else:
+        keys, key_index = numpy.unique(array["start_ns"] // NS_PER_QUARTER_HOUR, return_inverse=True)
+        key_labels = [_get_label(int(key), by) for key in keys]
+
+    label_names, label_of_key = numpy.unique(key_labels, return_inverse=True)
+    label_index = label_of_key[key_index.reshape(-1)]
+
+    sessions = numpy.bincount(label_index, minlength=len(label_names))
+    # summed as integers, float weights would lose nanoseconds.
+    durations = numpy.zeros(len(label_names), dtype=numpy.int64)
+    numpy.add.at(durations, label_index, array["duration_ns"])
+    counts = numpy.zeros(len(label_names), dtype=numpy.int64)
+    numpy.add.at(counts, label_index, array["count"])
+
+    return {
+        str(label): [int(sessions[i]), int(durations[i]), int(counts[i])]
+        for i, label in enumerate(label_names)
+    }
+
+
+def _get_label(quarter: int, by: str) -> str:
+    """
+    Return the local day or ISO week label of a quarter hour since the
+    epoch.
+    """
+    local = time.localtime(quarter * 900)
+    date = datetime.date(local.tm_year, local.tm_mon, local.tm_mday)
+    if by == "week":
+        year, week, _ = date.isocalendar()
+        return f"{year}-W{week:02d}"
+    return date.isoformat()
@@ -0,0 +1,277 @@
+"""Sage running clock status."""
+
+import itertools
+import mmap
+import os
+import struct
+import time
+
+from .formatting import NS_PER_SECOND, time_as_clock
+
+
+# the status file is a fixed layout of little-endian fields: a header of
+# magic and version, a sequence number, then the clock state.
+MAGIC = b"SAGE"
+VERSION = 1
+NAME_BYTES = 64
+HEADER = struct.Struct("<4sH2x")
+SEQUENCE = struct.Struct("<I")
+BODY = struct.Struct(f"<IBB2xqqqII{NAME_BYTES}s")
+SEQUENCE_OFFSET = HEADER.size
+BODY_OFFSET = SEQUENCE_OFFSET + SEQUENCE.size
+SIZE = BODY_OFFSET + BODY.size
+
+KIND_NONE = 0
+KIND_TIMER = 1
+KIND_STOPWATCH = 2
+
+READ_ATTEMPTS = 100
+
+# numbers the status files of writers within a process.
+_writer_ids = itertools.count(1)
+
+
+def get_status_file() -> str:
+    """
+    Get the path of the status file, from SAGE_STATUS_FILE if set,
+    otherwise in the user's runtime directory. Each clock writes its own
+    file named after this path, so that clocks never overwrite each
+    other's status.
+    """
+    if path := os.environ.get("SAGE_STATUS_FILE"):
+        return path
+
+    # platformdirs resolves the same directory from XDG_RUNTIME_DIR, but
+    # is slow to import for a command run on every shell prompt.
+    if runtime_dir := os.environ.get("XDG_RUNTIME_DIR"):
+        return os.path.join(runtime_dir, "sage", "status")
+
+    import warnings
+
+    from platformdirs import user_runtime_dir
+
+    # platformdirs warns when it falls back to a temporary directory,
+    # which would end up in the user's prompt.
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return os.path.join(user_runtime_dir("sage"), "status")
+
+
+class Status:
+    """
+    A snapshot of a running clock's state.
+
+    Times are the clock's own perf_counter_ns() readings, which are
+    system-wide on every supported platform, so another process can
+    compute the current display from them.
+    """
+
+    __slots__ = (
+        "pid",
+        "kind",
+        "paused",
+        "start_ns",
+        "pause_start",
+        "pause_time",
+        "total_seconds",
+        "count",
+        "name",
+    )
+
+    def __init__(self, pid, kind, paused, start_ns, pause_start, pause_time, total_seconds, count, name):
+        self.pid = pid
+        self.kind = kind
+        self.paused = bool(paused)
+        self.start_ns = start_ns
+        self.pause_start = pause_start
+        self.pause_time = pause_time
+        self.total_seconds = total_seconds
+        self.count = count
+        self.name = name
+
+    def elapsed_ns(self, now_ns: int) -> int:
+        """
+        Calculate the elapsed nanoseconds at now_ns, as Clock does.
+        """
+        if self.paused:
+            now_ns = self.pause_start
+        return now_ns - self.start_ns - self.pause_time
+
+    def display(self, now_ns: int | None = None) -> str:
+        """
+        Format the clock's current time, prefixed with its preset name.
+        """
+        if now_ns is None:
+            now_ns = time.perf_counter_ns()
+        elapsed_ns = self.elapsed_ns(now_ns)
+
+        if self.kind == KIND_TIMER:
+            remaining_ns = self.total_seconds * NS_PER_SECOND - elapsed_ns
+            if remaining_ns <= 0:
+                text = "Time's up!"
+            else:
+                text = time_as_clock(-(-remaining_ns // NS_PER_SECOND))
+        else:
+            text = time_as_clock(elapsed_ns // NS_PER_SECOND)
+
+        if self.paused:
+            text += " (paused)"
+        return f"{self.name} {text}" if self.name else text
+
+
+class StatusWriter:
+    """
+    Publishes a running clock's state to its own memory-mapped status
+    file, the status path suffixed with the process id and a number for
+    the writer within the process. The file is removed when the clock
+    exits, so one clock exiting never clears another's status.
+
+    Updates are guarded by a sequence lock: the sequence number is odd
+    while the body is being written, so readers retry until they see
+    the same even number before and after copying the body. Clocks only
+    publish when their state changes, never per frame.
+    """
+
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(path) or ".", mode=0o700, exist_ok=True)
+        self.path = f"{path}.{os.getpid()}.{next(_writer_ids)}"
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if os.fstat(fd).st_size != SIZE:
+                os.ftruncate(fd, SIZE)
+            self.map = mmap.mmap(fd, SIZE)
+        finally:
+            os.close(fd)
+
+        HEADER.pack_into(self.map, 0, MAGIC, VERSION)
+
+    @classmethod
+    def open(cls, path: str | None = None):
+        """
+        Open the status file for writing, or return None if it can't be
+        created.
+        """
+        try:
+            return cls(path or get_status_file())
+        except (OSError, ValueError):
+            return None
+
+    def publish(self, kind, paused, start_ns, pause_start, pause_time, total_seconds=0, count=0, name=""):
+        """
+        Write the clock state under the sequence lock.
+        """
+        (sequence,) = SEQUENCE.unpack_from(self.map, SEQUENCE_OFFSET)
+        sequence |= 1
+        SEQUENCE.pack_into(self.map, SEQUENCE_OFFSET, sequence)
+        BODY.pack_into(
+            self.map,
+            BODY_OFFSET,
+            os.getpid(),
+            kind,
+            paused,
+            start_ns,
+            pause_start,
+            pause_time,
+            total_seconds,
+            count,
+            name.encode()[:NAME_BYTES],
+        )
+        SEQUENCE.pack_into(self.map, SEQUENCE_OFFSET, (sequence + 1) & 0xFFFFFFFF)
+
+    def close(self):
+        """
+        Mark the clock as stopped, for readers that already opened the
+        file, then unmap and remove it.
+        """
+        self.publish(KIND_NONE, False, 0, 0, 0)
+        self.map.close()
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+
+def read_status(path: str | None = None) -> Status | None:
+    """
+    Read a consistent snapshot of the most recently started running
+    clock, or None if no clock is running.
+    """
+    directory, prefix = os.path.split(path or get_status_file())
+    try:
+        names = os.listdir(directory or ".")
+    except OSError:
+        return None
+
+    latest = None
+    for name in names:
+        if name.startswith(prefix + "."):
+            snapshot = _read_status_file(os.path.join(directory, name))
+            if snapshot and (latest is None or snapshot.start_ns > latest.start_ns):
+                latest = snapshot
+    return latest
+
+
+def _read_status_file(path: str) -> Status | None:
+    """
+    Read a consistent snapshot of the clock writing a status file, or
+    None if it isn't running. Files left by clocks that died are
+    removed.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+
+    try:
+        with mmap.mmap(fd, SIZE, access=mmap.ACCESS_READ) as status_map:
+            if HEADER.unpack_from(status_map, 0) != (MAGIC, VERSION):
+                return None
+            fields = _read_body(status_map)
+    except (OSError, ValueError):
+        return None
+    finally:
+        os.close(fd)
+
+    if fields is None or fields[1] == KIND_NONE:
+        return None
+    if not _is_running(fields[0]):
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+        return None
+
+    *fields, name = fields
+    return Status(*fields, name.rstrip(b"\0").decode(errors="replace"))
+
+
+def _read_body(status_map) -> tuple | None:
+    """
+    Copy the body once no write is in progress and none happened while
+    it was copied.
+    """
+    for _ in range(READ_ATTEMPTS):
+        (before,) = SEQUENCE.unpack_from(status_map, SEQUENCE_OFFSET)
+        if before & 1:
+            continue
+        fields = BODY.unpack_from(status_map, BODY_OFFSET)
+        (after,) = SEQUENCE.unpack_from(status_map, SEQUENCE_OFFSET)
+        if before == after:
+            return fields
+    return None
+
+
+def _is_running(pid: int) -> bool:
+    """
+    Check that the process that published the status is still alive.
+    """
+    if os.name != "posix":
+        return True
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
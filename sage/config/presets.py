@@ -1,25 +1,59 @@
 """Sage preset configurations."""
 
+import functools
 import json
+import os
+import stat
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import TypeAlias
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
 import click
-from platformdirs import user_config_dir
 
 from sage.common.conversions import time_input_to_hms, hms_to_seconds
 
 
 PresetDict: TypeAlias = dict[str, int]
 PresetsDict: TypeAlias = dict[str, PresetDict]
+CacheKey: TypeAlias = tuple[int, int]
+
+# parsed presets keyed on file path, validated against the file's size
+# and modification time so external edits are picked up.
+_cache: dict[Path, tuple[CacheKey, PresetsDict]] = {}
+
+# nesting depth of _locked() in this process, the file lock itself is
+# only taken by the outermost caller.
+_lock_depth = 0
 
 
 def get_json_file() -> Path:
     """
-    Retrieve path to the JSON file storing presets.
+    Retrieve path to the JSON file storing presets, in SAGE_CONFIG_DIR if
+    set and otherwise in the user's config directory.
+    """
+    return _json_file_in(os.environ.get("SAGE_CONFIG_DIR"))
+
+
+@functools.cache
+def _json_file_in(config_dir: str | None) -> Path:
+    """
+    Resolve the presets file in a config directory, or in the user's
+    config directory if None. Each directory is resolved and created
+    once per process.
     """
     try:
-        config_dir = Path(user_config_dir("sage"))
+        if not config_dir:
+            from platformdirs import user_config_dir
+            config_dir = user_config_dir("sage")
+
+        config_dir = Path(config_dir)
         config_dir.mkdir(parents=True, exist_ok=True)
         return config_dir / "presets.json"
 
@@ -28,6 +62,38 @@ def get_json_file() -> Path:
         return Path.home() / ".sage_presets.json"
 
 
+def _sqlite_store():
+    """
+    Return the SQLite store module if presets are stored in SQLite rather
+    than JSON (chosen with SAGE_PRESET_STORE=sqlite), otherwise None.
+    It is imported lazily so the JSON store doesn't load sqlite3.
+    """
+    if os.environ.get("SAGE_PRESET_STORE", "json").lower() != "sqlite":
+        return None
+
+    from sage.config import presets_db
+    return presets_db
+
+
+def _db():
+    """
+    Return the connection to the SQLite preset store, migrating the JSON
+    presets into it the first time it is opened.
+    """
+    db_file = get_json_file().with_name("presets.db")
+    return _sqlite_store().connect(db_file, _json_seed)
+
+
+def _json_seed() -> PresetsDict:
+    """
+    Return the presets a new SQLite store starts with, those in the JSON
+    file if there is one and the defaults otherwise.
+    """
+    if get_json_file().exists():
+        return dict(_load_cached())
+    return create_defaults()
+
+
 def create_defaults() -> PresetsDict:
     """
     Create and return default presets.
@@ -40,34 +106,167 @@ def create_defaults() -> PresetsDict:
     }
 
 
-def load_all() -> PresetsDict:
+def _acquire(lock_file) -> None:
     """
-    Load and return presets, creating defaults if the file doesn't exist.
+    Block until an exclusive lock on the open lock file is acquired.
+    """
+    if fcntl:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        return
+
+    lock_file.seek(0)
+    while True:
+        try:
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            continue
+
+
+def _release(lock_file) -> None:
+    """
+    Release the lock on the open lock file.
+    """
+    if fcntl:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+        return
+
+    lock_file.seek(0)
+    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def _locked():
+    """
+    Hold an exclusive advisory lock on the presets file so that
+    read-modify-write operations from concurrent sage processes don't
+    lose each other's updates. Re-entrant within a process.
+    """
+    global _lock_depth
+
+    if _lock_depth:
+        _lock_depth += 1
+        try:
+            yield
+        finally:
+            _lock_depth -= 1
+        return
+
+    presets_file = get_json_file()
+    lock_path = presets_file.with_name(presets_file.name + ".lock")
+
+    with open(lock_path, "a+b") as lock_file:
+        _acquire(lock_file)
+        _lock_depth = 1
+        try:
+            yield
+        finally:
+            _lock_depth = 0
+            _release(lock_file)
+
+
+def _cache_key(presets_file: Path) -> CacheKey:
+    """
+    Return the size and modification time used to validate the cache.
+    """
+    stat = presets_file.stat()
+    return (stat.st_size, stat.st_mtime_ns)
+
+
+def _create_defaults_file(presets_file: Path) -> None:
+    """
+    Write the default presets unless another process got there first.
+    """
+    with _locked():
+        if not presets_file.exists():
+            save_all(create_defaults())
+
+
+def _load_cached(fresh: bool = False) -> PresetsDict:
+    """
+    Return the cached presets, reparsing the file only if it changed
+    since it was last read or written, or always if fresh is set. The
+    result must not be mutated.
     """
     presets_file = get_json_file()
 
     if not presets_file.exists():
-        default_presets = create_defaults()
-        save_all(default_presets)
-        return default_presets
+        _create_defaults_file(presets_file)
+
+    key = _cache_key(presets_file)
+    cached = _cache.get(presets_file)
+    if cached and cached[0] == key and not fresh:
+        return cached[1]
 
     try:
         with open(presets_file, "r") as f:
-            return json.load(f)
+            presets = json.load(f)
 
     except Exception:
         return create_defaults()
 
+    _cache[presets_file] = (key, presets)
+    return presets
+
+
+def load_all() -> PresetsDict:
+    """
+    Load and return presets, creating defaults if the file doesn't exist.
+    """
+    if store := _sqlite_store():
+        return store.load_all(_db())
+    return dict(_load_cached())
+
+
+def _write_atomic(presets_file: Path, presets: PresetsDict) -> None:
+    """
+    Write presets to a temporary file in the same directory, fsync it
+    and rename it over the presets file, so readers only ever see a
+    complete file.
+    """
+    import tempfile
+
+    fd, temp_path = tempfile.mkstemp(
+        dir=presets_file.parent, prefix=f".{presets_file.name}.", suffix=".tmp"
+    )
+
+    try:
+        if presets_file.exists():
+            os.chmod(temp_path, stat.S_IMODE(presets_file.stat().st_mode))
+
+        with os.fdopen(fd, "w") as f:
+            json.dump(presets, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(temp_path, presets_file)
+
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+
+    if fcntl:
+        dir_fd = os.open(presets_file.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
 
 def save_all(presets: PresetsDict) -> None:
     """
-    Save presets to JSON file.
+    Save presets to JSON file, updating the cache with what was written.
     """
+    if store := _sqlite_store():
+        store.save_all(_db(), presets)
+        return
+
     presets_file = get_json_file()
 
     try:
-        with open(presets_file, "w") as f:
-            json.dump(presets, f, indent=2)
+        with _locked():
+            _write_atomic(presets_file, presets)
+            _cache[presets_file] = (_cache_key(presets_file), dict(presets))
 
     except Exception as e:
         raise click.ClickException(f"Could not save presets: {e}")
@@ -77,17 +276,36 @@ def get(name: str) -> PresetDict | None:
     """
     Get a specific preset by name.
     """
-    presets = load_all()
-    return presets.get(name)
+    if store := _sqlite_store():
+        return store.get(_db(), name)
 
+    preset = _load_cached().get(name)
+    return dict(preset) if preset else None
 
-def create(name: str, time_input: str) -> PresetDict:
+
+def iter_sorted() -> Iterator[tuple[str, PresetDict]]:
     """
-    Create a preset and save it.
+    Iterate over presets in name order. The SQLite store streams rows
+    without loading every preset into memory.
     """
-    if get(name):
-        raise ValueError(f"'{name}' is already a preset.")
+    if store := _sqlite_store():
+        return store.iter_sorted(_db())
+    return iter(sorted(_load_cached().items()))
+
 
+def max_name_length() -> int:
+    """
+    Return the length of the longest preset name, or 0 if none exist.
+    """
+    if store := _sqlite_store():
+        return store.max_name_length(_db())
+    return max(map(len, _load_cached()), default=0)
+
+
+def _validated_hms(time_input: str) -> tuple[int, int, int]:
+    """
+    Parse a duration for a new preset, checking it is within range.
+    """
     hours, minutes, seconds = time_input_to_hms(time_input)
     total_seconds = hms_to_seconds(hours, minutes, seconds)
 
@@ -97,57 +315,98 @@ def create(name: str, time_input: str) -> PresetDict:
     if total_seconds > 86400:
         raise ValueError("Duration cannot exceed 24 hours.")
 
-    presets = load_all()
-    presets[name] = {
-        "hours": hours,
-        "minutes": minutes,
-        "seconds": seconds
-    }
+    return (hours, minutes, seconds)
+
+
+def create(name: str, time_input: str) -> PresetDict:
+    """
+    Create a preset and save it.
+    """
+    if store := _sqlite_store():
+        if store.get(_db(), name):
+            raise ValueError(f"'{name}' is already a preset.")
+
+        hours, minutes, seconds = _validated_hms(time_input)
+        preset = {"hours": hours, "minutes": minutes, "seconds": seconds}
+        store.insert(_db(), name, preset)
+        return preset
+
+    with _locked():
+        presets = dict(_load_cached(fresh=True))
 
-    save_all(presets)
-    return presets[name]
+        if name in presets:
+            raise ValueError(f"'{name}' is already a preset.")
+
+        hours, minutes, seconds = _validated_hms(time_input)
+        presets[name] = {
+            "hours": hours,
+            "minutes": minutes,
+            "seconds": seconds
+        }
+
+        save_all(presets)
+        return presets[name]
 
 
 def delete(name: str) -> None:
     """
     Delete a preset.
     """
-    if get(name) is None:
-        raise ValueError(f"'{name}' is not a preset.")
+    if store := _sqlite_store():
+        store.delete(_db(), name)
+        return
+
+    with _locked():
+        presets = dict(_load_cached(fresh=True))
 
-    presets = load_all()
-    del presets[name]
-    save_all(presets)
+        if name not in presets:
+            raise ValueError(f"'{name}' is not a preset.")
+
+        del presets[name]
+        save_all(presets)
 
 
 def rename(name: str, new_name: str) -> PresetDict:
     """
     Rename a preset.
     """
-    if get(name) is None:
-        raise ValueError(f"'{name}' is not a preset.")
+    if store := _sqlite_store():
+        return store.rename(_db(), name, new_name)
+
+    with _locked():
+        presets = dict(_load_cached(fresh=True))
+
+        if name not in presets:
+            raise ValueError(f"'{name}' is not a preset.")
 
-    presets = load_all()
-    presets.update({new_name: presets.pop(name)})
+        presets.update({new_name: presets.pop(name)})
 
-    save_all(presets)
-    return presets[new_name]
+        save_all(presets)
+        return presets[new_name]
 
 
 def update(name: str, duration: str) -> PresetDict:
     """
     Update a preset's duration.
     """
-    if get(name) is None:
-        raise ValueError(f"'{name}' is not a preset.")
-
-    hours, minutes, seconds = time_input_to_hms(duration)
-    presets = load_all()
-    presets[name] = {
-        "hours": hours,
-        "minutes": minutes,
-        "seconds": seconds
-    }
-
-    save_all(presets)
-    return presets[name]
+    if store := _sqlite_store():
+        hours, minutes, seconds = time_input_to_hms(duration)
+        preset = {"hours": hours, "minutes": minutes, "seconds": seconds}
+        store.update(_db(), name, preset)
+        return preset
+
+    with _locked():
+        presets = dict(_load_cached(fresh=True))
+
+        if name not in presets:
+            raise ValueError(f"'{name}' is not a preset.")
+
+        hours, minutes, seconds = time_input_to_hms(duration)
+        presets[name] = {
+            "hours": hours,
+            "minutes": minutes,
+            "seconds": seconds
+        }
+
+        save_all(presets)
+        return presets[name]
@@ -0,0 +1,173 @@
+"""Sage SQLite preset storage."""
+
+import functools
+import sqlite3
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TypeAlias
+
+
+PresetDict: TypeAlias = dict[str, int]
+PresetsDict: TypeAlias = dict[str, PresetDict]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS presets (
+    name TEXT PRIMARY KEY,
+    hours INTEGER NOT NULL,
+    minutes INTEGER NOT NULL,
+    seconds INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+def _row_to_preset(row) -> PresetDict:
+    """
+    Convert a (hours, minutes, seconds) row to a preset dict.
+    """
+    hours, minutes, seconds = row
+    return {"hours": hours, "minutes": minutes, "seconds": seconds}
+
+
+def _insert_rows(conn: sqlite3.Connection, presets: PresetsDict) -> None:
+    """
+    Insert every preset in the given dict.
+    """
+    conn.executemany(
+        "INSERT INTO presets (name, hours, minutes, seconds) VALUES (?, ?, ?, ?)",
+        (
+            (name, p["hours"], p["minutes"], p["seconds"])
+            for name, p in presets.items()
+        ),
+    )
+
+
+@contextmanager
+def transaction(conn: sqlite3.Connection):
+    """
+    Run a write transaction that takes the database lock up front, so
+    concurrent read-modify-writes serialize.
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+@functools.cache
+def connect(db_file: Path, seed: Callable[[], PresetsDict]) -> sqlite3.Connection:
+    """
+    Open the preset database, creating it on first use and seeding it
+    once with the presets returned by seed (the existing JSON presets).
+    Connections are reused for the life of the process.
+    """
+    conn = sqlite3.connect(db_file, timeout=10, isolation_level=None)
+    conn.executescript(SCHEMA)
+
+    with transaction(conn):
+        migrated = conn.execute("SELECT 1 FROM meta WHERE key = 'migrated'").fetchone()
+        if not migrated:
+            _insert_rows(conn, seed())
+            conn.execute("INSERT INTO meta (key, value) VALUES ('migrated', 'presets.json')")
+
+    return conn
+
+
+def load_all(conn: sqlite3.Connection) -> PresetsDict:
+    """
+    Load and return every preset.
+    """
+    rows = conn.execute("SELECT name, hours, minutes, seconds FROM presets")
+    return {name: _row_to_preset(rest) for name, *rest in rows}
+
+
+def save_all(conn: sqlite3.Connection, presets: PresetsDict) -> None:
+    """
+    Replace every preset with the given presets.
+    """
+    with transaction(conn):
+        conn.execute("DELETE FROM presets")
+        _insert_rows(conn, presets)
+
+
+def get(conn: sqlite3.Connection, name: str) -> PresetDict | None:
+    """
+    Get a specific preset by name.
+    """
+    row = conn.execute(
+        "SELECT hours, minutes, seconds FROM presets WHERE name = ?", (name,)
+    ).fetchone()
+    return _row_to_preset(row) if row else None
+
+
+def insert(conn: sqlite3.Connection, name: str, preset: PresetDict) -> None:
+    """
+    Insert a new preset, raising ValueError if the name is taken.
+    """
+    try:
+        with transaction(conn):
+            _insert_rows(conn, {name: preset})
+
+    except sqlite3.IntegrityError:
+        raise ValueError(f"'{name}' is already a preset.")
+
+
+def delete(conn: sqlite3.Connection, name: str) -> None:
+    """
+    Delete a preset, raising ValueError if it doesn't exist.
+    """
+    with transaction(conn):
+        if not conn.execute("DELETE FROM presets WHERE name = ?", (name,)).rowcount:
+            raise ValueError(f"'{name}' is not a preset.")
+
+
+def rename(conn: sqlite3.Connection, name: str, new_name: str) -> PresetDict:
+    """
+    Rename a preset, replacing any preset already called new_name.
+    """
+    with transaction(conn):
+        preset = get(conn, name)
+        if preset is None:
+            raise ValueError(f"'{name}' is not a preset.")
+        if new_name == name:
+            return preset
+
+        conn.execute("DELETE FROM presets WHERE name = ?", (new_name,))
+        conn.execute("UPDATE presets SET name = ? WHERE name = ?", (new_name, name))
+        return preset
+
+
+def update(conn: sqlite3.Connection, name: str, preset: PresetDict) -> None:
+    """
+    Update a preset's duration, raising ValueError if it doesn't exist.
+    """
+    with transaction(conn):
+        cursor = conn.execute(
+            "UPDATE presets SET hours = ?, minutes = ?, seconds = ? WHERE name = ?",
+            (preset["hours"], preset["minutes"], preset["seconds"], name),
+        )
+        if not cursor.rowcount:
+            raise ValueError(f"'{name}' is not a preset.")
+
+
+def iter_sorted(conn: sqlite3.Connection) -> Iterator[tuple[str, PresetDict]]:
+    """
+    Stream presets in name order straight from the primary key index.
+    """
+    rows = conn.execute("SELECT name, hours, minutes, seconds FROM presets ORDER BY name")
+    for name, *rest in rows:
+        yield name, _row_to_preset(rest)
+
+
+def max_name_length(conn: sqlite3.Connection) -> int:
+    """
+    Return the length of the longest preset name, or 0 if none exist.
+    """
+    return conn.execute("SELECT coalesce(max(length(name)), 0) FROM presets").fetchone()[0]
@@ -1,9 +1,16 @@
 """Sage sound configurations."""
 
+import os
+import shlex
+import shutil
+import subprocess
+import sys
+import time
 from pathlib import Path
 
-from nava import play
-from nava.errors import NavaBaseError
+
+# waits for a line on stdin, then replaces itself with the player.
+ARMED_PLAYER_SCRIPT = 'read _ && exec "$@"'
 
 
 def get_file(filename: str) -> Path:
@@ -26,9 +33,101 @@ def play_file(filename: str) -> None:
     """
     Play a sound file.
     """
+    # nava is slow to import, so only load it when a sound is played.
+    from nava import play
+    from nava.errors import NavaBaseError
+
     try:
         sound_path = get_file(filename)
         play(str(sound_path), async_mode=True)
 
     except NavaBaseError:
         pass
+
+
+def get_player_command() -> list[str] | None:
+    """
+    Get the command used to play sounds, from SAGE_SOUND_PLAYER if set,
+    otherwise the platform's player if it is installed. The sound file
+    path is appended as the final argument.
+    """
+    if command := os.environ.get("SAGE_SOUND_PLAYER"):
+        return shlex.split(command)
+
+    player = "afplay" if sys.platform == "darwin" else "aplay"
+    return [player] if shutil.which(player) else None
+
+
+class SoundPlayer:
+    """
+    Plays a sound file with as little delay as possible at a known
+    moment, such as a timer expiring.
+
+    The sound file is resolved and validated when the player is created.
+    On POSIX systems arm() starts the player ahead of time behind a shell
+    that blocks on a pipe, so fire() only has to write to the pipe for
+    the waiting process to exec the player. If the player couldn't be
+    armed, fire() falls back to playing the file with nava.
+    """
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.path = get_file(filename)
+        self.available = self.path.exists()
+        self.process = None
+        self.fired = False
+        self.latency_ns = None
+
+    def arm(self) -> bool:
+        """
+        Pre-spawn the player so it is ready to fire. Returns whether the
+        player is armed.
+        """
+        if self.process:
+            return True
+
+        command = get_player_command()
+        if not self.available or os.name != "posix" or not command:
+            return False
+
+        try:
+            self.process = subprocess.Popen(
+                ["/bin/sh", "-c", ARMED_PLAYER_SCRIPT, "sage-sound", *command, str(self.path)],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+        except OSError:
+            return False
+
+        return True
+
+    def fire(self, lateness_ns: int = 0) -> None:
+        """
+        Play the sound now. lateness_ns is how long after the intended
+        moment fire() was called, and is included in the measured
+        latency.
+        """
+        if not self.available:
+            return
+
+        start = time.perf_counter_ns()
+
+        try:
+            self.process.stdin.write(b"\n")
+            self.process.stdin.close()
+        except (AttributeError, OSError):
+            # not armed, or the armed process has gone away.
+            play_file(self.filename)
+
+        self.fired = True
+        self.latency_ns = lateness_ns + time.perf_counter_ns() - start
+
+    def cancel(self) -> None:
+        """
+        Stop the armed player if it hasn't been fired.
+        """
+        if self.process and not self.fired and self.process.poll() is None:
+            self.process.kill()
+            self.process.wait()
@@ -0,0 +1,64 @@
+"""Sage daemon client."""
+
+import socket
+from collections.abc import Iterator
+from pathlib import Path
+
+from .protocol import DaemonError, decode, encode, get_socket_path
+
+
+def connect(path: Path | None = None) -> socket.socket:
+    """
+    Connect to the daemon's socket.
+    """
+    path = path or get_socket_path()
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+    try:
+        sock.connect(str(path))
+    except (FileNotFoundError, ConnectionRefusedError):
+        sock.close()
+        raise DaemonError("The sage daemon is not running. Start it with `sage daemon`.")
+
+    return sock
+
+
+def request(command: str, path: Path | None = None, **arguments) -> dict:
+    """
+    Send a single request to the daemon and return its response,
+    raising DaemonError if the request was rejected.
+    """
+    with connect(path) as sock, sock.makefile("rb") as reader:
+        sock.sendall(encode({"cmd": command, **arguments}))
+        line = reader.readline()
+
+    if not line:
+        raise DaemonError("The sage daemon closed the connection.")
+
+    response = decode(line)
+    if not response.get("ok"):
+        raise DaemonError(response.get("error", "Request failed."))
+    return response
+
+
+def attach(job_id: int, path: Path | None = None) -> Iterator[dict]:
+    """
+    Attach to a timer or stopwatch, yielding its current state followed
+    by an event for each visible change until it completes or is
+    cancelled.
+    """
+    with connect(path) as sock, sock.makefile("rb") as reader:
+        sock.sendall(encode({"cmd": "attach", "id": job_id}))
+
+        response = decode(reader.readline() or b"{}")
+        if not response.get("ok"):
+            raise DaemonError(response.get("error", "Request failed."))
+        yield response["job"]
+        if response["job"]["state"] == "done":
+            return
+
+        for line in reader:
+            event = decode(line)
+            yield event
+            if event["event"] in ("done", "cancelled"):
+                return
@@ -0,0 +1,47 @@
+"""Sage daemon wire protocol."""
+
+import json
+import os
+from pathlib import Path
+
+
+# requests and events are single lines of JSON, so a line longer than
+# this is treated as a misbehaving client.
+MAX_LINE_BYTES = 65536
+
+
+class DaemonError(Exception):
+    """
+    Raised when the daemon can't be reached or rejects a request.
+    """
+
+
+def get_socket_path() -> Path:
+    """
+    Get the path of the daemon's Unix socket, from SAGE_DAEMON_SOCKET if
+    set, otherwise in the user's runtime directory.
+    """
+    if path := os.environ.get("SAGE_DAEMON_SOCKET"):
+        return Path(path)
+
+    from platformdirs import user_runtime_dir
+
+    return Path(user_runtime_dir("sage"), "daemon.sock")
+
+
+def encode(message: dict) -> bytes:
+    """
+    Encode a message as a compact line of JSON.
+    """
+    return json.dumps(message, separators=(",", ":")).encode() + b"\n"
+
+
+def decode(line: bytes) -> dict:
+    """
+    Decode a line of JSON into a message, raising ValueError if it is
+    not a JSON object.
+    """
+    message = json.loads(line)
+    if not isinstance(message, dict):
+        raise ValueError("Messages must be JSON objects.")
+    return message
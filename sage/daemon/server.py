@@ -0,0 +1,545 @@
+"""Sage daemon server."""
+
+import heapq
+import os
+import selectors
+import socket
+import time
+from pathlib import Path
+
+from .protocol import MAX_LINE_BYTES, DaemonError, decode, encode
+from sage.clocks.constants import SoundFileName
+from sage.clocks.scheduler import NS_PER_SECOND
+from sage.clocks.timer import get_total_seconds
+from sage.config import sounds
+
+
+# an attached client that stops reading is disconnected once this much
+# output is waiting for it, rather than buffering events indefinitely.
+MAX_PENDING_BYTES = 1 << 20
+
+# a completed timer nobody asks about is forgotten after this long.
+DONE_RETENTION_NS = 3600 * NS_PER_SECOND
+
+
+class Job:
+    """
+    A timer or stopwatch owned by the daemon.
+
+    Times are absolute perf_counter_ns() readings. A job's elapsed time
+    is measured from its start, less any time spent paused.
+    """
+
+    def __init__(self, job_id: int, kind: str, label: str, total_seconds: int = 0, quiet=False):
+        self.id = job_id
+        self.kind = kind
+        self.label = label
+        self.total_ns = total_seconds * NS_PER_SECOND
+        self.quiet = quiet
+        self.sound = None
+        self.start_ns = time.perf_counter_ns()
+        self.pause_start = 0
+        self.pause_time = 0
+        self.paused = False
+        self.done = False
+        self.generation = 0
+        self.subscribers = set()
+
+    def elapsed_ns(self, now: int) -> int:
+        """
+        Calculate the elapsed nanoseconds at now.
+        """
+        if self.paused:
+            now = self.pause_start
+        return now - self.start_ns - self.pause_time
+
+    def remaining_ns(self, now: int) -> int:
+        """
+        Calculate the nanoseconds remaining on a timer at now.
+        """
+        return self.total_ns - self.elapsed_ns(now)
+
+    def next_deadline_ns(self, now: int) -> int | None:
+        """
+        Return when the daemon next has to act on this job: a timer's
+        expiry, or the next whole second if a client is attached. Paused
+        and completed jobs have no deadline.
+        """
+        if self.paused or self.done:
+            return None
+
+        zero_ns = self.start_ns + self.pause_time
+        deadlines = []
+        if self.kind == "timer":
+            deadlines.append(zero_ns + self.total_ns)
+        if self.subscribers:
+            deadlines.append(zero_ns + (self.elapsed_ns(now) // NS_PER_SECOND + 1) * NS_PER_SECOND)
+        return min(deadlines, default=None)
+
+    def snapshot(self, now: int) -> dict:
+        """
+        Describe the job's state at now. Timers report the whole seconds
+        remaining, stopwatches the whole seconds elapsed.
+        """
+        if self.kind == "timer":
+            seconds = max(0, -(-self.remaining_ns(now) // NS_PER_SECOND))
+        else:
+            seconds = self.elapsed_ns(now) // NS_PER_SECOND
+
+        if self.done:
+            state = "done"
+        elif self.paused:
+            state = "paused"
+        else:
+            state = "running"
+
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "label": self.label,
+            "state": state,
+            "seconds": seconds,
+        }
+
+
+class Connection:
+    """
+    A client connection with its pending input and output.
+    """
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.inbuf = bytearray()
+        self.outbuf = bytearray()
+        self.attached = set()
+        self.closed = False
+
+
+class Daemon:
+    """
+    Owns every background timer and stopwatch and serves requests for
+    them over a Unix socket.
+
+    Each request is a line of JSON naming a command ("start",
+    "stopwatch", "pause", "resume", "cancel", "list", "attach", "ping"
+    or "shutdown") and is answered with a line of JSON holding "ok" and
+    either the result or an "error". Attached clients are also sent an
+    event line each time the job's display changes.
+
+    A single thread runs one selector loop. Timer expiries and attached
+    clients' per-second updates are kept in a min-heap of (deadline,
+    job id, generation) entries, so the loop sleeps until the earliest
+    deadline and each wakeup only touches the jobs that are due. Rather
+    than removing entries when a job is paused or rescheduled, its
+    generation is bumped and stale entries are skipped when popped.
+
+    Completed timers are forgotten once a client has been told they are
+    done, or after DONE_RETENTION_NS if no client asks.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.jobs = {}
+        self.next_id = 1
+        self.deadlines = []
+        self.selector = None
+        self.listener = None
+        self.running = False
+        self.commands = {
+            "start": self._start_timer,
+            "stopwatch": self._start_stopwatch,
+            "pause": self._pause,
+            "resume": self._resume,
+            "cancel": self._cancel,
+            "list": self._list,
+            "attach": self._attach,
+            "ping": self._ping,
+            "shutdown": self._shutdown,
+        }
+
+    def serve(self):
+        """
+        Listen on the socket and run the event loop until shut down.
+        """
+        self._bind()
+        self.running = True
+
+        try:
+            while self.running:
+                for key, events in self.selector.select(self._get_timeout()):
+                    if key.data is None:
+                        self._accept()
+                    else:
+                        self._service(key.data, events)
+                self._run_due()
+        finally:
+            self._close()
+
+    def handle(self, message: dict, connection: Connection | None = None) -> dict:
+        """
+        Dispatch a request and return its response.
+        """
+        name = message.get("cmd")
+        command = self.commands.get(name) if isinstance(name, str) else None
+        if command is None:
+            return {"ok": False, "error": f"Unknown command: {name}"}
+
+        try:
+            return {"ok": True, **command(message, connection)}
+        except ValueError as e:
+            return {"ok": False, "error": str(e)}
+        except Exception as e:
+            # one bad request mustn't stop the loop and lose every job.
+            return {"ok": False, "error": f"Request failed: {e}"}
+
+    def _bind(self):
+        """
+        Bind the listening socket, replacing a stale socket file left by
+        a daemon that didn't exit cleanly.
+        """
+        if self.path.exists():
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(str(self.path))
+            except (ConnectionRefusedError, FileNotFoundError):
+                self.path.unlink(missing_ok=True)
+            else:
+                raise DaemonError(f"A sage daemon is already listening on {self.path}.")
+            finally:
+                probe.close()
+
+        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self.listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.listener.bind(str(self.path))
+        os.chmod(self.path, 0o600)
+        self.listener.listen(128)
+        self.listener.setblocking(False)
+
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.listener, selectors.EVENT_READ, None)
+
+    def _close(self):
+        """
+        Close every connection, stop any armed sound players and remove
+        the socket file.
+        """
+        for job in self.jobs.values():
+            if job.sound:
+                job.sound.cancel()
+        for key in list(self.selector.get_map().values()):
+            if key.data is not None:
+                self._disconnect(key.data)
+        self.selector.close()
+        self.listener.close()
+        self.path.unlink(missing_ok=True)
+
+    def _get_timeout(self):
+        """
+        Calculate the seconds until the earliest deadline, or None if no
+        job has one. Stale entries at the top of the heap are dropped
+        first, so they never cause a wakeup.
+        """
+        while self.deadlines:
+            _, job_id, generation = self.deadlines[0]
+            job = self.jobs.get(job_id)
+            if job is not None and job.generation == generation:
+                break
+            heapq.heappop(self.deadlines)
+
+        if not self.deadlines:
+            return None
+        return max(0, self.deadlines[0][0] - time.perf_counter_ns()) / NS_PER_SECOND
+
+    def _accept(self):
+        """
+        Accept a pending client connection.
+        """
+        try:
+            sock, _ = self.listener.accept()
+        except BlockingIOError:
+            return
+
+        sock.setblocking(False)
+        self.selector.register(sock, selectors.EVENT_READ, Connection(sock))
+
+    def _service(self, connection: Connection, events: int):
+        """
+        Read and answer complete requests from a connection, and flush
+        any output it is waiting to write.
+        """
+        if events & selectors.EVENT_WRITE:
+            self._flush(connection)
+
+        if not events & selectors.EVENT_READ or connection.closed:
+            return
+
+        try:
+            data = connection.sock.recv(MAX_LINE_BYTES)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+
+        if not data:
+            self._disconnect(connection)
+            return
+
+        connection.inbuf += data
+        while not connection.closed and (end := connection.inbuf.find(b"\n")) >= 0:
+            line = bytes(connection.inbuf[:end])
+            del connection.inbuf[:end + 1]
+
+            try:
+                response = self.handle(decode(line), connection)
+            except ValueError:
+                response = {"ok": False, "error": "Requests must be JSON objects."}
+            self._send(connection, encode(response))
+
+        if len(connection.inbuf) > MAX_LINE_BYTES:
+            self._disconnect(connection)
+
+    def _send(self, connection: Connection, data: bytes):
+        """
+        Queue data for a connection and write as much as possible now.
+        """
+        if connection.closed:
+            return
+        if len(connection.outbuf) + len(data) > MAX_PENDING_BYTES:
+            self._disconnect(connection)
+            return
+        connection.outbuf += data
+        self._flush(connection)
+
+    def _flush(self, connection: Connection):
+        """
+        Write a connection's pending output, watching for writability
+        only while some remains.
+        """
+        try:
+            sent = connection.sock.send(connection.outbuf)
+            del connection.outbuf[:sent]
+        except BlockingIOError:
+            pass
+        except OSError:
+            self._disconnect(connection)
+            return
+
+        events = selectors.EVENT_READ
+        if connection.outbuf:
+            events |= selectors.EVENT_WRITE
+        self.selector.modify(connection.sock, events, connection)
+
+    def _disconnect(self, connection: Connection):
+        """
+        Close a connection and detach it from any jobs.
+        """
+        if connection.closed:
+            return
+
+        connection.closed = True
+        for job_id in connection.attached:
+            if job := self.jobs.get(job_id):
+                job.subscribers.discard(connection)
+        self.selector.unregister(connection.sock)
+        connection.sock.close()
+
+    def _run_due(self):
+        """
+        Act on every job whose deadline has passed, expiring timers and
+        updating attached clients.
+        """
+        now = time.perf_counter_ns()
+        while self.deadlines and self.deadlines[0][0] <= now:
+            _, job_id, generation = heapq.heappop(self.deadlines)
+            job = self.jobs.get(job_id)
+            if job is None or job.generation != generation:
+                continue
+
+            if job.done:
+                self._forget(job)
+            elif job.kind == "timer" and job.remaining_ns(now) <= 0:
+                self._expire(job, now)
+            else:
+                self._publish(job, "tick", now)
+                self._schedule(job, now)
+
+    def _schedule(self, job: Job, now: int):
+        """
+        Invalidate a job's pending deadline and push its next one.
+        """
+        job.generation += 1
+        deadline = job.next_deadline_ns(now)
+        if deadline is not None:
+            heapq.heappush(self.deadlines, (deadline, job.id, job.generation))
+
+    def _expire(self, job: Job, now: int):
+        """
+        Complete a timer, playing its armed times up sound and notifying
+        attached clients. A timer that no client was told about is kept
+        until DONE_RETENTION_NS has passed.
+        """
+        job.done = True
+        job.generation += 1
+
+        if job.sound:
+            job.sound.fire(lateness_ns=-job.remaining_ns(now))
+
+        if job.subscribers:
+            self._publish(job, "done", now)
+            self._forget(job)
+        else:
+            heapq.heappush(self.deadlines, (now + DONE_RETENTION_NS, job.id, job.generation))
+
+    def _forget(self, job: Job):
+        """
+        Remove a job, stopping its sound player if it never fired.
+        """
+        if job.sound:
+            job.sound.cancel()
+        for connection in job.subscribers:
+            connection.attached.discard(job.id)
+        job.generation += 1
+        self.jobs.pop(job.id, None)
+
+    def _report(self, job: Job, now: int) -> dict:
+        """
+        Describe a job to a client, forgetting it if it is done now
+        that its final state has been reported.
+        """
+        snapshot = job.snapshot(now)
+        if job.done:
+            self._forget(job)
+        return snapshot
+
+    def _publish(self, job: Job, event: str, now: int):
+        """
+        Send an event with the job's state to every attached client.
+        """
+        if job.subscribers:
+            data = encode({"event": event, **job.snapshot(now)})
+            for connection in list(job.subscribers):
+                self._send(connection, data)
+
+    def _get_job(self, message: dict) -> Job:
+        """
+        Look up the job a request refers to.
+        """
+        job_id = message.get("id")
+        if type(job_id) is not int:
+            raise ValueError("Timer ids must be integers.")
+        if job := self.jobs.get(job_id):
+            return job
+        raise ValueError(f"No timer with id {job_id}.")
+
+    def _add_job(self, job: Job, message: dict) -> dict:
+        """
+        Register a new job, pausing it if requested, and schedule it.
+        """
+        self.jobs[job.id] = job
+        self.next_id += 1
+        now = time.perf_counter_ns()
+
+        if message.get("paused"):
+            job.paused = True
+            job.pause_start = now
+        self._schedule(job, now)
+        return {"job": job.snapshot(now)}
+
+    def _start_timer(self, message: dict, connection) -> dict:
+        """
+        Start a timer from a duration or preset name.
+        """
+        time_input = str(message.get("input", ""))
+        total_seconds = get_total_seconds(time_input)
+        job = Job(self.next_id, "timer", time_input, total_seconds, bool(message.get("quiet")))
+
+        # armed now, as Timer does, so the sound plays as soon as the
+        # timer expires.
+        if not job.quiet:
+            job.sound = sounds.SoundPlayer(SoundFileName.TIMES_UP)
+            job.sound.arm()
+        return self._add_job(job, message)
+
+    def _start_stopwatch(self, message: dict, connection) -> dict:
+        """
+        Start a stopwatch.
+        """
+        job = Job(self.next_id, "stopwatch", str(message.get("label") or "stopwatch"))
+        return self._add_job(job, message)
+
+    def _pause(self, message: dict, connection) -> dict:
+        """
+        Pause a running job.
+        """
+        job = self._get_job(message)
+        now = time.perf_counter_ns()
+
+        if not job.paused and not job.done:
+            job.paused = True
+            job.pause_start = now
+            self._schedule(job, now)
+            self._publish(job, "paused", now)
+        return {"job": self._report(job, now)}
+
+    def _resume(self, message: dict, connection) -> dict:
+        """
+        Resume a paused job.
+        """
+        job = self._get_job(message)
+        now = time.perf_counter_ns()
+
+        if job.paused:
+            job.pause_time += now - job.pause_start
+            job.paused = False
+            job.pause_start = 0
+            self._schedule(job, now)
+            self._publish(job, "resumed", now)
+        return {"job": self._report(job, now)}
+
+    def _cancel(self, message: dict, connection) -> dict:
+        """
+        Cancel and forget a job.
+        """
+        job = self._get_job(message)
+        now = time.perf_counter_ns()
+
+        self._publish(job, "cancelled", now)
+        self._forget(job)
+        return {"job": job.snapshot(now)}
+
+    def _list(self, message: dict, connection) -> dict:
+        """
+        Describe every job, in the order they were started. Completed
+        timers are listed once and then forgotten.
+        """
+        now = time.perf_counter_ns()
+        return {"jobs": [self._report(job, now) for job in list(self.jobs.values())]}
+
+    def _attach(self, message: dict, connection) -> dict:
+        """
+        Subscribe the connection to a job's events.
+        """
+        job = self._get_job(message)
+        now = time.perf_counter_ns()
+
+        if job.done:
+            return {"job": self._report(job, now)}
+
+        if connection is not None:
+            job.subscribers.add(connection)
+            connection.attached.add(job.id)
+            self._schedule(job, now)
+        return {"job": job.snapshot(now)}
+
+    def _ping(self, message: dict, connection) -> dict:
+        """
+        Report the daemon is alive.
+        """
+        return {"jobs": len(self.jobs)}
+
+    def _shutdown(self, message: dict, connection) -> dict:
+        """
+        Stop the event loop once the current wakeup is handled.
+        """
+        self.running = False
+        return {}
@@ -0,0 +1,39 @@
+import pytest
+from click.testing import CliRunner
+
+from sage.cli.main import sage
+
+
+@pytest.fixture
+def config_dir(tmp_path, monkeypatch):
+    """
+    Give each test its own empty config directory, so presets created
+    or changed by one test never reach another or the user's own.
+    """
+    config_dir = tmp_path / "config"
+    monkeypatch.setenv("SAGE_CONFIG_DIR", str(config_dir))
+    return config_dir
+
+
+@pytest.fixture
+def history_file(tmp_path, monkeypatch):
+    """
+    Give each test its own history log.
+    """
+    path = tmp_path / "history"
+    monkeypatch.setenv("SAGE_HISTORY_FILE", str(path))
+    return path
+
+
+@pytest.fixture
+def run_sage(config_dir, history_file):
+    """
+    Invoke the sage command in-process, returning the click Result with
+    exit_code, stdout and stderr.
+    """
+    runner = CliRunner()
+
+    def run(*args, input=None):
+        return runner.invoke(sage, list(args), input=input, prog_name="sage")
+
+    return run
@@ -0,0 +1,113 @@
+import json
+import multiprocessing
+import os
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from unittest.mock import patch
+
+import pytest
+
+from sage.config import presets
+
+
+def _timed_create(args):
+    """
+    Create a preset in a worker process and return the longest time the
+    presets lock was held.
+    """
+    presets_file, name = args
+    locked = presets._locked
+    hold_times = []
+
+    @contextmanager
+    def timed_lock():
+        with locked():
+            start = time.perf_counter()
+            yield
+            hold_times.append(time.perf_counter() - start)
+
+    with (
+        patch("sage.config.presets.get_json_file", return_value=presets_file),
+        patch("sage.config.presets._locked", timed_lock),
+    ):
+        presets.create(name, "1m")
+
+    return max(hold_times)
+
+
+def _create_with_cli(count, workers):
+    """
+    Run count `sage create` invocations, workers at a time, and check
+    none of the presets were lost.
+    """
+    env = os.environ.copy()
+    names = [f"preset{i}" for i in range(count)]
+
+    def create(name):
+        return subprocess.run(
+            ["sage", "create", name, "1m"],
+            capture_output=True,
+            text=True,
+            timeout=60,
+            env=env,
+        )
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(create, names))
+
+    assert all(result.returncode == 0 for result in results)
+
+    result = subprocess.run(
+        ["sage", "list"], capture_output=True, text=True, timeout=5, env=env
+    )
+    for name in names + ["pomodoro"]:
+        assert name in result.stdout
+
+
+def _create_in_processes(presets_file, count, processes):
+    """
+    Create count presets from a pool of processes, returning the longest
+    time any of them held the presets lock.
+    """
+    names = [f"preset{i}" for i in range(count)]
+
+    with multiprocessing.get_context("spawn").Pool(processes) as pool:
+        hold_times = pool.map(_timed_create, [(presets_file, name) for name in names])
+
+    saved = json.loads(presets_file.read_text())
+    assert set(names) <= set(saved)
+    return max(hold_times)
+
+
+def test_concurrent_cli_creates_lose_nothing(config_dir):
+    """
+    Test parallel `sage create` invocations don't lose presets or
+    corrupt the presets file.
+    """
+    _create_with_cli(count=12, workers=12)
+
+
+def test_concurrent_creates_hold_lock_briefly(tmp_path):
+    """
+    Test concurrent processes keep every preset and hold the presets
+    lock only briefly.
+    """
+    assert _create_in_processes(tmp_path / "presets.json", count=24, processes=4) < 0.5
+
+
+@pytest.mark.benchmark
+def test_many_concurrent_cli_creates(config_dir):
+    """
+    Stress test `sage create` with many more invocations at once.
+    """
+    _create_with_cli(count=100, workers=32)
+
+
+@pytest.mark.benchmark
+def test_many_concurrent_creates(tmp_path):
+    """
+    Stress test the presets lock with many more processes at once.
+    """
+    assert _create_in_processes(tmp_path / "presets.json", count=200, processes=16) < 0.5
@@ -0,0 +1,97 @@
+import os
+import socket
+import subprocess
+import time
+
+import pytest
+
+from sage.daemon import client
+
+
+@pytest.fixture
+def socket_path(tmp_path, config_dir):
+    """
+    Run a daemon on a socket in a temporary directory, with its own
+    config directory.
+    """
+    path = tmp_path / "daemon.sock"
+    env = {**os.environ, "SAGE_DAEMON_SOCKET": str(path)}
+    process = subprocess.Popen(["sage", "daemon"], env=env)
+
+    deadline = time.monotonic() + 5
+    while not path.exists():
+        assert time.monotonic() < deadline, "daemon did not start"
+        time.sleep(0.01)
+
+    yield path
+
+    process.terminate()
+    process.wait(timeout=5)
+    assert not path.exists()
+
+
+def sage(socket_path, *args):
+    env = {**os.environ, "SAGE_DAEMON_SOCKET": str(socket_path)}
+    return subprocess.run(
+        ["sage", "daemon", *args], capture_output=True, text=True, timeout=5, env=env
+    )
+
+
+def test_start_and_list(socket_path):
+    """
+    Test timers started from separate clients are listed by the daemon.
+    """
+    assert sage(socket_path, "start", "25m", "--quiet").stdout.strip() == "1"
+    assert sage(socket_path, "stopwatch", "lab", "--paused").stdout.strip() == "2"
+
+    result = sage(socket_path, "list")
+    assert result.returncode == 0
+    assert "25m" in result.stdout
+    assert "lab" in result.stdout
+    assert "paused" in result.stdout
+
+
+def test_invalid_duration(socket_path):
+    """
+    Test the daemon rejects invalid durations.
+    """
+    result = sage(socket_path, "start", "0s")
+    assert result.returncode == 1
+    assert "Duration must be greater than 0 seconds." in result.stderr
+
+
+def test_attach_follows_until_done(socket_path):
+    """
+    Test attaching streams the timer's state until it completes.
+    """
+    job_id = client.request("start", socket_path, input="2s", quiet=True)["job"]["id"]
+    states = [job["state"] for job in client.attach(job_id, socket_path)]
+    assert states[0] == "running"
+    assert states[-1] == "done"
+
+
+def test_malformed_request_keeps_daemon_running(socket_path):
+    """
+    Test a request with a field of the wrong type is rejected without
+    stopping the daemon or losing its timers.
+    """
+    assert sage(socket_path, "start", "25m", "--quiet").stdout.strip() == "1"
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(5)
+        sock.connect(str(socket_path))
+        sock.sendall(b'{"cmd":"pause","id":[1]}\n')
+        assert b'"ok":false' in sock.recv(4096)
+
+    result = sage(socket_path, "list")
+    assert result.returncode == 0
+    assert "25m" in result.stdout
+
+
+def test_not_running(tmp_path):
+    """
+    Test clients report when no daemon is listening.
+    """
+    result = sage(tmp_path / "missing.sock", "list")
+    assert result.returncode == 1
+    assert "not running" in result.stderr
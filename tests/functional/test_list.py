@@ -1,29 +1,23 @@
-import subprocess
-
-
-def test_list():
+def test_list(run_sage):
     """
     Test list command lists all presets.
     """
-    result = subprocess.run(
-        ["sage", "list"], capture_output=True, text=True, timeout=5
-    )
+    run_sage("create", "pika", "5m")
+    result = run_sage("list")
 
-    assert result.returncode == 0
+    assert result.exit_code == 0
     assert "pomodoro" in result.stdout
     assert "johncage" in result.stdout
     assert "potato" in result.stdout
     assert "pika" in result.stdout
 
 
-def test_list_help():
+def test_list_help(run_sage):
     """
     Test help option on list command.
     """
-    result = subprocess.run(
-        ["sage", "list", "--help"], capture_output=True, text=True, timeout=5
-    )
+    result = run_sage("list", "--help")
 
-    assert result.returncode == 0
+    assert result.exit_code == 0
     assert "--help" in result.stdout
     assert "list all presets"
@@ -1,25 +1,17 @@
-import os
-import subprocess
-
-
-def test_version():
+def test_version(run_sage):
     """
     Test sage version option.
     """
-    result = subprocess.run(
-        ["sage", "--version"], capture_output=True, text=True, timeout=5
-    )
+    result = run_sage("--version")
 
     assert "sage, version 0.1.0" in result.stdout
 
 
-def test_help():
+def test_help(run_sage):
     """
     Test sage help option.
     """
-    result = subprocess.run(
-        ["sage", "--help"], capture_output=True, text=True, timeout=5
-    )
+    result = run_sage("--help")
 
     assert "--version" in result.stdout.lower()
     assert "--help" in result.stdout.lower()
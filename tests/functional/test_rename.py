@@ -1,59 +1,25 @@
-import os
-import subprocess
-
-
-def test_rename(tmp_path):
+def test_rename(run_sage):
     """
     Test preset rename.
     """
-    env = os.environ.copy()
-    env["HOME"] = str(tmp_path)
-
-    result = subprocess.run(
-        ["sage", "rename", "pomodoro", "pineapple"],
-        capture_output=True,
-        text=True,
-        timeout=5,
-        env=env
-    )
-
-    assert result.returncode == 0
+    result = run_sage("rename", "pomodoro", "pineapple")
+    assert result.exit_code == 0
     assert "success" in result.stdout.lower()
 
 
-def test_rename_without_new_name(tmp_path):
+def test_rename_without_new_name(run_sage):
     """
     Test preset rename without new name.
     """
-    env = os.environ.copy()
-    env["HOME"] = str(tmp_path)
-
-    result = subprocess.run(
-        ["sage", "rename", "pomodoro"],
-        capture_output=True,
-        text=True,
-        timeout=5,
-        env=env
-    )
-
-    assert result.returncode == 2
+    result = run_sage("rename", "pomodoro")
+    assert result.exit_code == 2
     assert "missing argument" in result.stderr.lower()
 
 
-def test_rename_with_nonexistent_name(tmp_path):
+def test_rename_with_nonexistent_name(run_sage):
     """
     Test preset rename with nonexistent preset.
     """
-    env = os.environ.copy()
-    env["HOME"] = str(tmp_path)
-
-    result = subprocess.run(
-        ["sage", "rename", "potomac", "potato"],
-        capture_output=True,
-        text=True,
-        timeout=5,
-        env=env
-    )
-
-    assert result.returncode == 2
+    result = run_sage("rename", "potomac", "potato")
+    assert result.exit_code == 2
     assert "not a preset" in result.stderr.lower()
@@ -0,0 +1,65 @@
+import os
+import subprocess
+
+from sage.common.status import KIND_TIMER, StatusWriter
+
+
+# modules that only the clock commands need.
+HEAVY_MODULES = {"curses", "_curses", "nava", "sqlite3", "sage.clocks"}
+
+
+def imported_modules(args, **extra_env):
+    """
+    Run sage with -X importtime and return the names of the modules it
+    imported.
+    """
+    env = os.environ.copy()
+    env.update(extra_env)
+    env["PYTHONPROFILEIMPORTTIME"] = "1"
+
+    result = subprocess.run(
+        ["sage", *args], capture_output=True, text=True, timeout=5, env=env
+    )
+    assert result.returncode == 0
+
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        modules.add(line.rsplit("|", 1)[1].strip())
+    return modules
+
+
+def test_list_skips_heavy_imports(config_dir):
+    """
+    Test a cold `sage list` doesn't import the clock stack.
+    """
+    modules = imported_modules(["list"])
+    assert not HEAVY_MODULES & modules
+
+
+def test_version_skips_command_imports(config_dir):
+    """
+    Test `sage --version` doesn't import any subcommand.
+    """
+    modules = imported_modules(["--version"])
+    assert not [name for name in modules if name.startswith("sage.cli.") and name != "sage.cli.main"]
+
+
+def test_status_skips_heavy_imports(config_dir, tmp_path):
+    """
+    Test `sage status` reads a running clock without importing the
+    clock stack or platformdirs.
+    """
+    status_file = tmp_path / "status"
+    writer = StatusWriter(str(status_file))
+    writer.publish(KIND_TIMER, False, 0, 0, 0, total_seconds=60)
+
+    try:
+        modules = imported_modules(
+            ["status"], SAGE_STATUS_FILE=str(status_file), XDG_RUNTIME_DIR=str(tmp_path)
+        )
+    finally:
+        writer.close()
+
+    assert not (HEAVY_MODULES | {"platformdirs"}) & modules
@@ -0,0 +1,23 @@
+from sage.common.history import append_session
+from sage.common.status import KIND_TIMER
+
+
+def test_stats_without_history(run_sage):
+    """
+    Test stats before any clock has been run.
+    """
+    result = run_sage("stats")
+    assert result.exit_code == 0
+    assert "No clock history" in result.stdout
+
+
+def test_stats_by_preset(run_sage, history_file):
+    """
+    Test stats grouped by preset.
+    """
+    for _ in range(2):
+        append_session(0, 0, 1500 * 10**9, 0, KIND_TIMER, name="pomodoro", count=3)
+
+    result = run_sage("stats", "--by", "preset")
+    assert result.exit_code == 0
+    assert result.stdout == "pomodoro   2 sessions  50 minutes  counter 6\n"
@@ -0,0 +1,59 @@
+from unittest.mock import patch
+
+import pytest
+
+from sage.clocks.stopwatch import Stopwatch
+
+
+def test_stopwatch_help(run_sage):
+    """
+    Test help option on stopwatch command.
+    """
+    result = run_sage("stopwatch", "--help")
+    assert result.exit_code == 0
+    assert "start a stopwatch" in result.stdout.lower()
+    assert "--laps" in result.stdout
+
+
+def test_stopwatch_laps_file_format(run_sage, tmp_path):
+    """
+    Test lap files must have a supported extension.
+    """
+    result = run_sage("stopwatch", "--laps", str(tmp_path / "laps.txt"))
+    assert result.exit_code == 2
+    assert ".csv" in result.stderr
+
+
+def test_stopwatch_laps_file_not_writable(run_sage, tmp_path):
+    """
+    Test a laps file that can't be written is reported without a
+    traceback.
+    """
+    path = tmp_path / "missing" / "laps.csv"
+    with patch.object(Stopwatch, "load"):
+        result = run_sage("stopwatch", "--laps", str(path))
+    assert result.exit_code == 1
+    assert "Couldn't save laps" in result.stderr
+    assert "Traceback" not in result.output
+
+
+@pytest.mark.parametrize("option", [["--perf"], ["--count-log", "counts.txt"], ["--laps", "laps.csv"], ["--paused"]])
+def test_stopwatch_stream_rejects_clock_options(run_sage, option):
+    """
+    Test options that only apply to the clock can't be streamed.
+    """
+    result = run_sage("stopwatch", "--stream", *option)
+    assert result.exit_code == 2
+    assert f"{option[0]} can't be used with --stream" in result.stderr
+
+
+def test_stopwatch_laps_file_error_keeps_original_error(run_sage, tmp_path):
+    """
+    Test a laps file that can't be written when the stopwatch fails is
+    reported without replacing the original error.
+    """
+    path = tmp_path / "missing" / "laps.csv"
+    with patch.object(Stopwatch, "load", side_effect=RuntimeError("boom")):
+        result = run_sage("stopwatch", "--laps", str(path))
+    assert isinstance(result.exception, RuntimeError)
+    assert "Couldn't save laps" in result.stderr
@@ -1,67 +1,114 @@
+import os
 import subprocess
 
+import pytest
 
-def test_timer_help():
+
+def test_timer_help(run_sage):
     """
     Test help option on timer command.
     """
-    result = subprocess.run(
-        ["sage", "timer", "--help"], capture_output=True, text=True, timeout=5
-    )
+    result = run_sage("timer", "--help")
     assert "start a timer" in result.stdout.lower()
     assert "--paused" in result.stdout.lower()
     assert "--help" in result.stdout.lower()
 
 
-def test_timer_with_duration():
+def test_timer_with_duration(run_sage):
     """
     Test timer with a duration as the time string.
     """
-    result = subprocess.run(
-        ["sage", "timer", "25m", "--test"], capture_output=True, text=True, timeout=5
-    )
-    assert result.returncode == 0
+    result = run_sage("timer", "25m", "--test")
+    assert result.exit_code == 0
     assert "00:25:00" in result.stdout
 
 
-def test_timer_with_preset():
+def test_timer_with_preset(run_sage):
     """
     Test timer with a preset as the time string.
     """
-    result = subprocess.run(
-        ["sage", "timer", "pomodoro", "--test"],
-        capture_output=True,
-        text=True,
-        timeout=5,
-    )
-    assert result.returncode == 0
+    result = run_sage("timer", "pomodoro", "--test")
+    assert result.exit_code == 0
     assert "00:25:00" in result.stdout
 
 
-def test_timer_out_of_range_low():
+def test_timer_out_of_range_low(run_sage):
     """
     Test timer duration that is less than or equal to 0 seconds raises
     error.
     """
-    result = subprocess.run(
-        ["sage", "timer", "0s", "--test"],
-        capture_output=True,
-        text=True,
-        timeout=5,
-    )
-    assert result.returncode == 2
+    result = run_sage("timer", "0s", "--test")
+    assert result.exit_code == 2
     assert "must be greater than 0 seconds" in result.stderr.lower()
 
 
-def test_timer_out_of_range_high():
+def test_timer_out_of_range_high(run_sage):
     """
     Test timer duration that is greater than 24 hours raises error.
     """
+    result = run_sage("timer", "25hr", "--test")
+    assert result.exit_code == 2
+    assert "cannot exceed 24 hours" in result.stderr.lower()
+
+
+def test_timer_unquoted_duration(run_sage):
+    """
+    Test unquoted inputs that together read as one duration are one
+    timer.
+    """
+    result = run_sage("timer", "5", "minutes", "--test")
+    assert result.exit_code == 0
+    assert result.stdout == "00:05:00\n"
+
+    result = run_sage("timer", "1", "hour", "and", "30", "minutes", "--test")
+    assert result.exit_code == 0
+    assert result.stdout == "01:30:00\n"
+
+    result = run_sage("timer", "1h", "30m", "--test")
+    assert result.exit_code == 0
+    assert result.stdout == "01:30:00\n"
+
+
+def test_timer_unparsed_input_suggests_quoting(run_sage):
+    """
+    Test an input that is neither a duration, preset nor part of one
+    suggests quoting.
+    """
+    result = run_sage("timer", "5m", "fortnights", "--test")
+    assert result.exit_code == 2
+    assert "'fortnights' is not a duration or preset" in result.stderr
+    assert 'sage timer "5 minutes"' in result.stderr
+
+
+def test_timer_several_durations(run_sage):
+    """
+    Test several durations that each parse are separate timers.
+    """
+    result = run_sage("timer", "5m", "pomodoro", "--test")
+    assert result.exit_code == 0
+    assert result.stdout == "00:05:00\n00:25:00\n"
+
+
+@pytest.mark.parametrize("option", [["--perf"], ["--count-log", "counts.txt"], ["--test"], ["--paused"]])
+def test_timer_stream_rejects_clock_options(run_sage, option):
+    """
+    Test options that only apply to the clock can't be streamed.
+    """
+    result = run_sage("timer", "25m", "--stream", *option)
+    assert result.exit_code == 2
+    assert f"{option[0]} can't be used with --stream" in result.stderr
+
+
+def test_timer_stream(config_dir):
+    """
+    Test streaming a timer prints each second without curses. This runs
+    the installed command since the stream writes straight to file
+    descriptor 1.
+    """
+    env = dict(os.environ, SAGE_CONFIG_DIR=str(config_dir))
     result = subprocess.run(
-        ["sage", "timer", "25hr", "--test"],
-        capture_output=True,
-        text=True,
-        timeout=5,
+        ["sage", "timer", "2s", "--stream", "--quiet"],
+        capture_output=True, text=True, timeout=5, env=env,
     )
-    assert result.returncode == 2
-    assert "cannot exceed 24 hours" in result.stderr.lower()
+    assert result.returncode == 0
+    assert result.stdout.splitlines() == ["00:00:02", "00:00:01", "00:00:00"]
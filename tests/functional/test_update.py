@@ -1,78 +1,34 @@
-import os
-import subprocess
-
-
-def test_update(tmp_path):
+def test_update(run_sage):
     """
     Test preset duration update.
     """
-    env = os.environ.copy()
-    env["HOME"] = str(tmp_path)
-
-    result = subprocess.run(
-        ["sage", "update", "pomodoro", "30m"],
-        capture_output=True,
-        text=True,
-        timeout=5,
-        env=env,
-    )
-
-    assert result.returncode == 0
+    result = run_sage("update", "pomodoro", "30m")
+    assert result.exit_code == 0
     assert "success" in result.stdout.lower()
 
 
-def test_update_missing_name(tmp_path):
+def test_update_missing_name(run_sage):
     """
     Test preset update with missing name argument.
     """
-    env = os.environ.copy()
-    env["HOME"] = str(tmp_path)
-
-    result = subprocess.run(
-        ["sage", "update"],
-        capture_output=True,
-        text=True,
-        timeout=5,
-        env=env,
-    )
-
-    assert result.returncode == 2
+    result = run_sage("update")
+    assert result.exit_code == 2
     assert "missing argument" in result.stderr.lower()
 
 
-def test_update_missing_duration(tmp_path):
+def test_update_missing_duration(run_sage):
     """
     Test preset update with missing duration argument.
     """
-    env = os.environ.copy()
-    env["HOME"] = str(tmp_path)
-
-    result = subprocess.run(
-        ["sage", "update", "pomodoro"],
-        capture_output=True,
-        text=True,
-        timeout=5,
-        env=env,
-    )
-
-    assert result.returncode == 2
+    result = run_sage("update", "pomodoro")
+    assert result.exit_code == 2
     assert "missing argument" in result.stderr.lower()
 
 
-def test_update_nonexistent_preset(tmp_path):
+def test_update_nonexistent_preset(run_sage):
     """
     Test preset update on nonexistent preset.
     """
-    env = os.environ.copy()
-    env["HOME"] = str(tmp_path)
-
-    result = subprocess.run(
-        ["sage", "update", "pootietang", "37m"],
-        capture_output=True,
-        text=True,
-        timeout=5,
-        env=env,
-    )
-
-    assert result.returncode == 2
+    result = run_sage("update", "pootietang", "37m")
+    assert result.exit_code == 2
     assert "not a preset" in result.stderr.lower()
@@ -0,0 +1,29 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).parents[2]
+
+
+@pytest.mark.benchmark
+def test_benchmark_suite_within_thresholds(tmp_path):
+    """
+    Test a quick run of the benchmark suite stays within the bounds in
+    benchmarks/thresholds.json and records every benchmark.
+    """
+    output = tmp_path / "results.json"
+    result = subprocess.run(
+        [sys.executable, "benchmarks/run_suite.py", "--quick", "--output", str(output)],
+        cwd=ROOT, capture_output=True, text=True, timeout=300,
+    )
+    assert result.returncode == 0, result.stderr
+
+    metrics = json.loads(output.read_text())["metrics"]
+    prefixes = {name.split(".")[0] for name in metrics}
+    assert prefixes == {
+        "formatting", "conversions", "preset_io", "render", "lifecycle", "input", "history", "clock_loop", "startup",
+    }
@@ -0,0 +1,34 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def config_dir(tmp_path, monkeypatch):
+    """
+    Give each test its own config directory, so timers loaded by tests
+    never read or create the user's presets.
+    """
+    path = tmp_path / "config"
+    monkeypatch.setenv("SAGE_CONFIG_DIR", str(path))
+    return path
+
+
+@pytest.fixture(autouse=True)
+def status_file(tmp_path, monkeypatch):
+    """
+    Give each test its own status file, so clocks loaded by tests never
+    replace the status of a clock the user is running.
+    """
+    path = tmp_path / "status"
+    monkeypatch.setenv("SAGE_STATUS_FILE", str(path))
+    return path
+
+
+@pytest.fixture(autouse=True)
+def history_file(tmp_path, monkeypatch):
+    """
+    Give each test its own history log, so clocks loaded by tests never
+    append to the user's own.
+    """
+    path = tmp_path / "history"
+    monkeypatch.setenv("SAGE_HISTORY_FILE", str(path))
+    return path
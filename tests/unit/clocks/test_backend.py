@@ -0,0 +1,53 @@
+from sage.clocks.backend import MemoryBackend
+from sage.clocks.stopwatch import Stopwatch
+from sage.clocks.timer import Timer
+
+
+def test_memory_backend_records_writes():
+    """
+    Test writes are recorded and applied to the screen, clipped to its
+    width.
+    """
+    backend = MemoryBackend(rows=2, cols=8)
+    backend.window(1, 8).addstr(0, 4, "abcdef", backend.color(2))
+
+    assert backend.writes == [(1, 4, "abcdef")]
+    assert backend.line(1) == "    abcd"
+    assert backend.attrs[1][4] == 2 << 8
+    assert backend.text() == "\n    abcd"
+
+
+def test_memory_backend_quits_after_script():
+    """
+    Test scripted keys are returned in order, then q.
+    """
+    backend = MemoryBackend(keys=[-1, " "])
+    assert [backend.getch() for _ in range(3)] == [-1, ord(" "), ord("q")]
+
+
+def test_headless_timer():
+    """
+    Test a timer runs its full loop against the memory backend.
+    """
+    backend = MemoryBackend(keys=[-1] * 10)
+    Timer().load(backend=backend, time_input="1h", quiet=True)
+
+    screen = backend.text()
+    assert "sage" in screen
+    assert "01:00:00" in screen or "00:59:59" in screen
+    assert backend.waits == 10
+    assert backend.last_timeout > 0
+
+
+def test_headless_stopwatch_controls():
+    """
+    Test pausing and counting in a headless stopwatch are drawn.
+    """
+    backend = MemoryBackend(keys=["\n", "\n", " "])
+    stopwatch = Stopwatch()
+    stopwatch.load(backend=backend)
+
+    assert stopwatch.paused
+    assert "Counter: 2" in backend.line(23)
+    assert backend.line(13).strip() == "Paused"
+    assert backend.last_timeout is None
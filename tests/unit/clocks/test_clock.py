@@ -0,0 +1,109 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sage.clocks.backend import MemoryBackend
+from sage.clocks.stopwatch import Stopwatch
+from sage.clocks.timer import Timer
+from sage.clocks.timesource import VirtualTime
+from sage.common import history
+
+
+def test_timer_timeout_until_next_second():
+    """
+    Test timer waits until the displayed second changes.
+    """
+    timer = Timer(VirtualTime(2_250_000_000))
+    timer.total_seconds = 60
+    timer._tick()
+    assert timer._get_timeout() == pytest.approx(0.75)
+    assert timer._get_display_time() == "00:00:58"
+
+
+def test_stopwatch_timeout_until_next_centisecond():
+    """
+    Test stopwatch waits until the displayed centisecond changes.
+    """
+    stopwatch = Stopwatch(VirtualTime(1_234_000_000))
+    stopwatch._tick()
+    assert stopwatch._get_timeout() == pytest.approx(0.006)
+    assert stopwatch._get_display_time() == "00:00:01:23"
+
+
+def test_paused_and_completed_clocks_block():
+    """
+    Test paused clocks and completed timers wait indefinitely for input.
+    """
+    stopwatch = Stopwatch()
+    stopwatch.paused = True
+    assert stopwatch._get_timeout() is None
+
+    timer = Timer()
+    timer.times_up = True
+    assert timer._get_timeout() is None
+
+
+def test_state_changes_publish_status():
+    """
+    Test pausing and resuming publish the clock's state, and ticks
+    don't.
+    """
+    time_source = VirtualTime(5_000_000_000)
+    stopwatch = Stopwatch(time_source)
+    stopwatch.renderer = MagicMock()
+    stopwatch.status = MagicMock()
+
+    stopwatch._tick()
+    stopwatch._on_pause()
+    time_source.current_ns = 7_000_000_000
+    stopwatch._on_pause()
+
+    assert stopwatch.status.publish.call_count == 2
+    assert stopwatch.status.publish.call_args.args[:5] == (
+        Stopwatch.STATUS_KIND, False, 0, 0, 2_000_000_000,
+    )
+
+
+def test_sessions_saved_to_history(history_file):
+    """
+    Test timers and stopwatches append their session to the history log
+    on exit, counting no more than a timer's duration.
+    """
+    time_source = VirtualTime(10 * 86400 * 10**9)
+
+    backend = MemoryBackend(keys=[-1] * 70, time_source=time_source)
+    with patch("sage.clocks.timer.sounds.SoundPlayer"):
+        Timer(time_source).load(backend=backend, time_input="1m", quiet=True)
+
+    backend = MemoryBackend(keys=[" ", -1, " ", "\n"], time_source=time_source)
+    stopwatch = Stopwatch(time_source)
+    stopwatch.load(backend=backend)
+
+    by_preset = history.summarize("preset", path=str(history_file))
+    assert by_preset == [(history.NO_PRESET, 2, 60 * 10**9 + stopwatch._get_elapsed_ns(), 1)]
+    assert history.summarize("day", path=str(history_file))[0][1] == 2
+
+
+def test_timer_not_started_saves_no_history(history_file):
+    """
+    Test a timer that fails to start isn't saved to the history log.
+    """
+    with pytest.raises(ValueError):
+        Timer(VirtualTime()).load(backend=MemoryBackend(), time_input="0s")
+    assert not history_file.exists()
+
+
+def test_burst_of_keys_drained_in_one_frame():
+    """
+    Test every pending key is applied in order before the next frame.
+    """
+    time_source = VirtualTime()
+    keys = ["\n"] * 1000 + [" ", "\n", " ", -1]
+    backend = MemoryBackend(keys=keys, time_source=time_source)
+    stopwatch = Stopwatch(time_source)
+    stopwatch.load(backend=backend)
+
+    assert stopwatch.count == 1001
+    assert not stopwatch.paused
+    assert backend.waits == 1
+    assert "Counter: 1001 (1001/min)" in backend.text()
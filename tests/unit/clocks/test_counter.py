@@ -0,0 +1,61 @@
+from sage.clocks.backend import MemoryBackend
+from sage.clocks.counter import WINDOW_NS, EventCounter
+from sage.clocks.stopwatch import Stopwatch
+from sage.clocks.timesource import VirtualTime
+
+
+def test_per_minute_slides():
+    """
+    Test increments leave the count once they are a minute old.
+    """
+    counter = EventCounter()
+    for now_ns in (0, 10, 20):
+        counter.record(now_ns)
+
+    assert counter.per_minute(20) == 3
+    assert counter.per_minute(WINDOW_NS + 10) == 1
+    assert counter.per_minute(WINDOW_NS + 20) == 0
+    assert len(counter) == 3
+
+
+def test_ring_keeps_recent_increments():
+    """
+    Test only the most recent increments are kept once the ring is full.
+    """
+    counter = EventCounter(capacity=4)
+    for now_ns in range(10):
+        counter.record(now_ns)
+
+    assert len(counter) == 10
+    assert counter.kept() == [6, 7, 8, 9]
+    assert counter.per_minute(9) == 4
+
+
+def test_dump(tmp_path):
+    """
+    Test timestamps are dumped as decimal seconds since the start.
+    """
+    counter = EventCounter()
+    counter.record(1_500_000_000)
+    counter.record(2_000_000_001)
+    path = tmp_path / "counts.txt"
+    counter.dump(path, start_ns=500_000_000)
+
+    assert path.read_text().splitlines() == ["1.000000000", "1.500000001"]
+
+
+def test_enter_records_increments(tmp_path):
+    """
+    Test pressing either enter key in a stopwatch shows the increments
+    per minute and writes them to the count log on exit.
+    """
+    time_source = VirtualTime()
+    keys = [-1] * 10 + ["\n"] + [-1] * 10 + [MemoryBackend.KEY_ENTER]
+    backend = MemoryBackend(keys=keys, time_source=time_source)
+    stopwatch = Stopwatch(time_source)
+    count_log = tmp_path / "counts.txt"
+    stopwatch.load(backend=backend, count_log=count_log)
+
+    assert stopwatch.count == 2
+    assert "Counter: 2 (2/min)" in backend.text()
+    assert len(count_log.read_text().splitlines()) == 2
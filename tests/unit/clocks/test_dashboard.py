@@ -0,0 +1,89 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sage.clocks.dashboard import Countdown, Dashboard
+from sage.clocks.timesource import VirtualTime
+
+
+@pytest.fixture
+def dashboard():
+    dashboard = Dashboard(VirtualTime())
+    dashboard.renderer = MagicMock()
+    dashboard.sound = MagicMock()
+    dashboard.quiet = True
+    dashboard._initialize_dashboard(time_inputs=("3s", "1s", "2s"), quiet=True)
+    return dashboard
+
+
+def advance(dashboard, elapsed_ns):
+    dashboard.time_source.current_ns = elapsed_ns
+    dashboard._update_due()
+    return dashboard._get_timeout()
+
+
+def test_countdown_deadline_caps_at_expiry():
+    """
+    Test a countdown's next deadline is the next whole second, capped at
+    its expiry.
+    """
+    countdown = Countdown("2s", 2)
+    assert countdown.next_deadline_ns(250_000_000) == 1_000_000_000
+    assert countdown.next_deadline_ns(1_500_000_000) == 2_000_000_000
+    assert countdown.display_time(1_500_000_000) == "00:00:01"
+
+
+def test_only_due_countdowns_are_redrawn(dashboard):
+    """
+    Test a wakeup before any deadline draws nothing and sleeps until the
+    earliest deadline.
+    """
+    assert advance(dashboard, 400_000_000) == pytest.approx(0.6)
+    dashboard.renderer.render_cell.assert_not_called()
+
+
+def test_countdowns_expire_in_deadline_order(dashboard):
+    """
+    Test countdowns expire in order of their durations and drop out of
+    the deadline heap.
+    """
+    advance(dashboard, 1_000_000_000)
+    assert [countdown.times_up for countdown in dashboard.countdowns] == [False, True, False]
+    assert len(dashboard.deadlines) == 2
+
+    advance(dashboard, 2_000_000_000)
+    assert [countdown.times_up for countdown in dashboard.countdowns] == [False, True, True]
+
+    assert advance(dashboard, 3_000_000_000) is None
+    assert all(countdown.times_up for countdown in dashboard.countdowns)
+    assert dashboard.deadlines == []
+
+
+def test_late_wakeup_records_lateness(dashboard):
+    """
+    Test lateness of each due countdown is recorded in the histogram.
+    """
+    advance(dashboard, 1_000_500_000)
+    assert dashboard.scheduler.histogram.total == 3
+    assert dashboard.scheduler.histogram.max_ns == 500_000
+
+
+def test_simultaneous_expiry_plays_sound_once(dashboard):
+    """
+    Test countdowns expiring on the same wakeup only fire one sound.
+    """
+    dashboard.quiet = False
+    player = dashboard.sound
+    with patch("sage.clocks.dashboard.sounds.SoundPlayer"):
+        advance(dashboard, 2_500_000_000)
+    player.fire.assert_called_once()
+
+
+def test_paused_dashboard_blocks(dashboard):
+    """
+    Test a paused dashboard neither redraws nor schedules a wakeup.
+    """
+    dashboard.paused = True
+    dashboard.pause_start = 500_000_000
+    assert advance(dashboard, 5_000_000_000) is None
+    dashboard.renderer.render_cell.assert_not_called()
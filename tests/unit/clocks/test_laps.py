@@ -0,0 +1,82 @@
+import json
+
+import pytest
+
+from sage.clocks.backend import MemoryBackend
+from sage.clocks.laps import LapRecorder, get_export_format
+from sage.clocks.stopwatch import Stopwatch
+from sage.clocks.timesource import VirtualTime
+
+
+@pytest.fixture
+def laps():
+    laps = LapRecorder()
+    for split_ns in (1_500_000_000, 2_000_000_000, 4_250_000_000):
+        laps.record(split_ns)
+    return laps
+
+
+def test_lap_statistics(laps):
+    """
+    Test lap durations and their statistics are kept as laps are
+    recorded.
+    """
+    assert len(laps) == 3
+    assert laps.min_ns == 500_000_000
+    assert laps.max_ns == 2_250_000_000
+    assert laps.mean_ns() == 1_416_666_666
+    assert laps.recent(2) == [(3, 2_250_000_000, 4_250_000_000), (2, 500_000_000, 2_000_000_000)]
+    assert laps.recent(5)[-1] == (1, 1_500_000_000, 1_500_000_000)
+
+
+def test_export_csv(laps, tmp_path):
+    """
+    Test laps export to CSV with exact decimal seconds.
+    """
+    path = tmp_path / "laps.csv"
+    laps.export(path)
+    assert path.read_text().splitlines() == [
+        "lap,lap_seconds,split_seconds",
+        "1,1.500000000,1.500000000",
+        "2,0.500000000,2.000000000",
+        "3,2.250000000,4.250000000",
+    ]
+
+
+def test_export_ndjson(laps, tmp_path):
+    """
+    Test laps export to NDJSON, one record per lap.
+    """
+    path = tmp_path / "laps.ndjson"
+    laps.export(path)
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert records[1] == {"lap": 2, "lap_seconds": 0.5, "split_seconds": 2.0}
+
+
+def test_export_format_from_extension():
+    """
+    Test the export format is chosen by extension and others rejected.
+    """
+    assert get_export_format("laps.CSV") == "csv"
+    assert get_export_format("laps.jsonl") == "ndjson"
+    with pytest.raises(ValueError):
+        get_export_format("laps.txt")
+
+
+def test_lap_key_records_and_renders():
+    """
+    Test pressing l in a running stopwatch records a lap and shows it.
+    """
+    time_source = VirtualTime()
+    keys = [-1] * 50 + ["l"] + [-1] * 30 + ["l", " ", "l"]
+    backend = MemoryBackend(keys=keys, time_source=time_source)
+    stopwatch = Stopwatch(time_source)
+    stopwatch.load(backend=backend)
+
+    # the last burst of keys is applied in order: a lap, then a pause
+    # that stops the second l from recording one.
+    assert list(stopwatch.laps.splits) == [500_000_000, 800_000_000]
+    screen = backend.text()
+    assert "min 00:00:00:30  mean 00:00:00:40  max 00:00:00:50" in screen
+    assert "Lap 2  00:00:00:30" in screen
+    assert "Lap 1  00:00:00:50" in screen
@@ -0,0 +1,85 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sage.clocks.perf import PerfMonitor, RollingCounter, RollingLateness
+from sage.clocks.scheduler import NS_PER_SECOND
+from sage.clocks.stopwatch import Stopwatch
+
+
+def test_rolling_counter_rate_over_window():
+    """
+    Test events older than the window no longer count towards the rate.
+    """
+    counter = RollingCounter(seconds=2)
+    for tenth in range(20):
+        counter.add(tenth * NS_PER_SECOND // 10)
+    assert counter.rate(2 * NS_PER_SECOND) == pytest.approx(10)
+
+    counter.add(5 * NS_PER_SECOND)
+    assert counter.total == 1
+
+
+def test_rolling_lateness_forgets_old_samples():
+    """
+    Test the mean and p99 only cover the most recent samples.
+    """
+    lateness = RollingLateness(size=4)
+    for lateness_ns in (1_000_000, 1_000_000, 1_000, 1_000, 1_000, 1_000):
+        lateness.record(lateness_ns)
+
+    assert lateness.mean_ns() == 1_000
+    assert lateness.percentile_ns(99) == 2_000
+
+
+def test_monitor_format_schedules_next_refresh():
+    """
+    Test the overlay refreshes once a second and shortens waits to
+    match.
+    """
+    monitor = PerfMonitor()
+    monitor.record_frame(0, 100)
+    monitor.record_frame(NS_PER_SECOND // 4, 150)
+    text = monitor.format(NS_PER_SECOND // 2)
+
+    assert "4.0 fps" in text
+    assert "100 B/s" in text
+    assert monitor.due(NS_PER_SECOND)
+    assert not monitor.due(NS_PER_SECOND - 1)
+    assert monitor.timeout(None, NS_PER_SECOND // 2) == pytest.approx(0.5)
+    assert monitor.timeout(0.1, NS_PER_SECOND // 2) == pytest.approx(0.1)
+
+
+def test_perf_key_toggles_overlay():
+    """
+    Test pressing p shows and hides the overlay.
+    """
+    stopwatch = Stopwatch()
+    stopwatch.renderer = MagicMock()
+
+    stopwatch._handle_perf(ord("p"))
+    assert stopwatch.perf is not None
+
+    stopwatch._handle_perf(ord("p"))
+    assert stopwatch.perf is None
+    stopwatch.renderer.clear_perf.assert_called_once()
+
+
+def test_paused_clock_wakes_for_overlay():
+    """
+    Test a paused clock with the overlay shown wakes to refresh it, and
+    records the frame and wakeup.
+    """
+    stopwatch = Stopwatch()
+    stopwatch.renderer = MagicMock()
+    stopwatch.renderer.bytes_written = 40
+    stopwatch.paused = True
+    stopwatch._toggle_perf()
+
+    with patch.object(Stopwatch, "_wait_for_event") as wait:
+        stopwatch._sleep_and_refresh()
+
+    stopwatch.renderer.render_perf.assert_called_once()
+    assert 0 < wait.call_args.args[0] <= 1
+    assert stopwatch.perf.frames.total == 1
+    assert stopwatch.perf.wakeups.total == 1
@@ -0,0 +1,113 @@
+import pytest
+
+from sage.clocks.backend import MemoryBackend
+from sage.clocks.renderer import ClockRenderer
+
+
+@pytest.fixture
+def renderer():
+    renderer = ClockRenderer(MemoryBackend())
+    renderer.initialize_curses_window()
+    return renderer
+
+
+def test_unchanged_text_is_not_rewritten(renderer):
+    """
+    Test rendering the same text twice only writes it once.
+    """
+    renderer.render_clock("00:25:00")
+    renderer.backend.writes.clear()
+
+    renderer.render_clock("00:25:00")
+    assert renderer.backend.writes == []
+
+
+def test_only_changed_cells_are_written(renderer):
+    """
+    Test only the differing characters of a region are emitted.
+    """
+    renderer.render_clock("00:25:00")
+    x, _ = renderer.regions["clock"]
+    renderer.backend.writes.clear()
+
+    renderer.render_clock("00:24:59")
+    assert renderer.backend.writes == [(12, x + 4, "4"), (12, x + 6, "59")]
+
+
+def test_moved_region_is_erased(renderer):
+    """
+    Test text drawn at a new position erases the previous text.
+    """
+    renderer.render_counter(9)
+    old_x, _ = renderer.regions["counter"]
+    renderer.backend.writes.clear()
+
+    renderer.render_counter(10)
+    assert renderer.backend.writes[0] == (23, old_x, " " * len("Counter: 9"))
+    assert renderer.backend.writes[1][2] == "Counter: 10"
+
+
+def test_write_stats(renderer):
+    """
+    Test written cells and bytes are counted.
+    """
+    renderer.render_status("Paused")
+    renderer.clear_status()
+
+    stats = renderer.write_stats()
+    assert stats["cells"] == 12
+    assert stats["bytes"] == 12
+    assert stats["cells_per_second"] > 0
+
+
+def test_flush_only_when_dirty(renderer):
+    """
+    Test only changed windows are refreshed and clean frames are skipped.
+    """
+    assert renderer.flush()
+    assert not renderer.flush()
+
+    renderer.render_clock("00:25:00")
+    assert renderer.dirty == {"clock"}
+    assert renderer.flush()
+    assert renderer.windows["clock"].refreshes == 1
+    assert renderer.windows["status"].refreshes == 0
+    assert not renderer.flush()
+
+
+def test_grid_reflows_to_width():
+    """
+    Test the dashboard grid wraps cells onto new rows on narrow screens.
+    """
+    renderer = ClockRenderer(MemoryBackend(rows=24, cols=80))
+    renderer.initialize_curses_window()
+    renderer.layout_grid(4)
+    assert len({y for y, _, _ in renderer.cells}) == 2
+
+    renderer.backend.resize(24, 160)
+    renderer.layout()
+    renderer.layout_grid(4)
+    assert len({y for y, _, _ in renderer.cells}) == 1
+
+
+def test_grid_skips_cells_below_footer():
+    """
+    Test cells that don't fit above the footer are not drawn.
+    """
+    renderer = ClockRenderer(MemoryBackend(rows=8, cols=24))
+    renderer.initialize_curses_window()
+    renderer.layout_grid(3)
+    renderer.render_cell(2, "10m", "00:10:00")
+    assert "cell2.label" not in renderer.region_windows
+
+
+def test_perf_overlay_fits_window(renderer):
+    """
+    Test the performance overlay is drawn below the title and cut to
+    the window width.
+    """
+    renderer.render_perf("x" * 100)
+    assert renderer.backend.writes[-1] == (2, 1, "x" * 78)
+
+    renderer.clear_perf()
+    assert renderer.backend.writes[-1] == (2, 1, " " * 78)
@@ -0,0 +1,43 @@
+from sage.clocks.scheduler import LatenessHistogram, TickScheduler
+
+
+def test_deadlines_are_aligned_to_unit():
+    """
+    Test deadlines fall on whole multiples of the tick unit.
+    """
+    scheduler = TickScheduler(1_000)
+    assert scheduler.deadline_ns == 1_000
+
+    assert not scheduler.tick(999)
+    assert scheduler.tick(1_250)
+    assert scheduler.deadline_ns == 2_000
+    assert scheduler.timeout(1_500) == 500 / 1_000_000_000
+
+
+def test_missed_deadlines_skip_ahead():
+    """
+    Test the scheduler catches up without drifting after a late wakeup.
+    """
+    scheduler = TickScheduler(1_000)
+    assert scheduler.tick(4_300)
+    assert scheduler.deadline_ns == 5_000
+    assert scheduler.histogram.max_ns == 3_300
+    assert scheduler.timeout(6_000) == 0
+
+
+def test_lateness_histogram():
+    """
+    Test lateness is bucketed by powers of two microseconds.
+    """
+    histogram = LatenessHistogram()
+    for lateness_ns in (500, 1_500, 3_000, 3_500, 100_000):
+        histogram.record(lateness_ns)
+
+    assert histogram.total == 5
+    assert histogram.counts[0] == 1
+    assert histogram.counts[1] == 1
+    assert histogram.counts[2] == 2
+    assert histogram.percentile_ns(50) == 4_000
+    assert histogram.percentile_ns(100) == 100_000
+    assert histogram.mean_ns() == 21_700
+    assert "ticks: 5" in histogram.format()
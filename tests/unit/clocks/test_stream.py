@@ -0,0 +1,97 @@
+import json
+import os
+from contextlib import suppress
+import pytest
+
+from sage.clocks.stopwatch import Stopwatch
+from sage.clocks.stream import ClockStream
+from sage.clocks.timer import Timer
+from sage.clocks.timesource import VirtualTime
+
+
+@pytest.fixture
+def pipe():
+    read_fd, write_fd = os.pipe()
+    yield read_fd, write_fd
+    for fd in (read_fd, write_fd):
+        with suppress(OSError):
+            os.close(fd)
+
+
+def fill(fd):
+    """
+    Fill a pipe so that it is no longer writable.
+    """
+    os.set_blocking(fd, False)
+    try:
+        while True:
+            os.write(fd, b"x" * 4096)
+    except BlockingIOError:
+        pass
+    os.set_blocking(fd, True)
+
+
+def drain(fd):
+    os.set_blocking(fd, False)
+    data = b""
+    try:
+        while chunk := os.read(fd, 65536):
+            data += chunk
+    except BlockingIOError:
+        pass
+    return data
+
+
+def test_timer_lines_until_done(pipe):
+    """
+    Test a timer writes one JSON record per visible change and finishes
+    when it reaches zero.
+    """
+    read_fd, write_fd = pipe
+    time_source = VirtualTime()
+    stream = ClockStream(Timer(time_source), fd=write_fd, json_lines=True)
+    stream._initialize_clock(time_input="2s", quiet=True)
+
+    finished = []
+    for now in (0, 500_000_000, 1_000_000_000, 2_000_000_000):
+        time_source.current_ns = now
+        finished.append(stream._step())
+
+    records = [json.loads(line) for line in drain(read_fd).splitlines()]
+    assert [record["display"] for record in records] == ["00:00:02", "00:00:01", "00:00:00"]
+    assert records[-1]["state"] == "done"
+    assert finished == [False, False, False, True]
+
+
+def test_slow_reader_gets_latest_line(pipe):
+    """
+    Test lines are coalesced rather than queued while the reader is
+    behind.
+    """
+    read_fd, write_fd = pipe
+    time_source = VirtualTime()
+    stream = ClockStream(Stopwatch(time_source), fd=write_fd)
+    fill(write_fd)
+
+    for now in (0, 1_000_000_000, 5_000_000_000):
+        time_source.current_ns = now
+        stream._step()
+    assert stream.pending == b"00:00:05\n"
+    assert stream.lines_written == 0
+
+    drain(read_fd)
+    time_source.current_ns = 5_100_000_000
+    stream._step()
+    assert drain(read_fd) == b"00:00:05\n"
+
+
+def test_closed_reader_ends_stream(pipe):
+    """
+    Test the stream ends quietly when its reader goes away.
+    """
+    read_fd, write_fd = pipe
+    os.close(read_fd)
+
+    stream = ClockStream(Stopwatch(), fd=write_fd)
+    stream.run()
+    assert stream.lines_written == 0
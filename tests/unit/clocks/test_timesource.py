@@ -0,0 +1,49 @@
+from itertools import repeat
+from unittest.mock import patch
+
+from sage.clocks.backend import MemoryBackend
+from sage.clocks.stopwatch import Stopwatch
+from sage.clocks.timer import Timer
+from sage.clocks.timesource import VirtualTime
+
+
+def test_virtual_sleep_rounds_up():
+    """
+    Test sleeping advances virtual time without falling short.
+    """
+    time_source = VirtualTime(5)
+    time_source.sleep(0.1)
+    assert time_source.now_ns() == 100_000_005
+
+
+def test_simulated_timer_lifecycle():
+    """
+    Test a two hour timer runs to completion against virtual time,
+    drawing every second on time and playing its sound once.
+    """
+    time_source = VirtualTime()
+    backend = MemoryBackend(keys=repeat(-1, 7_210), time_source=time_source)
+    timer = Timer(time_source)
+
+    with patch("sage.clocks.timer.sounds.SoundPlayer") as player:
+        timer.load(backend=backend, time_input="2h")
+
+    assert timer.times_up
+    assert time_source.now_ns() == 7_200_000_000_000
+    assert timer.scheduler.histogram.total == 7_200
+    assert timer.scheduler.histogram.max_ns == 0
+    player.return_value.fire.assert_called_once_with(lateness_ns=0)
+    assert "Time's up!" in backend.text()
+    assert "00:00:00" in backend.text()
+
+
+def test_simulated_stopwatch_advances_by_centiseconds():
+    """
+    Test a stopwatch wakes once per centisecond of virtual time.
+    """
+    time_source = VirtualTime()
+    backend = MemoryBackend(keys=repeat(-1, 100), time_source=time_source)
+    Stopwatch(time_source).load(backend=backend)
+
+    assert time_source.now_ns() == 1_000_000_000
+    assert "00:00:00:99" in backend.text()
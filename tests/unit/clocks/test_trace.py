@@ -0,0 +1,89 @@
+import json
+from unittest.mock import patch
+
+from sage.clocks.stopwatch import Stopwatch
+from sage.clocks.trace import FrameTracer
+
+
+def test_tracer_disabled_without_environment(monkeypatch):
+    """
+    Test no tracer is created unless SAGE_TRACE is set.
+    """
+    monkeypatch.delenv("SAGE_TRACE", raising=False)
+    assert FrameTracer.from_environment() is None
+
+    monkeypatch.setenv("SAGE_TRACE", "trace.json")
+    monkeypatch.setenv("SAGE_TRACE_SPANS", "16")
+    tracer = FrameTracer.from_environment()
+    assert tracer.path == "trace.json"
+    assert tracer.capacity == 16
+
+
+def test_ring_buffer_keeps_most_recent_spans(tmp_path):
+    """
+    Test the oldest spans are overwritten once the buffer is full.
+    """
+    tracer = FrameTracer(str(tmp_path / "trace.json"), capacity=4)
+    tracer.origin_ns = 0
+    for n in range(6):
+        tracer.record(0, n * 1000, n * 1000 + 500)
+
+    events = [event for event in tracer.events() if event["ph"] == "X"]
+    assert [event["ts"] for event in events] == [2, 3, 4, 5]
+    assert all(event["dur"] == 0.5 for event in events)
+    assert tracer.dropped == 2
+
+
+def test_instrumented_clock_records_phases(tmp_path):
+    """
+    Test each loop phase is recorded and dumped as a Chrome trace.
+    """
+    path = tmp_path / "trace.json"
+    tracer = FrameTracer(str(path))
+    stopwatch = Stopwatch()
+    stopwatch.resize_handler = None
+
+    with patch.object(Stopwatch, "_wait_for_event"), patch.object(Stopwatch, "_update_display"):
+        tracer.instrument(stopwatch)
+        for _ in range(3):
+            stopwatch._check_for_resize()
+            stopwatch._tick()
+            stopwatch._update_display()
+            stopwatch._wait_for_event(0)
+
+    tracer.dump()
+    trace = json.loads(path.read_text())
+    names = [event["name"] for event in trace["traceEvents"] if event["ph"] == "X"]
+    assert names.count("check_for_resize") == 3
+    assert names.count("tick") == 3
+    assert names.count("update_display") == 3
+    assert names.count("wait_for_event") == 3
+    assert trace["otherData"]["dropped"] == 0
+
+
+def test_frame_spans_between_key_listens(tmp_path):
+    """
+    Test a frame span is recorded from one key listen to the next.
+    """
+    tracer = FrameTracer(str(tmp_path / "trace.json"))
+    stopwatch = Stopwatch()
+
+    with patch.object(Stopwatch, "_listen_for_keys"):
+        tracer.instrument(stopwatch)
+        for _ in range(3):
+            stopwatch._listen_for_keys()
+
+    names = [event["name"] for event in tracer.events() if event["ph"] == "X"]
+    assert names.count("listen_for_keys") == 3
+    assert names.count("frame") == 2
+
+
+def test_tracer_leaves_clock_untouched_when_disabled(monkeypatch):
+    """
+    Test clocks keep their own methods when tracing is off.
+    """
+    monkeypatch.delenv("SAGE_TRACE", raising=False)
+    stopwatch = Stopwatch()
+    with patch("curses.wrapper"):
+        stopwatch.load()
+    assert "_tick" not in vars(stopwatch)
@@ -0,0 +1,92 @@
+import random
+
+import pytest
+
+from sage.clocks.scheduler import NS_PER_MILLISECOND, NS_PER_SECOND
+from sage.clocks.wheel import TimingWheel
+
+
+def test_timers_expire_in_deadline_order():
+    """
+    Test timers spread across every level expire in deadline order and
+    never before their deadline.
+    """
+    rng = random.Random(0)
+    wheel = TimingWheel()
+    durations = [rng.randrange(1, 86_400 * NS_PER_SECOND) for _ in range(2_000)]
+    for duration in durations:
+        wheel.schedule(0, duration, duration)
+
+    expired = []
+    for second in range(1, 86_401):
+        now = second * NS_PER_SECOND
+        for timer in wheel.advance(now):
+            assert timer.deadline_ns <= now
+            expired.append(timer.data)
+
+    # timers sharing a tick may expire in either order.
+    assert [-(-d // NS_PER_MILLISECOND) for d in expired] == sorted(
+        -(-d // NS_PER_MILLISECOND) for d in durations
+    )
+    assert len(wheel) == 0
+
+
+def test_timer_expires_on_its_tick():
+    """
+    Test a timer expires at the first tick at or after its deadline.
+    """
+    wheel = TimingWheel()
+    wheel.schedule(0, 5_500_000)
+    assert wheel.advance(5_999_999) == []
+    assert len(wheel.advance(6_000_000)) == 1
+
+
+def test_cancelled_timer_never_expires():
+    """
+    Test cancelling removes a timer from the wheel.
+    """
+    wheel = TimingWheel()
+    timer = wheel.schedule(0, 90 * NS_PER_SECOND)
+    wheel.cancel(timer)
+    assert len(wheel) == 0
+    assert not timer.scheduled
+    assert wheel.advance(100 * NS_PER_SECOND) == []
+
+
+def test_pause_shifts_deadline():
+    """
+    Test time spent paused is added to a timer's deadline, as with
+    Clock's pause_start and pause_time.
+    """
+    wheel = TimingWheel()
+    timer = wheel.schedule(0, 10 * NS_PER_SECOND)
+
+    wheel.pause(timer, 4 * NS_PER_SECOND)
+    assert wheel.advance(20 * NS_PER_SECOND) == []
+    assert timer.remaining_ns(20 * NS_PER_SECOND) == 6 * NS_PER_SECOND
+
+    wheel.resume(timer, 30 * NS_PER_SECOND)
+    assert timer.pause_time == 26 * NS_PER_SECOND
+    assert wheel.advance(35 * NS_PER_SECOND) == []
+    assert wheel.advance(36 * NS_PER_SECOND) == [timer]
+
+
+def test_timeout_until_next_slot():
+    """
+    Test the timeout is never later than the next expiry.
+    """
+    wheel = TimingWheel()
+    assert wheel.timeout(0) is None
+
+    wheel.schedule(0, 3 * NS_PER_SECOND)
+    assert 0 < wheel.timeout(0) <= 3
+
+
+def test_delay_beyond_range():
+    """
+    Test scheduling past the wheel's range is rejected.
+    """
+    wheel = TimingWheel()
+    with pytest.raises(ValueError):
+        wheel.schedule(0, wheel.max_delay_ns + NS_PER_SECOND)
+    assert len(wheel) == 0
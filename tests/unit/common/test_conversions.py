@@ -1,3 +1,6 @@
+import random
+import re
+
 from sage.common.conversions import (
     seconds_to_hms,
     hms_to_seconds,
@@ -6,6 +9,40 @@ from sage.common.conversions import (
 )
 
 
+def legacy_time_input_to_seconds(time_input: str) -> int:
+    """
+    The original three-regex parser, kept as an oracle for fuzzing.
+    """
+
+    def extract_time_value(pattern: str) -> int:
+        match = re.search(pattern, time_input)
+        return int(match.group(1)) if match else 0
+
+    hours = extract_time_value(r"(\d+)\s*(h|hour|hours)")
+    minutes = extract_time_value(r"(\d+)\s*(m|min|minute|minutes)")
+    seconds = extract_time_value(r"(\d+)\s*(s|sec|second|seconds)")
+    return hours * 3600 + minutes * 60 + seconds
+
+
+def random_time_input(rng: random.Random) -> str:
+    """
+    Generate a time string in the forms the original parser accepted:
+    each unit at most once, integer values, any order and spacing.
+    """
+    aliases = {
+        "h": ["h", "hr", "hrs", "hour", "hours"],
+        "m": ["m", "min", "mins", "minute", "minutes"],
+        "s": ["s", "sec", "secs", "second", "seconds"],
+    }
+    units = rng.sample(sorted(aliases), rng.randint(1, 3))
+    parts = [
+        f"{rng.randint(0, 999)}{rng.choice(['', ' '])}{rng.choice(aliases[unit])}"
+        for unit in units
+    ]
+    separators = [rng.choice(["", " ", "  ", ", ", " and "]) for _ in parts[1:]]
+    return "".join(part + sep for part, sep in zip(parts, separators + [""]))
+
+
 def test_single_hms_to_seconds():
     """
     Test conversion of single time units to seconds.
@@ -49,3 +86,62 @@ def test_convert_time_input_to_hms():
     assert time_input_to_hms("2 minutes") == (0, 2, 0)
     assert time_input_to_hms("3min40s") == (0, 3, 40)
     assert time_input_to_hms("17 hours 3 minutes 40 sec") == (17, 3, 40)
+
+
+def test_convert_extended_time_input_to_seconds():
+    """
+    Test clock notation, decimals, bare seconds and repeated units.
+    """
+    assert time_input_to_seconds("1:30:00") == 5400
+    assert time_input_to_seconds("5:30") == 330
+    assert time_input_to_seconds("1.5h") == 5400
+    assert time_input_to_seconds("90") == 90
+    assert time_input_to_seconds("1h 30m 1h") == 9000
+    assert time_input_to_seconds("1 hour and 30 minutes") == 5400
+
+
+def test_convert_trailing_number_to_next_unit():
+    """
+    Test a whole number after the last unit is in the next smaller unit.
+    """
+    assert time_input_to_seconds("1h30") == 5400
+    assert time_input_to_seconds("1 hour 30") == 5400
+    assert time_input_to_seconds("5m30") == 330
+    assert time_input_to_seconds("1h 5m 30") == 3930
+    assert time_input_to_seconds("30s15") == 0
+    assert time_input_to_seconds("1:30 15") == 0
+
+
+def test_convert_invalid_time_input_to_zero():
+    """
+    Test input that isn't a duration converts to zero seconds.
+    """
+    assert time_input_to_seconds("pomodoro") == 0
+    assert time_input_to_seconds("pomodoro2") == 0
+    assert time_input_to_seconds("5 fortnights") == 0
+    assert time_input_to_seconds("") == 0
+
+
+def test_convert_malformed_numbers_to_zero():
+    """
+    Test bare numbers next to each other and malformed numbers aren't
+    read as durations.
+    """
+    assert time_input_to_seconds("1.5.5h") == 0
+    assert time_input_to_seconds("1..5h") == 0
+    assert time_input_to_seconds("1.h") == 0
+    assert time_input_to_seconds("10 5") == 0
+    assert time_input_to_seconds("10 5m") == 0
+    assert time_input_to_seconds("1:30.5") == 0
+    assert time_input_to_seconds("1h.5") == 0
+    assert time_input_to_seconds("1h30.5") == 0
+
+
+def test_parser_matches_legacy_parser():
+    """
+    Fuzz the parser against the original for every form it accepted.
+    """
+    rng = random.Random(1234)
+    for _ in range(5000):
+        time_input = random_time_input(rng)
+        assert time_input_to_seconds(time_input) == legacy_time_input_to_seconds(time_input), time_input
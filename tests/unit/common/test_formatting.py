@@ -1,4 +1,4 @@
-from sage.common.formatting import time_as_clock, time_in_english
+from sage.common.formatting import nanoseconds_as_decimal, time_as_clock, time_in_english
 
 
 def test_clock_format():
@@ -27,3 +27,12 @@ def test_format_time_in_english():
     assert time_in_english(10800) == "3 hours"
     assert time_in_english(1501) == "25 minutes 1 second"
     assert time_in_english(3960) == "1 hour 6 minutes"
+
+
+def test_nanoseconds_as_decimal():
+    """
+    Test nanoseconds format as exact decimal seconds.
+    """
+    assert nanoseconds_as_decimal(1_500_000_000) == "1.500000000"
+    assert nanoseconds_as_decimal(5) == "0.000000005"
+    assert nanoseconds_as_decimal(-250_000_000) == "-0.250000000"
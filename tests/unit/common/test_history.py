@@ -0,0 +1,122 @@
+import datetime
+import mmap
+import os
+
+import pytest
+
+from sage.common import history
+from sage.common.history import HEADER, NO_PRESET, RECORD, append_session, summarize
+from sage.common.status import KIND_STOPWATCH, KIND_TIMER
+
+
+NS_PER_HOUR = 3600 * 10**9
+
+
+@pytest.fixture
+def history_file(tmp_path):
+    return str(tmp_path / "sage" / "history")
+
+
+@pytest.fixture
+def sessions(history_file):
+    """
+    A history of four sessions: two pomodoros a day apart, a stopwatch
+    and an unnamed timer.
+    """
+    start_ns = 20_000 * 24 * NS_PER_HOUR
+    for offset_hours, duration_ns, kind, name, count in [
+        (0, 1500 * 10**9, KIND_TIMER, "pomodoro", 0),
+        (1, 90 * 10**9, KIND_STOPWATCH, "", 4),
+        (2, 300 * 10**9, KIND_TIMER, "", 1),
+        (24, 1500 * 10**9, KIND_TIMER, "pomodoro", 0),
+    ]:
+        session_ns = start_ns + offset_hours * NS_PER_HOUR
+        append_session(
+            session_ns, session_ns + duration_ns, duration_ns, 0, kind,
+            name=name, count=count, path=history_file,
+        )
+    return start_ns
+
+
+def _local_date(ns):
+    return datetime.date.fromtimestamp(ns // 10**9)
+
+
+def test_summarize_by_preset(history_file, sessions):
+    """
+    Test sessions are grouped by preset name, each name stored once.
+    """
+    assert summarize("preset", path=history_file) == [
+        (NO_PRESET, 2, 390 * 10**9, 5),
+        ("pomodoro", 2, 3000 * 10**9, 0),
+    ]
+    assert history.read_names(history_file) == {1: "pomodoro"}
+
+
+def test_summarize_by_day_and_week(history_file, sessions):
+    """
+    Test sessions are grouped by the local day and ISO week they
+    started in.
+    """
+    days = {}
+    weeks = {}
+    for offset_hours, duration_ns in [(0, 1500), (1, 90), (2, 300), (24, 1500)]:
+        date = _local_date(sessions + offset_hours * NS_PER_HOUR)
+        days[date.isoformat()] = days.get(date.isoformat(), 0) + duration_ns * 10**9
+        year, week, _ = date.isocalendar()
+        label = f"{year}-W{week:02d}"
+        weeks[label] = weeks.get(label, 0) + duration_ns * 10**9
+
+    by_day = summarize("day", path=history_file)
+    assert {label: duration_ns for label, _, duration_ns, _ in by_day} == days
+    assert sum(sessions for _, sessions, _, _ in by_day) == 4
+
+    by_week = summarize("week", path=history_file)
+    assert {label: duration_ns for label, _, duration_ns, _ in by_week} == weeks
+
+
+def test_partial_record_ignored(history_file, sessions):
+    """
+    Test a record still being appended isn't read.
+    """
+    with open(history_file, "ab") as f:
+        f.write(RECORD.pack(0, 0, 0, 0, 0, 0, 0)[:20])
+    assert len(summarize("preset", path=history_file)) == 2
+
+
+def test_missing_and_invalid_history(history_file):
+    """
+    Test a missing log has no sessions and a file that isn't a history
+    log is rejected.
+    """
+    assert summarize(path=history_file) == []
+
+    append_session(0, 0, 0, 0, KIND_TIMER, path=history_file)
+    with open(history_file, "r+b") as f:
+        f.write(HEADER.pack(b"NOPE", 1))
+    with pytest.raises(ValueError):
+        summarize(path=history_file)
+
+    with pytest.raises(ValueError):
+        summarize("month", path=history_file)
+
+
+@pytest.mark.parametrize("by", history.GROUPINGS)
+def test_numpy_matches_records(history_file, sessions, by):
+    """
+    Test aggregating with numpy gives the same totals as unpacking each
+    record.
+    """
+    numpy = pytest.importorskip("numpy")
+    for offset_hours in range(0, 24 * 30, 5):
+        session_ns = sessions + offset_hours * NS_PER_HOUR
+        append_session(
+            session_ns, session_ns + 60 * 10**9, 60 * 10**9, 0, KIND_TIMER,
+            name=f"preset {offset_hours % 3}", count=offset_hours % 7, path=history_file,
+        )
+
+    names = history.read_names(history_file)
+    records = (os.path.getsize(history_file) - HEADER.size) // RECORD.size
+    with open(history_file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as history_map:
+        expected = history._summarize_records(history_map, records, by, names)
+        assert history._summarize_array(numpy, history_map, records, by, names) == expected
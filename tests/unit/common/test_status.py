@@ -0,0 +1,102 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from sage.common import status
+from sage.common.status import KIND_STOPWATCH, KIND_TIMER, StatusWriter, read_status
+
+
+@pytest.fixture
+def status_file(tmp_path):
+    return str(tmp_path / "sage" / "status")
+
+
+def test_round_trip(status_file):
+    """
+    Test a published timer is read back with its name and counter.
+    """
+    writer = StatusWriter(status_file)
+    writer.publish(KIND_TIMER, False, 1_000, 0, 0, total_seconds=1500, count=3, name="pomodoro")
+
+    snapshot = read_status(status_file)
+    assert snapshot.kind == KIND_TIMER
+    assert snapshot.count == 3
+    assert snapshot.display(now_ns=1_000 + 60 * 10**9) == "pomodoro 00:24:00"
+
+
+def test_display_matches_clock(status_file):
+    """
+    Test paused, completed and stopwatch displays.
+    """
+    writer = StatusWriter(status_file)
+
+    writer.publish(KIND_TIMER, True, 0, 30 * 10**9, 10 * 10**9, total_seconds=60)
+    assert read_status(status_file).display(now_ns=90 * 10**9) == "00:00:40 (paused)"
+
+    writer.publish(KIND_TIMER, False, 0, 0, 0, total_seconds=60)
+    assert read_status(status_file).display(now_ns=60 * 10**9) == "Time's up!"
+
+    writer.publish(KIND_STOPWATCH, False, 0, 0, 0)
+    assert read_status(status_file).display(now_ns=61_500_000_000) == "00:01:01"
+
+
+def test_close_clears_status(status_file):
+    """
+    Test a clock that exits no longer shows as running.
+    """
+    writer = StatusWriter(status_file)
+    writer.publish(KIND_STOPWATCH, False, 0, 0, 0)
+    writer.close()
+    assert read_status(status_file) is None
+
+
+def test_dead_writer_is_ignored(status_file):
+    """
+    Test a status left by a process that died is ignored.
+    """
+    StatusWriter(status_file).publish(KIND_STOPWATCH, False, 0, 0, 0)
+    with patch("sage.common.status.os.kill", side_effect=ProcessLookupError):
+        assert read_status(status_file) is None
+    assert not os.listdir(os.path.dirname(status_file))
+
+
+def test_torn_write_is_not_read(status_file):
+    """
+    Test a reader never returns a body while a write is in progress.
+    """
+    writer = StatusWriter(status_file)
+    writer.publish(KIND_STOPWATCH, False, 0, 0, 0)
+    status.SEQUENCE.pack_into(writer.map, status.SEQUENCE_OFFSET, 7)
+    assert read_status(status_file) is None
+
+
+def test_missing_file(status_file):
+    """
+    Test no status is read when no clock has run.
+    """
+    assert read_status(status_file) is None
+
+
+def test_two_writers(status_file):
+    """
+    Test the most recently started clock is shown, and a clock exiting
+    leaves another running clock's status in place.
+    """
+    first = StatusWriter(status_file)
+    first.publish(KIND_TIMER, False, 1_000, 0, 0, total_seconds=60, name="first")
+    second = StatusWriter(status_file)
+    second.publish(KIND_STOPWATCH, False, 2_000, 0, 0, name="second")
+    assert read_status(status_file).name == "second"
+
+    second.close()
+    assert read_status(status_file).name == "first"
+
+    second = StatusWriter(status_file)
+    second.publish(KIND_STOPWATCH, False, 3_000, 0, 0, name="second")
+    first.close()
+    assert read_status(status_file).name == "second"
+
+    second.close()
+    assert read_status(status_file) is None
+    assert not os.listdir(os.path.dirname(status_file))
@@ -112,3 +112,57 @@ def test_preset_rename_error_conditions(tmp_path):
     with patch("sage.config.presets.get_json_file", return_value=presets_file):
         with pytest.raises(ValueError):
             presets.rename("nothing", "10 minutes")
+
+
+def test_preset_cache_avoids_reparsing(tmp_path):
+    """
+    Test repeated lookups reuse the parsed presets file.
+    """
+    presets_file = tmp_path / "presets.json"
+    with patch("sage.config.presets.get_json_file", return_value=presets_file):
+        presets.load_all()
+        with patch("sage.config.presets.json.load") as json_load:
+            assert presets.get("pomodoro") == {"hours": 0, "minutes": 25, "seconds": 0}
+            assert presets.get("potato") == {"hours": 0, "minutes": 50, "seconds": 0}
+            json_load.assert_not_called()
+
+
+def test_preset_cache_invalidated_by_external_write(tmp_path):
+    """
+    Test the cache picks up changes made to the file by another process.
+    """
+    presets_file = tmp_path / "presets.json"
+    with patch("sage.config.presets.get_json_file", return_value=presets_file):
+        assert presets.get("rice") is None
+
+        presets_file.write_text('{"rice": {"hours": 0, "minutes": 15, "seconds": 0}}')
+        assert presets.get("rice") == {"hours": 0, "minutes": 15, "seconds": 0}
+        assert presets.get("pomodoro") is None
+
+
+def test_save_all_replaces_file_atomically(tmp_path):
+    """
+    Test saving writes a new file in place of the old one and leaves no
+    temporary files behind.
+    """
+    presets_file = tmp_path / "presets.json"
+    with patch("sage.config.presets.get_json_file", return_value=presets_file):
+        presets.load_all()
+        inode = presets_file.stat().st_ino
+
+        presets.create("rice", "15m")
+        assert presets_file.stat().st_ino != inode
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["presets.json", "presets.json.lock"]
+
+
+def test_config_dir_from_environment(tmp_path, monkeypatch):
+    """
+    Test SAGE_CONFIG_DIR chooses where presets are stored, and is read
+    on every call.
+    """
+    monkeypatch.setenv("SAGE_CONFIG_DIR", str(tmp_path / "first"))
+    assert presets.get_json_file() == tmp_path / "first" / "presets.json"
+    assert (tmp_path / "first").is_dir()
+
+    monkeypatch.setenv("SAGE_CONFIG_DIR", str(tmp_path / "second"))
+    assert presets.get_json_file() == tmp_path / "second" / "presets.json"
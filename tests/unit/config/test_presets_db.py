@@ -0,0 +1,86 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from sage.config import presets
+
+
+@pytest.fixture
+def sqlite_store(tmp_path, monkeypatch):
+    """
+    Store presets in SQLite under a temporary config directory.
+    """
+    monkeypatch.setenv("SAGE_PRESET_STORE", "sqlite")
+    presets_file = tmp_path / "presets.json"
+    with patch("sage.config.presets.get_json_file", return_value=presets_file):
+        yield presets_file
+
+
+def test_sqlite_store_creates_defaults(sqlite_store):
+    """
+    Test a new SQLite store is seeded with the default presets.
+    """
+    assert presets.get("pomodoro") == {"hours": 0, "minutes": 25, "seconds": 0}
+    assert sqlite_store.with_name("presets.db").exists()
+
+
+def test_sqlite_store_migrates_json(sqlite_store):
+    """
+    Test existing JSON presets are migrated into the SQLite store once.
+    """
+    sqlite_store.write_text(json.dumps({"rice": {"hours": 0, "minutes": 15, "seconds": 0}}))
+
+    assert presets.load_all() == {"rice": {"hours": 0, "minutes": 15, "seconds": 0}}
+
+    sqlite_store.write_text(json.dumps({}))
+    assert presets.get("rice") == {"hours": 0, "minutes": 15, "seconds": 0}
+
+
+def test_sqlite_store_mutations(sqlite_store):
+    """
+    Test create, update, rename and delete against the SQLite store.
+    """
+    assert presets.create("workout", "1hr 30m") == {"hours": 1, "minutes": 30, "seconds": 0}
+    assert presets.update("workout", "45m") == {"hours": 0, "minutes": 45, "seconds": 0}
+    assert presets.rename("workout", "yoga") == {"hours": 0, "minutes": 45, "seconds": 0}
+    assert presets.get("workout") is None
+
+    presets.delete("yoga")
+    assert presets.get("yoga") is None
+
+
+def test_sqlite_store_error_conditions(sqlite_store):
+    """
+    Test the SQLite store raises the same errors as the JSON store.
+    """
+    with pytest.raises(ValueError, match="already a preset"):
+        presets.create("pomodoro", "20m")
+    with pytest.raises(ValueError, match="cannot exceed 24 hours"):
+        presets.create("bigones", "25 hours")
+    with pytest.raises(ValueError, match="not a preset"):
+        presets.delete("nothing")
+    with pytest.raises(ValueError, match="not a preset"):
+        presets.rename("nothing", "something")
+    with pytest.raises(ValueError, match="not a preset"):
+        presets.update("nothing", "10m")
+
+
+def test_sqlite_store_iterates_sorted(sqlite_store):
+    """
+    Test presets stream in name order.
+    """
+    names = [name for name, _ in presets.iter_sorted()]
+    assert names == sorted(presets.load_all())
+    assert presets.max_name_length() == len("johncage")
+
+
+@pytest.mark.parametrize("store", ["json", "sqlite"])
+def test_rename_to_same_name_keeps_preset(store, tmp_path, monkeypatch):
+    """
+    Test both stores keep a preset renamed to its own name.
+    """
+    monkeypatch.setenv("SAGE_PRESET_STORE", store)
+    with patch("sage.config.presets.get_json_file", return_value=tmp_path / "presets.json"):
+        assert presets.rename("pomodoro", "pomodoro") == {"hours": 0, "minutes": 25, "seconds": 0}
+        assert presets.get("pomodoro") == {"hours": 0, "minutes": 25, "seconds": 0}
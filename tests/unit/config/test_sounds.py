@@ -7,3 +7,49 @@ def test_sound_exists():
     """
     assert sounds.file_exists("timesup.mp3")
     assert not sounds.file_exists("nothing.mp3")
+
+
+def test_sound_player_fires_armed_player(tmp_path, monkeypatch):
+    """
+    Test an armed stand-in player runs when fired and latency is measured.
+    """
+    output = tmp_path / "played"
+    monkeypatch.setenv("SAGE_SOUND_PLAYER", f'sh -c \'echo "$1" > {output}\' stand-in')
+
+    player = sounds.SoundPlayer("timesup.mp3")
+    assert player.available
+    assert player.arm()
+    assert not output.exists()
+
+    player.fire(lateness_ns=1_000)
+    player.process.wait(timeout=5)
+    assert output.read_text().strip() == str(player.path)
+    assert player.latency_ns >= 1_000
+
+
+def test_sound_player_cancel(tmp_path, monkeypatch):
+    """
+    Test cancelling an armed player stops it without playing.
+    """
+    output = tmp_path / "played"
+    monkeypatch.setenv("SAGE_SOUND_PLAYER", f"sh -c 'touch {output}' stand-in")
+
+    player = sounds.SoundPlayer("timesup.mp3")
+    assert player.arm()
+    player.cancel()
+
+    assert player.process.returncode is not None
+    assert not output.exists()
+
+
+def test_sound_player_missing_file(monkeypatch):
+    """
+    Test a missing sound file is reported and never armed.
+    """
+    monkeypatch.setenv("SAGE_SOUND_PLAYER", "true")
+
+    player = sounds.SoundPlayer("nothing.mp3")
+    assert not player.available
+    assert not player.arm()
+    player.fire()
+    assert player.latency_ns is None
@@ -0,0 +1,190 @@
+from unittest.mock import patch
+
+import pytest
+
+from sage.daemon.server import DONE_RETENTION_NS, MAX_PENDING_BYTES, Connection, Daemon
+
+
+@pytest.fixture
+def clock():
+    with patch("sage.daemon.server.time.perf_counter_ns") as perf_counter_ns:
+        perf_counter_ns.return_value = 0
+        yield perf_counter_ns
+
+
+@pytest.fixture
+def daemon(tmp_path, monkeypatch, clock):
+    # timers look up presets, which mustn't touch the user's own.
+    monkeypatch.setenv("SAGE_CONFIG_DIR", str(tmp_path / "config"))
+    return Daemon(tmp_path / "daemon.sock")
+
+
+def test_start_reuses_timer_validation(daemon):
+    """
+    Test timers are validated like `sage timer` before starting.
+    """
+    assert daemon.handle({"cmd": "start", "input": "0s"}) == {
+        "ok": False,
+        "error": "Duration must be greater than 0 seconds.",
+    }
+    assert daemon.handle({"cmd": "start", "input": "90s"})["job"]["seconds"] == 90
+
+
+def test_expiry_is_scheduled_on_the_heap(daemon, clock):
+    """
+    Test a running timer is expired once its deadline passes.
+    """
+    job_id = daemon.handle({"cmd": "start", "input": "2s", "quiet": True})["job"]["id"]
+    assert daemon._get_timeout() == 2
+
+    clock.return_value = 2_000_000_000
+    daemon._run_due()
+    assert daemon.handle({"cmd": "list"})["jobs"][0] == {
+        "id": job_id, "kind": "timer", "label": "2s", "state": "done", "seconds": 0,
+    }
+    assert daemon._get_timeout() is None
+
+
+def test_paused_timer_does_not_expire(daemon, clock):
+    """
+    Test pausing shifts a timer's expiry by the time spent paused.
+    """
+    job_id = daemon.handle({"cmd": "start", "input": "2s", "quiet": True})["job"]["id"]
+
+    clock.return_value = 500_000_000
+    daemon.handle({"cmd": "pause", "id": job_id})
+    clock.return_value = 5_000_000_000
+    daemon._run_due()
+    daemon.handle({"cmd": "resume", "id": job_id})
+    daemon._run_due()
+
+    assert daemon.jobs[job_id].done is False
+    assert daemon._get_timeout() == pytest.approx(1.5)
+
+
+def test_done_timer_forgotten_once_reported(daemon, clock):
+    """
+    Test a completed timer is listed once and then forgotten.
+    """
+    daemon.handle({"cmd": "start", "input": "2s", "quiet": True})
+    clock.return_value = 2_000_000_000
+    daemon._run_due()
+
+    assert [job["state"] for job in daemon.handle({"cmd": "list"})["jobs"]] == ["done"]
+    assert daemon.handle({"cmd": "list"})["jobs"] == []
+
+
+def test_unreported_done_timer_forgotten(daemon, clock):
+    """
+    Test a completed timer nobody asks about is forgotten after the
+    retention period.
+    """
+    daemon.handle({"cmd": "start", "input": "2s", "quiet": True})
+    clock.return_value = 2_000_000_000
+    daemon._run_due()
+    assert len(daemon.jobs) == 1
+
+    clock.return_value += DONE_RETENTION_NS
+    daemon._run_due()
+    assert daemon.jobs == {}
+    assert daemon._get_timeout() is None
+
+
+def test_sound_armed_when_timer_starts(daemon, clock):
+    """
+    Test a timer's sound player is armed when it starts and fired when
+    it expires, and stopped if the timer is cancelled.
+    """
+    with patch("sage.daemon.server.sounds.SoundPlayer") as sound_player:
+        daemon.handle({"cmd": "start", "input": "2s"})
+        cancelled_id = daemon.handle({"cmd": "start", "input": "5s"})["job"]["id"]
+        daemon.handle({"cmd": "start", "input": "2s", "quiet": True})
+
+    player = sound_player.return_value
+    assert sound_player.call_count == 2
+    assert player.arm.call_count == 2
+
+    daemon.handle({"cmd": "cancel", "id": cancelled_id})
+    player.cancel.assert_called_once()
+
+    clock.return_value = 2_000_000_000
+    daemon._run_due()
+    player.fire.assert_called_once_with(lateness_ns=0)
+
+
+def test_cancel_forgets_job(daemon):
+    """
+    Test cancelled jobs are removed and unknown ids are rejected.
+    """
+    job_id = daemon.handle({"cmd": "stopwatch", "label": "lab"})["job"]["id"]
+    assert daemon.handle({"cmd": "cancel", "id": job_id})["ok"]
+    assert daemon.handle({"cmd": "cancel", "id": job_id}) == {
+        "ok": False,
+        "error": f"No timer with id {job_id}.",
+    }
+
+
+def test_unknown_command(daemon):
+    """
+    Test unknown commands are rejected.
+    """
+    assert daemon.handle({"cmd": "explode"})["ok"] is False
+
+
+def test_malformed_requests_are_rejected(daemon):
+    """
+    Test valid JSON with fields of the wrong type is answered with an
+    error, without stopping the daemon or touching its jobs.
+    """
+    job_id = daemon.handle({"cmd": "stopwatch"})["job"]["id"]
+
+    for message in [
+        {"cmd": ["pause"]},
+        {"cmd": {"name": "list"}},
+        {"cmd": "pause", "id": [job_id]},
+        {"cmd": "pause", "id": {"id": job_id}},
+        {"cmd": "pause", "id": str(job_id)},
+        {"cmd": "cancel", "id": True},
+        {"cmd": "attach"},
+    ]:
+        assert daemon.handle(message)["ok"] is False
+
+    assert list(daemon.jobs) == [job_id]
+    assert daemon.jobs[job_id].paused is False
+
+
+def test_unexpected_errors_are_answered(daemon):
+    """
+    Test a request that fails unexpectedly is answered with an error.
+    """
+    with patch.object(daemon, "_list", side_effect=RuntimeError("boom")):
+        daemon.commands["list"] = daemon._list
+        assert daemon.handle({"cmd": "list"}) == {"ok": False, "error": "Request failed: boom"}
+
+
+def test_client_that_stops_reading_is_disconnected(daemon):
+    """
+    Test output queued for a client is capped.
+    """
+    connection = Connection(None)
+    connection.outbuf += bytes(MAX_PENDING_BYTES)
+
+    with patch.object(daemon, "_disconnect") as disconnect:
+        daemon._send(connection, b"{}\n")
+
+    disconnect.assert_called_once_with(connection)
+    assert len(connection.outbuf) == MAX_PENDING_BYTES
+
+
+def test_thousands_of_timers(daemon, clock):
+    """
+    Test each wakeup only expires the timers that are due.
+    """
+    for seconds in range(1, 5001):
+        daemon.handle({"cmd": "start", "input": f"{seconds}s", "quiet": True})
+
+    clock.return_value = 10_000_000_000
+    daemon._run_due()
+    done = [job for job in daemon.handle({"cmd": "list"})["jobs"] if job["state"] == "done"]
+    assert len(done) == 10
+    assert daemon._get_timeout() == 1